@@ -36,6 +36,71 @@
 #         of Dell PowerVault hardware, with specific Management
 #         Controller configurations and code levels; it has not been
 #         tested against other similar hardware
+#   3) All requests to a Management Controller share one HTTPS
+#         session (so one TLS handshake, kept alive), and the reports
+#         are requested concurrently, at most MAX_REPORT_WORKERS_ at a
+#         time (the embedded controller is easily overwhelmed); they
+#         are still displayed in REPORT_LIST_ order
+#   4) -s can be given more than once, or replaced by --all-sites (every
+#         site in SITE_INFO_); the sites are all queried at the same time
+#         (with one password, which must then be the same on all of them)
+#         and their results displayed site by site, in the order given;
+#         a site that has not answered within --site-timeout seconds is
+#         reported as failed, without holding up the others, and any
+#         failed site makes the exit code 1
+#   5) The session key from each login is kept (one file per site,
+#         readable only by the invoking user) in SESSION_CACHE_DIR_ in
+#         the home directory; the next run checks it with a cheap
+#         request (PROBE_COMMAND_) and only logs in again if the
+#         Management Controller no longer accepts it; a report refused
+#         with HTTP 401 (the key expired during the run) also causes a
+#         new login, and the report is requested again
+#   6) --poll <SECONDS> turns this into a hardware health monitor: it
+#         keeps the session to each site open and, every <SECONDS>,
+#         requests the json of POLL_REPORT_LIST_ (or the reports
+#         chosen with --reports, or -c to -t); each component record (see 7,
+#         limited to --fields, if given) is hashed, and only the records
+#         that were added, changed (status or readings) or removed since
+#         the previous poll are written, one json object per line
+#         (NDJSON), for example
+#           {"time":"...","site":"HQ","report":"sensor-status",
+#            "id":"sensor_temp_ctrl_A.1","change":"changed","record":{...}}
+#         the first poll writes every record (as "added"); a site that
+#         stops answering gives one "error" event, and a "recovered"
+#         one when it answers again; stop it with Control-C or SIGTERM
+#   7) --format csv (or ndjson) outputs, instead of the reports, one
+#         normalized record per component (the classes CONTROLLER_,
+#         ENCLOSURE_, FAN_, PSU_ and SENSOR_ define the fields kept from
+#         the vendor records), with the site and kind of each; --fields
+#         chooses which fields, and their order; the json answers are
+#         decoded as they arrive, one vendor record at a time, rather
+#         than read whole
+#   8) --reports chooses any combination of the reports in REPORT_TYPES_
+#         (which adds disks, volumes, pools, volume-statistics and
+#         controller-statistics to the original five), all requested
+#         at the same time over the one session; -c, -e, -f, -p and -t
+#         are kept as shorthands for a single report
+#   9) --delta <SECONDS> requests volume-statistics and
+#         controller-statistics twice, <SECONDS> apart, and shows the
+#         read/write IOPS and MB/s of each volume and controller over
+#         that time, worked out from the counters (a counter that went
+#         backwards, because the statistics were reset, gives -); the
+#         response times are the controller's own averages, and only
+#         some firmware reports them
+#  10) --record <SECONDS> samples the same two reports every <SECONDS>
+#         (like --poll, one open session per site) and appends each
+#         volume and controller as one fixed-width record
+#         (SERIES_RECORD_, 92 bytes: time, kind, name, counters and
+#         response times) to a file per site per day in SERIES_DIR_;
+#         files older than SERIES_KEEP_DAYS_ are removed when a new
+#         day's file is started
+#  11) --query <START>[,<END>] reads those files back (no password, the
+#         Storage Arrays are not contacted) and shows the percentiles
+#         (QUERY_PERCENTILES_) of the IOPS and MB/s between consecutive
+#         samples, and of the response times, of each volume and
+#         controller; only the files of the days in the window are
+#         opened, they are memory-mapped, and the start of the window
+#         is found by bisection, so only the records in it are read
 #
 # KNOWN BUGS:
 #   0) Does not validate the contents of PW_FILENAME_; just uses it
@@ -51,10 +116,17 @@
 #   0) Improve logging
 #   1) Re-factor to better-use functions
 #######################################################################
-TOOL_VERSION_='1.00'
+TOOL_VERSION_='1.07'
 #######################################################################
 # Change Log (Reverse Chronological Order)
 # Who When______ What__________________________________________________
+# dxb 2026-10-17 --record time-series store, --query percentiles (v1.07)
+# dxb 2026-10-17 --reports (disks, volumes, pools, statistics), --delta (v1.06)
+# dxb 2026-10-17 --format csv|ndjson normalized records, --fields (v1.05)
+# dxb 2026-10-17 --poll change detection, NDJSON output (v1.04)
+# dxb 2026-10-17 Reuse session keys between runs; re-login on 401 (v1.03)
+# dxb 2026-10-17 Several -s, or --all-sites, queried concurrently (v1.02)
+# dxb 2026-10-17 Pooled HTTPS session, concurrent reports (v1.01)
 # dxb 2020-06-04 Initial creation (v1.00)
 #######################################################################
 # Module Imports #
@@ -74,10 +146,28 @@ import requests
 #       certificate verification
 from requests.packages.urllib3.exceptions import InsecureRequestWarning
 requests.packages.urllib3.disable_warnings(InsecureRequestWarning)
+# Keep-alive connection pool for the HTTPS session
+from requests.adapters import HTTPAdapter
+# Worker threads for requesting reports (and sites) concurrently
+import concurrent.futures
+import threading
+# Per-site deadlines
+import time
+# Stopping the poller (--poll) cleanly on SIGTERM
+import signal
 # JSON interpretation
 import json
 # Hashing for constructing authentication string
 import hashlib
+# Fixed-width time-series records (--record), read back memory-mapped
+#   (--query)
+import struct
+import mmap
+import datetime
+# Decoding (--format) reports as they arrive, and writing them as CSV
+import codecs
+import re
+import csv
 
 # Screen control and Colors for text output
 # Reference example --> ANSI_.BOLD_TEXT_
@@ -128,6 +218,1027 @@ THIS_TOOL_=os.path.realpath(__file__)
 #   in the IP address for the Management Controller
 # The strings are the corresponding values for SITE_NAME_
 SITE_INFO_={11:'DEV',12:'TST',13:'PRD',14:'HQ',15:'DR',16:'BACKUP1',17:'BACKUP2'}
+# Maximum number of reports requested from a Management Controller at
+#   the same time (and connections kept open to it)
+MAX_REPORT_WORKERS_=2
+# Directory (in the home directory of the invoking user) where the
+#   session key of each site is kept
+SESSION_CACHE_DIR_='.dell-query-array.sessions'
+# Inexpensive command used to check that a saved session key is still
+#   accepted
+PROBE_COMMAND_='versions'
+# Seconds to wait for a Management Controller to accept a connection,
+#   and for each site to finish (override with --site-timeout)
+CONNECT_TIMEOUT_=10
+SITE_TIMEOUT_=60
+# Reports requested (as json) by --poll; -f, -p or -t limit it to one
+POLL_REPORT_LIST_=['sensor-status','fan-modules','power-supplies']
+# Size of the pieces in which a parsed (--format) report is read and
+#   decoded
+STREAM_CHUNK_SIZE_=65536
+
+# Normalized component records (for --format and --poll)
+# Each class keeps only the fields a monitor or a report needs out of
+#   the verbose record the Management Controller sends; FIELDS_ pairs
+#   each field with the key it comes from in the vendor record, and
+#   LIST_NAME_ is the name of the list holding such records in a json
+#   answer
+class COMPONENT_:
+  '''
+  Base class of the normalized component records; builds the record
+  from a vendor record (a Dictionary) using FIELDS_
+  '''
+  __slots__=()
+  KIND_=''
+  LIST_NAME_=''
+  FIELDS_=()
+  def __init__(self,RECORD_):
+    for FIELD_NAME_,VENDOR_KEY_ in self.FIELDS_:
+      setattr(self,FIELD_NAME_,RECORD_.get(VENDOR_KEY_))
+  def as_dict(self,FIELD_LIST_=None):
+    '''
+    Returns the fields in FIELD_LIST_ (default is all of them) that
+    this kind of record has, as a Dictionary
+    '''
+    if FIELD_LIST_ is None:
+      FIELD_LIST_=self.__slots__
+    return {FIELD_NAME_: getattr(self,FIELD_NAME_)
+      for FIELD_NAME_ in FIELD_LIST_ if FIELD_NAME_ in self.__slots__}
+
+class CONTROLLER_(COMPONENT_):
+  '''
+  A Controller, from the controllers report
+  '''
+  __slots__=('id','controller','status','health','health_reason',
+    'serial','firmware','ip')
+  KIND_='controller'
+  LIST_NAME_='controllers'
+  FIELDS_=(('id','durable-id'),('controller','controller-id'),
+    ('status','status'),('health','health'),('health_reason','health-reason'),
+    ('serial','serial-number'),('firmware','sc-fw'),('ip','ip-address'))
+
+class ENCLOSURE_(COMPONENT_):
+  '''
+  An Enclosure, from the enclosures report
+  '''
+  __slots__=('id','enclosure','status','health','health_reason','model',
+    'serial','disks')
+  KIND_='enclosure'
+  LIST_NAME_='enclosures'
+  FIELDS_=(('id','durable-id'),('enclosure','enclosure-id'),
+    ('status','status'),('health','health'),('health_reason','health-reason'),
+    ('model','model'),('serial','midplane-serial-number'),
+    ('disks','number-of-disks'))
+
+class FAN_(COMPONENT_):
+  '''
+  A Fan Module, from the fan-modules report; speed is that of its
+  slowest fan (in RPM), or None if it does not list any
+  '''
+  __slots__=('id','name','location','status','health','health_reason',
+    'speed')
+  KIND_='fan'
+  LIST_NAME_='fan-modules'
+  FIELDS_=(('id','durable-id'),('name','name'),('location','location'),
+    ('status','status'),('health','health'),('health_reason','health-reason'))
+  def __init__(self,RECORD_):
+    super().__init__(RECORD_)
+    FAN_SPEEDS_=[THIS_FAN_['speed'] for THIS_FAN_ in RECORD_.get('fan',[])
+      if isinstance(THIS_FAN_,dict) and isinstance(THIS_FAN_.get('speed'),int)]
+    self.speed=min(FAN_SPEEDS_) if FAN_SPEEDS_ else RECORD_.get('speed')
+
+class PSU_(COMPONENT_):
+  '''
+  A Power Supply, from the power-supplies report; the voltages and
+  currents are as reported (hundredths of a volt or ampere)
+  '''
+  __slots__=('id','name','location','status','health','health_reason',
+    'dc12v','dc5v','dc12i','dc5i')
+  KIND_='psu'
+  LIST_NAME_='power-supplies'
+  FIELDS_=(('id','durable-id'),('name','name'),('location','location'),
+    ('status','status'),('health','health'),('health_reason','health-reason'),
+    ('dc12v','dc12v'),('dc5v','dc5v'),('dc12i','dc12i'),('dc5i','dc5i'))
+
+class SENSOR_(COMPONENT_):
+  '''
+  A Temperature, Voltage, Current or Charge Capacity Sensor, from the
+  sensor-status report; reading and unit are the number and the unit
+  split out of value (such as "43 C"), when it has a number
+  '''
+  __slots__=('id','name','type','controller','enclosure','status','value',
+    'reading','unit')
+  KIND_='sensor'
+  LIST_NAME_='sensors'
+  FIELDS_=(('id','durable-id'),('name','sensor-name'),('type','sensor-type'),
+    ('controller','controller-id'),('enclosure','enclosure-id'),
+    ('status','status'),('value','value'))
+  def __init__(self,RECORD_):
+    super().__init__(RECORD_)
+    self.reading=None
+    self.unit=None
+    if isinstance(self.value,str):
+      (READING_TEXT_,_,self.unit)=self.value.strip().partition(' ')
+      try:
+        self.reading=float(READING_TEXT_)
+      except ValueError:
+        self.unit=None
+    elif isinstance(self.value,(int,float)):
+      self.reading=float(self.value)
+    self.unit=self.unit or None
+
+class DISK_(COMPONENT_):
+  '''
+  A Disk Drive, from the disks report
+  '''
+  __slots__=('id','location','status','health','health_reason','model',
+    'serial','size','usage','pool')
+  KIND_='disk'
+  LIST_NAME_='drives'
+  FIELDS_=(('id','durable-id'),('location','location'),('status','status'),
+    ('health','health'),('health_reason','health-reason'),('model','model'),
+    ('serial','serial-number'),('size','size'),('usage','usage'),
+    ('pool','storage-pool-name'))
+
+class VOLUME_(COMPONENT_):
+  '''
+  A Volume, from the volumes report
+  '''
+  __slots__=('id','name','health','health_reason','serial','size',
+    'allocated','pool')
+  KIND_='volume'
+  LIST_NAME_='volumes'
+  FIELDS_=(('id','durable-id'),('name','volume-name'),('health','health'),
+    ('health_reason','health-reason'),('serial','serial-number'),
+    ('size','size'),('allocated','allocated-size'),
+    ('pool','storage-pool-name'))
+
+class POOL_(COMPONENT_):
+  '''
+  A (virtual) Storage Pool, from the pools report
+  '''
+  __slots__=('id','name','health','health_reason','serial','size',
+    'available')
+  KIND_='pool'
+  LIST_NAME_='pools'
+  FIELDS_=(('id','durable-id'),('name','name'),('health','health'),
+    ('health_reason','health-reason'),('serial','serial-number'),
+    ('size','total-size'),('available','total-avail'))
+
+# The counters (since the statistics were last reset) common to the
+#   volume-statistics and controller-statistics reports; the response
+#   times (in microseconds) are only there in some firmware
+STATISTICS_FIELDS_=(('iops','iops'),('bytes_per_second','bytes-per-second-numeric'),
+  ('reads','number-of-reads'),('writes','number-of-writes'),
+  ('data_read','data-read-numeric'),('data_written','data-written-numeric'),
+  ('data_transferred','data-transferred-numeric'),
+  ('avg_rsp_time','avg-rsp-time'),('avg_read_rsp_time','avg-read-rsp-time'),
+  ('avg_write_rsp_time','avg-write-rsp-time'))
+
+class VOLUME_STATISTICS_(COMPONENT_):
+  '''
+  The I/O counters of a Volume, from the volume-statistics report
+  '''
+  FIELDS_=(('id','durable-id'),('name','volume-name'))+STATISTICS_FIELDS_
+  __slots__=tuple(FIELD_NAME_ for FIELD_NAME_,VENDOR_KEY_ in FIELDS_)
+  KIND_='volume-statistics'
+  LIST_NAME_='volume-statistics'
+
+class CONTROLLER_STATISTICS_(COMPONENT_):
+  '''
+  The I/O counters of a Controller, from the controller-statistics
+  report
+  '''
+  FIELDS_=((('id','durable-id'),)+STATISTICS_FIELDS_+
+    (('cpu_load','cpu-load'),('write_cache_used','write-cache-used')))
+  __slots__=tuple(FIELD_NAME_ for FIELD_NAME_,VENDOR_KEY_ in FIELDS_)
+  KIND_='controller-statistics'
+  LIST_NAME_='controller-statistics'
+
+# The class of the records in each report (which are all the reports
+#   --reports accepts), and in each json list
+REPORT_TYPES_={'controllers':CONTROLLER_,'enclosures':ENCLOSURE_,
+  'fan-modules':FAN_,'power-supplies':PSU_,'sensor-status':SENSOR_,
+  'disks':DISK_,'volumes':VOLUME_,'pools':POOL_,
+  'volume-statistics':VOLUME_STATISTICS_,
+  'controller-statistics':CONTROLLER_STATISTICS_}
+# Reports whose counters --delta turns into rates
+STATISTICS_REPORT_LIST_=['volume-statistics','controller-statistics']
+# The fields of the rates from --delta (IOPS, MB/s and microseconds)
+DELTA_FIELDS_=['site','kind','id','name','read_iops','write_iops','iops',
+  'read_mbps','write_mbps','mbps','latency_us','read_latency_us',
+  'write_latency_us']
+# Directory (in the home directory of the invoking user) where --record
+#   keeps one file per site per day, and how many days of them to keep
+SERIES_DIR_='.dell-query-array.series'
+SERIES_KEEP_DAYS_=31
+# Each volume or controller in each sample is one fixed-width record:
+#   the time, the kind (index in SERIES_KINDS_), the name (or id, cut
+#   to SERIES_NAME_SIZE_ bytes), the counters, and the response times;
+#   a value the firmware does not report is stored as MISSING_COUNTER_
+#   (or MISSING_TIME_)
+SERIES_KINDS_=['volume-statistics','controller-statistics']
+SERIES_NAME_SIZE_=31
+SERIES_COUNTERS_=('reads','writes','data_read','data_written','data_transferred')
+SERIES_TIMES_=('avg_rsp_time','avg_read_rsp_time','avg_write_rsp_time')
+SERIES_FIELDS_=('time','kind','name')+SERIES_COUNTERS_+SERIES_TIMES_
+SERIES_RECORD_=struct.Struct('<dB'+str(SERIES_NAME_SIZE_)+'s'+
+  str(len(SERIES_COUNTERS_))+'Q'+str(len(SERIES_TIMES_))+'I')
+MISSING_COUNTER_=2**64-1
+MISSING_TIME_=2**32-1
+# Percentiles --query works out, and the fields of its output
+QUERY_PERCENTILES_=(50,90,95,99)
+QUERY_FIELDS_=['site','kind','name','samples']+[RATE_NAME_+'_p'+str(PERCENT_)
+  for RATE_NAME_ in ('iops','mbps','latency_us') for PERCENT_ in QUERY_PERCENTILES_]
+# Units of the times ago --query accepts
+TIME_UNITS_={'s':1,'m':60,'h':3600,'d':86400}
+LIST_TYPES_={THIS_TYPE_.LIST_NAME_: THIS_TYPE_
+  for THIS_TYPE_ in REPORT_TYPES_.values()}
+# Fields --fields accepts, in the order --format shows them by default;
+#   site and kind are added to every record
+RECORD_FIELDS_=['site','kind']
+for THIS_TYPE_ in REPORT_TYPES_.values():
+  RECORD_FIELDS_+=[FIELD_NAME_ for FIELD_NAME_ in THIS_TYPE_.__slots__
+    if FIELD_NAME_ not in RECORD_FIELDS_]
+
+def array_session_func_():
+    """
+    Creates and returns a requests Session for talking to a Management
+    Controller; connections are kept alive and reused, and at most
+    MAX_REPORT_WORKERS_ of them are kept open
+
+    The Management Controllers have self-signed certificates, so each
+    request must still pass verify=False (a Session-wide setting is
+    overridden by REQUESTS_CA_BUNDLE in the environment)
+    """
+    SESSION_=requests.Session()
+    SESSION_.mount('https://',HTTPAdapter(pool_connections=1,
+        pool_maxsize=MAX_REPORT_WORKERS_,pool_block=True))
+    return SESSION_
+
+def request_timeout_func_(DEADLINE_):
+    """
+    Returns the (connect, read) timeout of a request that must be
+    answered by DEADLINE_ (a time.monotonic() value); raises
+    TimeoutError if DEADLINE_ has already passed
+    """
+    REMAINING_=DEADLINE_-time.monotonic()
+    if REMAINING_ <= 0:
+        raise TimeoutError('no answer in the time allowed for the site')
+    return (min(CONNECT_TIMEOUT_,REMAINING_),REMAINING_)
+
+def fetch_report_func_(SESSION_,TARGET_URL_,THIS_REPORT_,DATATYPE_,DEADLINE_,KEY_STATE_,
+        PARSE_=False):
+    """
+    Requests one report from a Management Controller and returns the
+    body of the response (as bytes), or with PARSE_ (and the json
+    DATATYPE_) the list of component records decoded from it as it
+    arrives; if the session key is refused (HTTP 401), a new one is
+    obtained and the report requested again
+
+    KEY_STATE_ is the Dictionary from open_site_func_ holding the
+    current session key, and the function that replaces it; no request
+    waits past DEADLINE_ (see request_timeout_func_)
+
+    Runs in a worker thread, so it does not print anything
+    """
+    for THIS_TRY_ in (1,2):
+        SESSION_KEY_=KEY_STATE_['key']
+        with SESSION_.get(TARGET_URL_+'/api/show/'+THIS_REPORT_,
+                headers={'sessionKey': SESSION_KEY_, 'datatype': DATATYPE_},
+                verify=False,timeout=request_timeout_func_(DEADLINE_),
+                stream=PARSE_) as QUERY_:
+            if QUERY_.status_code != 401 or THIS_TRY_ == 2:
+                if PARSE_:
+                    return parse_report_func_(QUERY_.iter_content(STREAM_CHUNK_SIZE_))
+                return QUERY_.content
+        KEY_STATE_['renew'](SESSION_KEY_)
+
+def stream_records_func_(CHUNKS_):
+    """
+    Decodes a json answer from a Management Controller (an object whose
+    values are mostly lists of records) from an iterable of pieces of
+    it (bytes), and yields a tuple of the name of the list and the
+    record, for each record in each list, as soon as it is complete
+
+    Only one record is decoded at a time, so a large answer is never
+    held in memory as a whole, as text or as nested Dictionaries;
+    values that are not lists are skipped. Raises ValueError if the
+    answer is not valid json
+    """
+    DECODER_=json.JSONDecoder()
+    # Whitespace json allows between values
+    WHITESPACE_=re.compile(r'[ \t\n\r]*')
+    TEXT_DECODER_=codecs.getincrementaldecoder('UTF-8')()
+    CHUNK_ITER_=iter(CHUNKS_)
+    # The text received but not yet decoded, and the position in it
+    STATE_={'text': '', 'pos': 0}
+    def more_func_():
+        STATE_['text']=STATE_['text'][STATE_['pos']:]
+        STATE_['pos']=0
+        for THIS_CHUNK_ in CHUNK_ITER_:
+            if THIS_CHUNK_:
+                STATE_['text']+=TEXT_DECODER_.decode(THIS_CHUNK_)
+                return True
+        return False
+    def next_char_func_():
+        # The next character that is not whitespace (not consumed), or ''
+        #   at the end of the answer
+        while True:
+            STATE_['pos']=WHITESPACE_.match(STATE_['text'],STATE_['pos']).end()
+            if STATE_['pos'] < len(STATE_['text']):
+                return STATE_['text'][STATE_['pos']]
+            if not more_func_():
+                return ''
+    def expect_func_(EXPECTED_):
+        if next_char_func_() != EXPECTED_:
+            raise ValueError('json answer: expected '+repr(EXPECTED_)+' at "'+
+                STATE_['text'][STATE_['pos']:STATE_['pos']+20]+'"')
+        STATE_['pos']+=1
+    def decode_func_():
+        # Decodes the value at the current position, reading more of the
+        #   answer until it is complete (a number at the very end of what
+        #   was received might continue in the next piece)
+        next_char_func_()
+        while True:
+            try:
+                (VALUE_,VALUE_END_)=DECODER_.raw_decode(STATE_['text'],STATE_['pos'])
+            except json.JSONDecodeError:
+                if not more_func_():
+                    raise
+                continue
+            if VALUE_END_ == len(STATE_['text']) and more_func_():
+                continue
+            STATE_['pos']=VALUE_END_
+            return VALUE_
+
+    expect_func_('{')
+    while next_char_func_() != '}':
+        if next_char_func_() == ',':
+            STATE_['pos']+=1
+        LIST_NAME_=decode_func_()
+        expect_func_(':')
+        if next_char_func_() != '[':
+            decode_func_()
+            continue
+        STATE_['pos']+=1
+        while next_char_func_() != ']':
+            if next_char_func_() == ',':
+                STATE_['pos']+=1
+            yield (LIST_NAME_,decode_func_())
+        STATE_['pos']+=1
+
+def parse_report_func_(CHUNKS_):
+    """
+    Returns the list of component records (instances of the classes
+    in LIST_TYPES_) in a json answer from a Management Controller,
+    given as an iterable of pieces of it (bytes); records of any other
+    kind are skipped
+
+    Raises RuntimeError if the Management Controller says the command
+    failed
+    """
+    RECORDS_=[]
+    for LIST_NAME_,THIS_RECORD_ in stream_records_func_(CHUNKS_):
+        if not isinstance(THIS_RECORD_,dict):
+            continue
+        if LIST_NAME_ == 'status':
+            if THIS_RECORD_.get('response-type') == 'Error':
+                raise RuntimeError('command failed: '+
+                    str(THIS_RECORD_.get('response')))
+        elif LIST_NAME_ in LIST_TYPES_:
+            RECORDS_.append(LIST_TYPES_[LIST_NAME_](THIS_RECORD_))
+    return RECORDS_
+
+def record_row_func_(SITE_NAME_,COMPONENT_RECORD_,FIELD_LIST_):
+    """
+    Returns a Dictionary of the fields in FIELD_LIST_ of a component
+    record (those its kind has), with its site and kind
+    """
+    ROW_=COMPONENT_RECORD_.as_dict(FIELD_LIST_)
+    if 'kind' in FIELD_LIST_:
+        ROW_['kind']=COMPONENT_RECORD_.KIND_
+    if 'site' in FIELD_LIST_:
+        ROW_['site']=SITE_NAME_
+    return {FIELD_NAME_: ROW_[FIELD_NAME_] for FIELD_NAME_ in FIELD_LIST_
+        if FIELD_NAME_ in ROW_}
+
+def session_file_func_(SITE_INDEX_):
+    """
+    Returns the name of the file holding the saved session key of a site
+    """
+    return ('/home/'+getpass.getuser()+'/'+SESSION_CACHE_DIR_+'/'+
+        str(SITE_INDEX_))
+
+def load_session_key_func_(SITE_INDEX_,AUTH_STRING_):
+    """
+    Returns the session key saved for a site by an earlier run, or None
+
+    The key is ignored if the file is readable by anyone but its owner
+    (who must be the invoking user), or if it was obtained with other
+    credentials (only a hash of AUTH_STRING_ is saved, to tell)
+    """
+    try:
+        with open(session_file_func_(SITE_INDEX_),mode='r') as FILE_OBJECT_:
+            FILE_STATUS_=os.fstat(FILE_OBJECT_.fileno())
+            if FILE_STATUS_.st_uid != os.getuid() or FILE_STATUS_.st_mode & 0o077:
+                return None
+            SAVED_SESSION_=json.load(FILE_OBJECT_)
+    except (OSError,ValueError):
+        return None
+    if SAVED_SESSION_.get('auth') != hashlib.sha256(str.encode(AUTH_STRING_)).hexdigest():
+        return None
+    return SAVED_SESSION_.get('key')
+
+def save_session_key_func_(SITE_INDEX_,AUTH_STRING_,SESSION_KEY_):
+    """
+    Saves the session key of a site for later runs; the file is created
+    with mode 0600 (in a directory of mode 0700) and renamed into place,
+    so it is never readable by anyone else
+
+    Failing to save the key is not an error; the next run just logs in
+    """
+    SESSION_FILE_=session_file_func_(SITE_INDEX_)
+    TEMP_FILE_=SESSION_FILE_+'.'+str(os.getpid())
+    try:
+        os.makedirs(os.path.dirname(SESSION_FILE_),mode=0o700,exist_ok=True)
+        with os.fdopen(os.open(TEMP_FILE_,os.O_WRONLY|os.O_CREAT|os.O_EXCL,0o600),
+                mode='w') as FILE_OBJECT_:
+            json.dump({'auth': hashlib.sha256(str.encode(AUTH_STRING_)).hexdigest(),
+                'key': SESSION_KEY_},FILE_OBJECT_)
+        os.replace(TEMP_FILE_,SESSION_FILE_)
+    except OSError:
+        pass
+
+def login_func_(SESSION_,TARGET_URL_,AUTH_STRING_,TIMEOUT_):
+    """
+    Logs in to a Management Controller and returns the session key;
+    raises RuntimeError if the login is refused
+    """
+    QUERY_=SESSION_.get(TARGET_URL_+'/api/login/'+AUTH_STRING_,
+        headers={'datatype':'json'},verify=False,timeout=TIMEOUT_)
+    RESPONSE_=json.loads(QUERY_.content)
+    if RESPONSE_['status'][0].get('response-type') != 'Success':
+        raise RuntimeError('login refused: '+
+            str(RESPONSE_['status'][0].get('response')))
+    return RESPONSE_['status'][0]['response']
+
+def probe_session_key_func_(SESSION_,TARGET_URL_,SESSION_KEY_,TIMEOUT_):
+    """
+    Returns True if a Management Controller still accepts a session key
+    (checked with PROBE_COMMAND_, which is quick for the controller to
+    answer), False otherwise
+    """
+    QUERY_=SESSION_.get(TARGET_URL_+'/api/show/'+PROBE_COMMAND_,
+        headers={'sessionKey': SESSION_KEY_, 'datatype': 'json'},
+        verify=False,timeout=TIMEOUT_)
+    return QUERY_.status_code == 200
+
+def site_lookup_func_(SITE_ARG_):
+    """
+    Determines the SITE_INDEX_ and SITE_NAME_ of an argument to -s
+    (either the two-digit SITE_INDEX_ or the SITE_NAME_, in any case)
+
+    Returns a tuple of the two, or (0,'') if the argument is not valid
+    """
+    # First, is it an integer?
+    if SITE_ARG_.isdigit():
+        # Yes, make sure it is in valid range
+        if MIN_SITE_INDEX_ <= int(SITE_ARG_) <= MAX_SITE_INDEX_:
+            # This uses SITE_INFO_ to match a numeric argument to
+            #   to the string identifying that site
+            if int(SITE_ARG_) in SITE_INFO_:
+                return (int(SITE_ARG_),SITE_INFO_[int(SITE_ARG_)])
+    else:
+        # No, should be a string of chars
+        if MIN_SITE_LEN_ <= len(SITE_ARG_) <= MAX_SITE_LEN_:
+            # Determine if Site Name is valid
+            for key,value in SITE_INFO_.items():
+                if value == SITE_ARG_.upper():
+                    return (key,value)
+    return (0,'')
+
+def site_url_func_(SITE_INDEX_):
+    """
+    Returns the URL of the Management Controller of a site
+    """
+    return 'https://'+NETWORK_BASE_+str(SITE_INDEX_)+MC_IP_ADDR_
+
+def open_site_func_(SITE_INDEX_,AUTH_STRING_,TIMEOUT_,DEADLINE_=None):
+    """
+    Opens a pooled HTTPS session to the Management Controller of a site
+    and logs in (unless the session key saved by an earlier run is still
+    accepted), by DEADLINE_ (a time.monotonic() value; default is
+    TIMEOUT_ seconds from now)
+
+    Returns a Dictionary (SITE_CONN_) holding the URL, the session, the
+    site timeout and the session key state, for use with
+    site_reports_func_; the caller closes SITE_CONN_['session'] when
+    done with it. Raises RuntimeError if the login is refused, or a
+    requests exception (or TimeoutError) if the site can not be reached
+
+    Runs in a worker thread, so it does not print anything
+    """
+    TARGET_URL_=site_url_func_(SITE_INDEX_)
+    if DEADLINE_ is None:
+        DEADLINE_=time.monotonic()+TIMEOUT_
+    ARRAY_SESSION_=array_session_func_()
+    # The session key in use, shared by the report workers; when it
+    #   is refused, the first worker to notice logs in again (the
+    #   others then just use the new key); deadline is that of the
+    #   requests in progress (site_reports_func_ moves it along)
+    KEY_STATE_={'key': None, 'lock': threading.Lock(), 'deadline': DEADLINE_}
+    def renew_key_func_(REFUSED_KEY_):
+        with KEY_STATE_['lock']:
+            if KEY_STATE_['key'] == REFUSED_KEY_:
+                KEY_STATE_['key']=login_func_(ARRAY_SESSION_,TARGET_URL_,
+                    AUTH_STRING_,request_timeout_func_(KEY_STATE_['deadline']))
+                save_session_key_func_(SITE_INDEX_,AUTH_STRING_,KEY_STATE_['key'])
+    KEY_STATE_['renew']=renew_key_func_
+
+    # Use the saved session key if it is still good, otherwise login
+    #   and obtain a new one; every request after this reuses the
+    #   same HTTPS connection(s)
+    try:
+        KEY_STATE_['key']=load_session_key_func_(SITE_INDEX_,AUTH_STRING_)
+        if KEY_STATE_['key'] is None or not probe_session_key_func_(ARRAY_SESSION_,
+                TARGET_URL_,KEY_STATE_['key'],request_timeout_func_(DEADLINE_)):
+            renew_key_func_(KEY_STATE_['key'])
+    except Exception:
+        ARRAY_SESSION_.close()
+        raise
+    return {'url': TARGET_URL_, 'session': ARRAY_SESSION_,
+        'timeout': TIMEOUT_, 'key_state': KEY_STATE_}
+
+def site_reports_func_(SITE_CONN_,REPORT_LIST_,DATATYPE_,PARSE_=False,DEADLINE_=None):
+    """
+    Requests every report in REPORT_LIST_ (MAX_REPORT_WORKERS_ at a
+    time) over a session opened by open_site_func_, all of them by
+    DEADLINE_ (a time.monotonic() value; default is the site timeout
+    from now)
+
+    Returns a list of the body of each report (as bytes), or with
+    PARSE_ of the list of component records in each, in REPORT_LIST_
+    order; as soon as one report fails, or DEADLINE_ passes, the
+    reports not yet requested are dropped and the error raised (a
+    request in progress ends by DEADLINE_ at the latest)
+    """
+    if DEADLINE_ is None:
+        DEADLINE_=time.monotonic()+SITE_CONN_['timeout']
+    SITE_CONN_['key_state']['deadline']=DEADLINE_
+    REPORT_POOL_=concurrent.futures.ThreadPoolExecutor(
+        max_workers=min(MAX_REPORT_WORKERS_,len(REPORT_LIST_)))
+    REPORT_FUTURES_=[REPORT_POOL_.submit(fetch_report_func_,SITE_CONN_['session'],
+        SITE_CONN_['url'],THIS_REPORT_,DATATYPE_,DEADLINE_,SITE_CONN_['key_state'],
+        PARSE_) for THIS_REPORT_ in REPORT_LIST_]
+    (DONE_FUTURES_,PENDING_FUTURES_)=concurrent.futures.wait(REPORT_FUTURES_,
+        timeout=max(0,DEADLINE_-time.monotonic()),
+        return_when=concurrent.futures.FIRST_EXCEPTION)
+    for THIS_FUTURE_ in DONE_FUTURES_:
+        if THIS_FUTURE_.exception() is not None:
+            REPORT_POOL_.shutdown(wait=False,cancel_futures=True)
+            raise THIS_FUTURE_.exception()
+    if PENDING_FUTURES_:
+        REPORT_POOL_.shutdown(wait=False,cancel_futures=True)
+        raise TimeoutError('no answer within '+str(SITE_CONN_['timeout'])+' seconds')
+    REPORT_POOL_.shutdown(wait=False)
+    return [THIS_FUTURE_.result() for THIS_FUTURE_ in REPORT_FUTURES_]
+
+def query_site_func_(SITE_INDEX_,AUTH_STRING_,REPORT_LIST_,DATATYPE_,TIMEOUT_,
+        PARSE_=False):
+    """
+    Logs in to the Management Controller of a site and requests every
+    report in REPORT_LIST_ with one pooled HTTPS session
+
+    Returns a list of the body of each report (as bytes), or with
+    PARSE_ of the list of component records in each, in REPORT_LIST_
+    order; raises RuntimeError if the login is refused,
+    or a requests exception if the site can not be reached
+
+    Runs in a worker thread, so it does not print anything
+    """
+    # The whole site, login included, must answer within TIMEOUT_
+    DEADLINE_=time.monotonic()+TIMEOUT_
+    SITE_CONN_=open_site_func_(SITE_INDEX_,AUTH_STRING_,TIMEOUT_,DEADLINE_)
+    with SITE_CONN_['session']:
+        return site_reports_func_(SITE_CONN_,REPORT_LIST_,DATATYPE_,PARSE_,DEADLINE_)
+
+def statistics_delta_func_(FIRST_RECORDS_,SECOND_RECORDS_,SECONDS_):
+    """
+    Returns a list of Dictionaries (one for each volume or controller
+    in both samples) of the rates between two samples of statistics
+    records (from the volume-statistics and controller-statistics
+    reports) taken SECONDS_ apart
+
+    A rate is None if a counter is missing, or went backwards (the
+    statistics were reset in between); the response times are those
+    of the second sample (the Management Controller averages them
+    itself), where the firmware reports them
+    """
+    FIRST_BY_ID_={(THIS_RECORD_.KIND_,THIS_RECORD_.id): THIS_RECORD_
+        for THIS_RECORD_ in FIRST_RECORDS_}
+    def rate_func_(FIRST_RECORD_,SECOND_RECORD_,FIELD_NAME_,SCALE_=1):
+        try:
+            COUNTER_DELTA_=(int(getattr(SECOND_RECORD_,FIELD_NAME_))-
+                int(getattr(FIRST_RECORD_,FIELD_NAME_)))
+        except (TypeError,ValueError):
+            return None
+        if COUNTER_DELTA_ < 0:
+            return None
+        return round(COUNTER_DELTA_/SECONDS_/SCALE_,2)
+    def sum_func_(FIRST_RATE_,SECOND_RATE_):
+        if FIRST_RATE_ is None or SECOND_RATE_ is None:
+            return None
+        return round(FIRST_RATE_+SECOND_RATE_,2)
+
+    DELTA_ROWS_=[]
+    for THIS_RECORD_ in SECOND_RECORDS_:
+        FIRST_RECORD_=FIRST_BY_ID_.get((THIS_RECORD_.KIND_,THIS_RECORD_.id))
+        if FIRST_RECORD_ is None:
+            continue
+        DELTA_ROW_={'kind': THIS_RECORD_.KIND_.split('-')[0], 'id': THIS_RECORD_.id,
+            'name': getattr(THIS_RECORD_,'name',None)}
+        DELTA_ROW_['read_iops']=rate_func_(FIRST_RECORD_,THIS_RECORD_,'reads')
+        DELTA_ROW_['write_iops']=rate_func_(FIRST_RECORD_,THIS_RECORD_,'writes')
+        DELTA_ROW_['iops']=sum_func_(DELTA_ROW_['read_iops'],DELTA_ROW_['write_iops'])
+        DELTA_ROW_['read_mbps']=rate_func_(FIRST_RECORD_,THIS_RECORD_,'data_read',1000000)
+        DELTA_ROW_['write_mbps']=rate_func_(FIRST_RECORD_,THIS_RECORD_,'data_written',1000000)
+        DELTA_ROW_['mbps']=sum_func_(DELTA_ROW_['read_mbps'],DELTA_ROW_['write_mbps'])
+        if DELTA_ROW_['mbps'] is None:
+            DELTA_ROW_['mbps']=rate_func_(FIRST_RECORD_,THIS_RECORD_,'data_transferred',1000000)
+        DELTA_ROW_['latency_us']=THIS_RECORD_.avg_rsp_time
+        DELTA_ROW_['read_latency_us']=THIS_RECORD_.avg_read_rsp_time
+        DELTA_ROW_['write_latency_us']=THIS_RECORD_.avg_write_rsp_time
+        DELTA_ROWS_.append(DELTA_ROW_)
+    return DELTA_ROWS_
+
+def print_delta_func_(DELTA_ROWS_):
+    """
+    Displays the rates from statistics_delta_func_ as a table; a rate
+    that could not be worked out is shown as -
+    """
+    def cell_func_(VALUE_):
+        if VALUE_ is None:
+            return '-'
+        return str(VALUE_)
+    print('\n\t\t'+ANSI_.BOLD_TEXT_+'{:<12} {:<24} {:>9} {:>9} {:>9} {:>9} {:>9} {:>9} {:>9}'.format(
+        'KIND','NAME','READ IOPS','WRITE','TOTAL','READ MB/s','WRITE','TOTAL',
+        'RESP us')+ANSI_.ALL_OFF_)
+    for DELTA_ROW_ in DELTA_ROWS_:
+        print('\t\t{:<12} {:<24} {:>9} {:>9} {:>9} {:>9} {:>9} {:>9} {:>9}'.format(
+            DELTA_ROW_['kind'],cell_func_(DELTA_ROW_['name'] or DELTA_ROW_['id']),
+            *[cell_func_(DELTA_ROW_[FIELD_NAME_]) for FIELD_NAME_ in ('read_iops',
+            'write_iops','iops','read_mbps','write_mbps','mbps','latency_us')]))
+    print()
+
+def sample_site_func_(SITE_INDEX_,AUTH_STRING_,REPORT_LIST_,TIMEOUT_,INTERVAL_):
+    """
+    Requests the statistics reports in REPORT_LIST_ from a site twice,
+    INTERVAL_ seconds apart, over the same session, and returns the
+    rates between the two samples (see statistics_delta_func_)
+
+    Runs in a worker thread, so it does not print anything
+    """
+    # The whole site must answer within TIMEOUT_, plus the time between
+    #   the samples
+    DEADLINE_=time.monotonic()+TIMEOUT_+INTERVAL_
+    SITE_CONN_=open_site_func_(SITE_INDEX_,AUTH_STRING_,TIMEOUT_,DEADLINE_)
+    with SITE_CONN_['session']:
+        FIRST_TIME_=time.monotonic()
+        FIRST_SAMPLE_=site_reports_func_(SITE_CONN_,REPORT_LIST_,'json',PARSE_=True,
+            DEADLINE_=DEADLINE_)
+        time.sleep(max(0,INTERVAL_-(time.monotonic()-FIRST_TIME_)))
+        SECOND_TIME_=time.monotonic()
+        SECOND_SAMPLE_=site_reports_func_(SITE_CONN_,REPORT_LIST_,'json',PARSE_=True,
+            DEADLINE_=DEADLINE_)
+    return statistics_delta_func_(sum(FIRST_SAMPLE_,[]),sum(SECOND_SAMPLE_,[]),
+        SECOND_TIME_-FIRST_TIME_)
+
+def record_digest_func_(RECORD_):
+    """
+    Returns the SHA-256 digest (bytes) of every field (status, readings,
+    and so on) of a component record, taken from a canonical json form
+    of the record, so equal records always have equal digests
+    """
+    return hashlib.sha256(json.dumps(RECORD_,sort_keys=True,
+        separators=(',',':')).encode()).digest()
+
+def change_detector_func_(SITE_NAME_,REPORT_LIST_,FIELD_LIST_,EMIT_):
+    """
+    Returns the function poll_site_func_ hands each poll of a site for
+    --poll; it calls EMIT_ with an event (a Dictionary) for every
+    component record that was added, changed or removed since the
+    previous poll (on the first poll, every record is added)
+
+    Records are compared, and shown, by the fields in FIELD_LIST_ (or
+    all of them, if None)
+    """
+    # The digest of every record last seen, by report and record id
+    LAST_DIGESTS_={THIS_REPORT_: {} for THIS_REPORT_ in REPORT_LIST_}
+    def detect_changes_func_(SITE_REPORTS_,SAMPLE_TIME_):
+        for THIS_REPORT_,REPORT_RECORDS_ in zip(REPORT_LIST_,SITE_REPORTS_):
+            LAST_REPORT_DIGESTS_=LAST_DIGESTS_[THIS_REPORT_]
+            REPORT_DIGESTS_={}
+            for RECORD_NUMBER_,THIS_RECORD_ in enumerate(REPORT_RECORDS_):
+                if THIS_RECORD_.id is not None:
+                    RECORD_ID_=THIS_RECORD_.id
+                else:
+                    RECORD_ID_=THIS_RECORD_.KIND_+'_'+str(RECORD_NUMBER_)
+                RECORD_FIELDS_=THIS_RECORD_.as_dict(FIELD_LIST_)
+                REPORT_DIGESTS_[RECORD_ID_]=record_digest_func_(RECORD_FIELDS_)
+                if RECORD_ID_ not in LAST_REPORT_DIGESTS_:
+                    CHANGE_='added'
+                elif LAST_REPORT_DIGESTS_[RECORD_ID_] != REPORT_DIGESTS_[RECORD_ID_]:
+                    CHANGE_='changed'
+                else:
+                    continue
+                EMIT_({'site': SITE_NAME_, 'report': THIS_REPORT_,
+                    'id': RECORD_ID_, 'change': CHANGE_, 'record': RECORD_FIELDS_})
+            for RECORD_ID_ in LAST_REPORT_DIGESTS_.keys()-REPORT_DIGESTS_.keys():
+                EMIT_({'site': SITE_NAME_, 'report': THIS_REPORT_,
+                    'id': RECORD_ID_, 'change': 'removed', 'record': None})
+            LAST_DIGESTS_[THIS_REPORT_]=REPORT_DIGESTS_
+    return detect_changes_func_
+
+def series_file_func_(SITE_NAME_,SERIES_DATE_):
+    """
+    Returns the name of the time-series file (--record) of a site for
+    a (local) day, given as a datetime.date
+    """
+    return ('/home/'+getpass.getuser()+'/'+SERIES_DIR_+'/'+SITE_NAME_+'-'+
+        SERIES_DATE_.strftime('%Y%m%d')+'.tsr')
+
+def series_counter_func_(VALUE_,MISSING_):
+    """
+    Returns a counter of a statistics record as an integer that fits
+    in a SERIES_RECORD_ field, or MISSING_ if it has none
+    """
+    try:
+        VALUE_=int(VALUE_)
+    except (TypeError,ValueError):
+        return MISSING_
+    if 0 <= VALUE_ < MISSING_:
+        return VALUE_
+    return MISSING_
+
+def series_writer_func_(SITE_NAME_):
+    """
+    Returns the function poll_site_func_ hands each poll of a site for
+    --record; it appends one SERIES_RECORD_ for each volume and
+    controller to the file of the day (starting a new file each day,
+    and removing those older than SERIES_KEEP_DAYS_)
+    """
+    def write_series_func_(SITE_REPORTS_,SAMPLE_TIME_):
+        SERIES_DATE_=datetime.date.fromtimestamp(SAMPLE_TIME_)
+        SERIES_FILE_=series_file_func_(SITE_NAME_,SERIES_DATE_)
+        SERIES_DATA_=b''.join(SERIES_RECORD_.pack(SAMPLE_TIME_,
+            SERIES_KINDS_.index(THIS_RECORD_.KIND_),
+            str(getattr(THIS_RECORD_,'name',None) or THIS_RECORD_.id).encode()[:SERIES_NAME_SIZE_],
+            *[series_counter_func_(getattr(THIS_RECORD_,FIELD_NAME_),MISSING_COUNTER_)
+                for FIELD_NAME_ in SERIES_COUNTERS_],
+            *[series_counter_func_(getattr(THIS_RECORD_,FIELD_NAME_),MISSING_TIME_)
+                for FIELD_NAME_ in SERIES_TIMES_])
+            for REPORT_RECORDS_ in SITE_REPORTS_ for THIS_RECORD_ in REPORT_RECORDS_
+            if THIS_RECORD_.KIND_ in SERIES_KINDS_)
+        NEW_DAY_=not os.path.exists(SERIES_FILE_)
+        os.makedirs(os.path.dirname(SERIES_FILE_),mode=0o700,exist_ok=True)
+        with open(SERIES_FILE_,mode='ab') as FILE_OBJECT_:
+            # Cut off a partial record left by a write that was interrupted,
+            #   so every record stays at a multiple of its size
+            FILE_SIZE_=FILE_OBJECT_.tell()
+            if FILE_SIZE_ % SERIES_RECORD_.size:
+                FILE_OBJECT_.truncate(FILE_SIZE_-FILE_SIZE_ % SERIES_RECORD_.size)
+            FILE_OBJECT_.write(SERIES_DATA_)
+        if NEW_DAY_:
+            OLDEST_KEPT_=os.path.basename(series_file_func_(SITE_NAME_,
+                SERIES_DATE_-datetime.timedelta(days=SERIES_KEEP_DAYS_)))
+            for THIS_FILE_ in os.listdir(os.path.dirname(SERIES_FILE_)):
+                if (THIS_FILE_.startswith(SITE_NAME_+'-') and THIS_FILE_.endswith('.tsr')
+                        and len(THIS_FILE_) == len(OLDEST_KEPT_) and THIS_FILE_ < OLDEST_KEPT_):
+                    os.remove(os.path.dirname(SERIES_FILE_)+'/'+THIS_FILE_)
+    return write_series_func_
+
+def read_series_func_(SERIES_FILE_,START_TIME_,END_TIME_):
+    """
+    Yields the SERIES_RECORD_ tuples in a time-series file from
+    START_TIME_ to END_TIME_; the file is memory-mapped and the first
+    of them found by bisection (the records are in time order), so
+    only the records in the window are ever read
+    """
+    try:
+        FILE_OBJECT_=open(SERIES_FILE_,mode='rb')
+    except FileNotFoundError:
+        return
+    with FILE_OBJECT_:
+        RECORD_COUNT_=os.fstat(FILE_OBJECT_.fileno()).st_size//SERIES_RECORD_.size
+        if RECORD_COUNT_ == 0:
+            return
+        with mmap.mmap(FILE_OBJECT_.fileno(),0,access=mmap.ACCESS_READ) as SERIES_MAP_:
+            def sample_time_func_(RECORD_NUMBER_):
+                return SERIES_RECORD_.unpack_from(SERIES_MAP_,
+                    RECORD_NUMBER_*SERIES_RECORD_.size)[0]
+            (LOW_,HIGH_)=(0,RECORD_COUNT_)
+            while LOW_ < HIGH_:
+                MIDDLE_=(LOW_+HIGH_)//2
+                if sample_time_func_(MIDDLE_) < START_TIME_:
+                    LOW_=MIDDLE_+1
+                else:
+                    HIGH_=MIDDLE_
+            for RECORD_NUMBER_ in range(LOW_,RECORD_COUNT_):
+                THIS_SAMPLE_=SERIES_RECORD_.unpack_from(SERIES_MAP_,
+                    RECORD_NUMBER_*SERIES_RECORD_.size)
+                if THIS_SAMPLE_[0] > END_TIME_:
+                    return
+                yield THIS_SAMPLE_
+
+def percentile_func_(SORTED_VALUES_,PERCENT_):
+    """
+    Returns the PERCENT_ percentile (nearest rank) of a sorted list, or
+    None if it is empty
+    """
+    if not SORTED_VALUES_:
+        return None
+    return SORTED_VALUES_[max(0,-(-PERCENT_*len(SORTED_VALUES_)//100)-1)]
+
+def query_series_func_(SITE_NAME_,START_TIME_,END_TIME_):
+    """
+    Reads the time-series files (--record) of a site from START_TIME_
+    to END_TIME_ (one day at a time) and returns a list of Dictionaries
+    (one for each volume and controller) of the percentiles of its IOPS,
+    MB/s and response time over that window
+
+    The rates are worked out between consecutive samples of the same
+    volume or controller, so only the last sample of each is held, plus
+    the rates themselves; a counter that went backwards (the statistics
+    were reset) gives no rate for that interval
+    """
+    LAST_SAMPLES_={}
+    SERIES_RATES_={}
+    # One file per local calendar day from the start to the end (a day
+    #   is not always 86400 seconds long, across a DST change)
+    SERIES_FILES_=[]
+    SERIES_DATE_=datetime.date.fromtimestamp(START_TIME_)
+    while SERIES_DATE_ <= datetime.date.fromtimestamp(END_TIME_):
+        SERIES_FILES_.append(series_file_func_(SITE_NAME_,SERIES_DATE_))
+        SERIES_DATE_+=datetime.timedelta(days=1)
+    for SERIES_FILE_ in SERIES_FILES_:
+        for THIS_SAMPLE_ in read_series_func_(SERIES_FILE_,START_TIME_,END_TIME_):
+            SAMPLE_VALUES_=dict(zip(SERIES_FIELDS_,THIS_SAMPLE_))
+            SERIES_KEY_=(SERIES_KINDS_[SAMPLE_VALUES_['kind']],
+                SAMPLE_VALUES_['name'].rstrip(b'\0').decode(errors='replace'))
+            THESE_RATES_=SERIES_RATES_.setdefault(SERIES_KEY_,
+                {'iops': [], 'mbps': [], 'latency_us': []})
+            if SAMPLE_VALUES_['avg_rsp_time'] != MISSING_TIME_:
+                THESE_RATES_['latency_us'].append(SAMPLE_VALUES_['avg_rsp_time'])
+            LAST_VALUES_=LAST_SAMPLES_.get(SERIES_KEY_)
+            LAST_SAMPLES_[SERIES_KEY_]=SAMPLE_VALUES_
+            if LAST_VALUES_ is None or SAMPLE_VALUES_['time'] <= LAST_VALUES_['time']:
+                continue
+            SECONDS_=SAMPLE_VALUES_['time']-LAST_VALUES_['time']
+            def delta_func_(*FIELD_NAMES_):
+                COUNTER_DELTA_=0
+                for FIELD_NAME_ in FIELD_NAMES_:
+                    if MISSING_COUNTER_ in (SAMPLE_VALUES_[FIELD_NAME_],LAST_VALUES_[FIELD_NAME_]):
+                        return None
+                    COUNTER_DELTA_+=SAMPLE_VALUES_[FIELD_NAME_]-LAST_VALUES_[FIELD_NAME_]
+                    if SAMPLE_VALUES_[FIELD_NAME_] < LAST_VALUES_[FIELD_NAME_]:
+                        return None
+                return COUNTER_DELTA_
+            IO_DELTA_=delta_func_('reads','writes')
+            if IO_DELTA_ is not None:
+                THESE_RATES_['iops'].append(IO_DELTA_/SECONDS_)
+            DATA_DELTA_=delta_func_('data_read','data_written')
+            if DATA_DELTA_ is None:
+                DATA_DELTA_=delta_func_('data_transferred')
+            if DATA_DELTA_ is not None:
+                THESE_RATES_['mbps'].append(DATA_DELTA_/SECONDS_/1000000)
+
+    QUERY_ROWS_=[]
+    for (SERIES_KIND_,SERIES_NAME_),THESE_RATES_ in SERIES_RATES_.items():
+        QUERY_ROW_={'site': SITE_NAME_, 'kind': SERIES_KIND_.split('-')[0],
+            'name': SERIES_NAME_, 'samples': len(THESE_RATES_['iops'])}
+        for RATE_NAME_,RATE_VALUES_ in THESE_RATES_.items():
+            RATE_VALUES_.sort()
+            for PERCENT_ in QUERY_PERCENTILES_:
+                THIS_PERCENTILE_=percentile_func_(RATE_VALUES_,PERCENT_)
+                if THIS_PERCENTILE_ is not None:
+                    THIS_PERCENTILE_=round(THIS_PERCENTILE_,2)
+                QUERY_ROW_[RATE_NAME_+'_p'+str(PERCENT_)]=THIS_PERCENTILE_
+        QUERY_ROWS_.append(QUERY_ROW_)
+    return QUERY_ROWS_
+
+def query_time_func_(TIME_TEXT_,NOW_):
+    """
+    Converts a time given to --query (either a local date and time,
+    such as 2026-10-17T13:45, or a time ago, such as 90m, 6h or 2d) to
+    seconds since the epoch; returns None if it is neither
+    """
+    TIME_TEXT_=TIME_TEXT_.strip()
+    if TIME_TEXT_[:-1].isdigit() and TIME_TEXT_[-1:] in TIME_UNITS_:
+        return NOW_-int(TIME_TEXT_[:-1])*TIME_UNITS_[TIME_TEXT_[-1]]
+    try:
+        return datetime.datetime.fromisoformat(TIME_TEXT_).timestamp()
+    except ValueError:
+        return None
+
+def print_query_func_(QUERY_ROWS_):
+    """
+    Displays the percentiles from query_series_func_ as a table; a
+    value that could not be worked out is shown as -
+    """
+    def cell_func_(VALUE_):
+        if VALUE_ is None:
+            return '-'
+        return str(VALUE_)
+    COLUMN_NAMES_=[RATE_NAME_+'_p'+str(PERCENT_) for RATE_NAME_ in
+        ('iops','mbps','latency_us') for PERCENT_ in QUERY_PERCENTILES_]
+    print('\n\t\t'+ANSI_.BOLD_TEXT_+'{:<12} {:<24} {:>7}'.format('KIND','NAME',
+        'SAMPLES')+''.join(' {:>10}'.format(THIS_NAME_.upper().replace('LATENCY_US',
+        'RESP_US')) for THIS_NAME_ in COLUMN_NAMES_)+ANSI_.ALL_OFF_)
+    for QUERY_ROW_ in QUERY_ROWS_:
+        print('\t\t{:<12} {:<24} {:>7}'.format(QUERY_ROW_['kind'],QUERY_ROW_['name'],
+            QUERY_ROW_['samples'])+''.join(' {:>10}'.format(cell_func_(QUERY_ROW_[THIS_NAME_]))
+            for THIS_NAME_ in COLUMN_NAMES_))
+    print()
+
+def poll_site_func_(SITE_INDEX_,SITE_NAME_,AUTH_STRING_,REPORT_LIST_,
+        INTERVAL_,TIMEOUT_,HANDLER_,EMIT_,STOP_):
+    """
+    Requests the json REPORT_LIST_ of a site every INTERVAL_ seconds,
+    until STOP_ (a threading.Event) is set, keeping the session open in
+    between, and calls HANDLER_ with the component records of each
+    report and the time of the poll
+
+    A failed poll is reported once, by calling EMIT_ with an error
+    event (and a recovered event when the site answers again); the
+    session is then opened again on the next poll
+
+    Runs in its own thread, so it does not print anything
+    """
+    SITE_CONN_=None
+    SITE_FAILED_=False
+    while not STOP_.is_set():
+        POLL_START_=time.monotonic()
+        SAMPLE_TIME_=time.time()
+        # Each poll, login included, must answer within TIMEOUT_
+        POLL_DEADLINE_=POLL_START_+TIMEOUT_
+        try:
+            if SITE_CONN_ is None:
+                SITE_CONN_=open_site_func_(SITE_INDEX_,AUTH_STRING_,TIMEOUT_,
+                    POLL_DEADLINE_)
+            HANDLER_(site_reports_func_(SITE_CONN_,REPORT_LIST_,'json',PARSE_=True,
+                DEADLINE_=POLL_DEADLINE_),SAMPLE_TIME_)
+        except Exception as POLL_ERROR_:
+            if SITE_CONN_ is not None:
+                SITE_CONN_['session'].close()
+                SITE_CONN_=None
+            if not SITE_FAILED_:
+                SITE_FAILED_=True
+                EMIT_({'site': SITE_NAME_, 'change': 'error',
+                    'error': str(POLL_ERROR_)})
+        else:
+            if SITE_FAILED_:
+                SITE_FAILED_=False
+                EMIT_({'site': SITE_NAME_, 'change': 'recovered'})
+        STOP_.wait(max(0,INTERVAL_-(time.monotonic()-POLL_START_)))
+    if SITE_CONN_ is not None:
+        SITE_CONN_['session'].close()
+
+def poll_sites_func_(SITE_LIST_,AUTH_STRING_,REPORT_LIST_,INTERVAL_,TIMEOUT_,
+        HANDLER_FACTORY_):
+    """
+    Polls every site in SITE_LIST_ (each in its own thread, on its own
+    schedule) with poll_site_func_, and writes each event as one line
+    of json (NDJSON) to standard output, with the time it was seen;
+    runs until interrupted (Control-C, or SIGTERM)
+
+    HANDLER_FACTORY_ is called with the SITE_NAME_ of each site and the
+    function that writes an event, and returns the HANDLER_ for its
+    polls
+    """
+    STOP_=threading.Event()
+    OUTPUT_LOCK_=threading.Lock()
+    def emit_func_(EVENT_):
+        EVENT_LINE_=json.dumps(dict(time=time.strftime('%Y-%m-%dT%H:%M:%S%z'),
+            **EVENT_),separators=(',',':'))
+        with OUTPUT_LOCK_:
+            print(EVENT_LINE_,flush=True)
+    signal.signal(signal.SIGTERM,lambda SIGNAL_NUMBER_,STACK_FRAME_: STOP_.set())
+    POLL_THREADS_=[]
+    for (SITE_INDEX_,SITE_NAME_) in SITE_LIST_:
+        POLL_THREADS_.append(threading.Thread(target=poll_site_func_,
+            args=(SITE_INDEX_,SITE_NAME_,AUTH_STRING_,REPORT_LIST_,INTERVAL_,TIMEOUT_,
+            HANDLER_FACTORY_(SITE_NAME_,emit_func_),emit_func_,STOP_),daemon=True))
+        POLL_THREADS_[-1].start()
+    try:
+        while not STOP_.wait(1):
+            pass
+    except KeyboardInterrupt:
+        STOP_.set()
+    # Give each poller a moment to close its session; one still waiting
+    #   on a site is abandoned (it is a daemon thread)
+    for THIS_THREAD_ in POLL_THREADS_:
+        THIS_THREAD_.join(1)
 
 def argument_parser_func_():
     """
@@ -165,14 +1276,29 @@ def argument_parser_func_():
     # HELP_TEXT_ builds on DESC_TEXT_ by appending text like
     #   Usage : /path/to/tool.py -a -b <ARGUMENT> | -h
     HELP_TEXT_=(DESC_TEXT_+'\n \n\t'+ANSI_.BOLD_TEXT_+'Usage: '+
-        ANSI_.ALL_OFF_+THIS_TOOL_+ANSI_.BOLD_TEXT_+'-s'+
+        ANSI_.ALL_OFF_+THIS_TOOL_+' [ '+ANSI_.BOLD_TEXT_+'-s'+
         ANSI_.BLUE_BLACK_+' [ <SITE_INDEX> | <SITE_NAME> ] '+
-        ANSI_.ALL_OFF_+' [ '+ANSI_.BOLD_TEXT_+'-a'+ANSI_.ALL_OFF_+
+        ANSI_.ALL_OFF_+'... | '+ANSI_.BOLD_TEXT_+'--all-sites'+
+        ANSI_.ALL_OFF_+' ] [ '+ANSI_.BOLD_TEXT_+'--site-timeout'+
+        ANSI_.BLUE_BLACK_+' <SECONDS>'+ANSI_.ALL_OFF_+
+        ' ] [ '+ANSI_.BOLD_TEXT_+'--poll'+
+        ANSI_.BLUE_BLACK_+' <SECONDS>'+ANSI_.ALL_OFF_+
+        ' ] [ '+ANSI_.BOLD_TEXT_+'-j'+ANSI_.ALL_OFF_+' | '+
+        ANSI_.BOLD_TEXT_+'--format'+ANSI_.BLUE_BLACK_+' csv|ndjson'+
+        ANSI_.ALL_OFF_+' ] [ '+ANSI_.BOLD_TEXT_+'--fields'+
+        ANSI_.BLUE_BLACK_+' <FIELD>,...'+ANSI_.ALL_OFF_+
+        ' ] [ '+ANSI_.BOLD_TEXT_+'-a'+ANSI_.ALL_OFF_+
         ' ] [ '+ANSI_.BOLD_TEXT_+'-c'+ANSI_.ALL_OFF_+
         ' | '+ANSI_.BOLD_TEXT_+'-e'+ANSI_.ALL_OFF_+
         ' | '+ANSI_.BOLD_TEXT_+'-f'+ANSI_.ALL_OFF_+
         ' | '+ANSI_.BOLD_TEXT_+'-p'+ANSI_.ALL_OFF_+
-        ' | '+ANSI_.BOLD_TEXT_+'-t'+ANSI_.ALL_OFF_+' ] ' +
+        ' | '+ANSI_.BOLD_TEXT_+'-t'+ANSI_.ALL_OFF_+
+        ' | '+ANSI_.BOLD_TEXT_+'--reports'+ANSI_.BLUE_BLACK_+' <REPORT>,...'+
+        ANSI_.ALL_OFF_+' ] [ '+ANSI_.BOLD_TEXT_+'--delta'+
+        ANSI_.BLUE_BLACK_+' <SECONDS>'+ANSI_.ALL_OFF_+' | '+ANSI_.BOLD_TEXT_+
+        '--record'+ANSI_.BLUE_BLACK_+' <SECONDS>'+ANSI_.ALL_OFF_+' | '+
+        ANSI_.BOLD_TEXT_+'--query'+ANSI_.BLUE_BLACK_+' <START>[,<END>]'+
+        ANSI_.ALL_OFF_+' ] ' +
         ' | '+ANSI_.BOLD_TEXT_+'-h'+ANSI_.ALL_OFF_)
 
     # EPILOG_TEXT_ defines a block of text that appears AFTER the Help
@@ -202,7 +1328,7 @@ def argument_parser_func_():
         'the password for the Storage Array interface;\n\tif the file does '+
         'not exist, or is empty, then '+ANSI_.BOLD_TEXT_+
         '-a'+ANSI_.ALL_OFF_+' is ignored')
-    CLI_PARSER_.add_argument('-s',action='store',required=True,
+    CLI_PARSER_.add_argument('-s',action='append',default=[],
         metavar=ANSI_.BOLD_TEXT_+'<SITE_INDEX>'+ANSI_.ALL_OFF_+
         ' or '+ANSI_.BOLD_TEXT_+'<SITE_NAME>'+ANSI_.ALL_OFF_+'\n'+
         '\t\t\tEither the two-digit '+ANSI_.BOLD_TEXT_+
@@ -211,18 +1337,82 @@ def argument_parser_func_():
         '14'+ANSI_.ALL_OFF_+' or '+ANSI_.BOLD_TEXT_+'HQ'+
         ANSI_.ALL_OFF_+' (the acronym is case-insensitive)',
         help='\t'+ANSI_.BOLD_TEXT_+ANSI_.MAGENTA_BLACK_+
-        'This command-line option MUST be specified'+ANSI_.ALL_OFF_)
+        'This command-line option (or '+ANSI_.BLUE_BLACK_+'--all-sites'+
+        ANSI_.MAGENTA_BLACK_+') MUST be specified'+ANSI_.ALL_OFF_+
+        '\n\tIt can be specified more than once, to query several sites')
+    CLI_PARSER_.add_argument('--all-sites',action='store_true',default=False,
+        required=False,help='Query every site (the same as one '+ANSI_.BOLD_TEXT_+
+        '-s'+ANSI_.ALL_OFF_+' for each of '+ANSI_.BOLD_TEXT_+
+        ', '.join(SITE_INFO_.values())+ANSI_.ALL_OFF_+')')
+    CLI_PARSER_.add_argument('--site-timeout',action='store',type=int,
+        default=SITE_TIMEOUT_,metavar=ANSI_.BOLD_TEXT_+'<SECONDS>'+ANSI_.ALL_OFF_,
+        help='\tHow long to wait for each site to answer (default is '+
+        ANSI_.BOLD_TEXT_+str(SITE_TIMEOUT_)+ANSI_.ALL_OFF_+'); a site that '+
+        'takes longer\n\tis reported as failed')
+    CLI_PARSER_.add_argument('--poll',action='store',type=int,default=None,
+        metavar=ANSI_.BOLD_TEXT_+'<SECONDS>'+ANSI_.ALL_OFF_,
+        help='\tKeep polling the '+ANSI_.BOLD_TEXT_+', '.join(POLL_REPORT_LIST_)+
+        ANSI_.ALL_OFF_+' reports (or those chosen\n\twith '+ANSI_.BOLD_TEXT_+
+        '--reports'+ANSI_.ALL_OFF_+' or '+ANSI_.BOLD_TEXT_+'-c'+ANSI_.ALL_OFF_+
+        ' to '+ANSI_.BOLD_TEXT_+'-t'+ANSI_.ALL_OFF_+') every '+ANSI_.BOLD_TEXT_+
+        '<SECONDS>'+ANSI_.ALL_OFF_+', and output only the\n\tcomponents that '+
+        'changed, as one line of json each, until interrupted')
+    CLI_PARSER_.add_argument('--delta',action='store',type=int,default=None,
+        metavar=ANSI_.BOLD_TEXT_+'<SECONDS>'+ANSI_.ALL_OFF_,
+        help='\tSample the '+ANSI_.BOLD_TEXT_+', '.join(STATISTICS_REPORT_LIST_)+
+        ANSI_.ALL_OFF_+' reports (or those\n\tof them chosen with '+
+        ANSI_.BOLD_TEXT_+'--reports'+ANSI_.ALL_OFF_+') twice, '+ANSI_.BOLD_TEXT_+
+        '<SECONDS>'+ANSI_.ALL_OFF_+' apart, and output the\n\tIOPS, '+
+        'throughput and response time of each volume and controller')
+    CLI_PARSER_.add_argument('--record',action='store',type=int,default=None,
+        metavar=ANSI_.BOLD_TEXT_+'<SECONDS>'+ANSI_.ALL_OFF_,
+        help='\tKeep sampling the '+ANSI_.BOLD_TEXT_+', '.join(STATISTICS_REPORT_LIST_)+
+        ANSI_.ALL_OFF_+' reports\n\tevery '+ANSI_.BOLD_TEXT_+'<SECONDS>'+
+        ANSI_.ALL_OFF_+', and append them to a file per site per day in\n\t'+
+        ANSI_.BOLD_TEXT_+ANSI_.BLUE_BLACK_+SERIES_DIR_+ANSI_.ALL_OFF_+
+        ' in your home directory, until interrupted')
+    CLI_PARSER_.add_argument('--query',action='store',default=None,
+        metavar=ANSI_.BOLD_TEXT_+'<START>[,<END>]'+ANSI_.ALL_OFF_,
+        help='\tShow the '+ANSI_.BOLD_TEXT_+'percentiles'+ANSI_.ALL_OFF_+
+        ' of the IOPS, MB/s and response time of each volume\n\tand '+
+        'controller recorded (by '+ANSI_.BOLD_TEXT_+'--record'+ANSI_.ALL_OFF_+
+        ') between '+ANSI_.BOLD_TEXT_+'<START>'+ANSI_.ALL_OFF_+' and '+
+        ANSI_.BOLD_TEXT_+'<END>'+ANSI_.ALL_OFF_+' (default is now); each\n\tis '+
+        'a local time (2026-10-17T13:45) or a time ago (90m, 6h, 2d); no\n\t'+
+        'password is needed, the Storage Arrays are not contacted')
     CLI_PARSER_.add_argument('-j',action='store_true',default=False,
         required=False,help='Output results in '+ANSI_.BOLD_TEXT_+
         'json'+ANSI_.ALL_OFF_+' format instead of the default '+
         ANSI_.BOLD_TEXT_+'plain text'+ANSI_.ALL_OFF_+' as it would '+
         'appear on a console')
+    CLI_PARSER_.add_argument('--format',action='store',default=None,
+        choices=['csv','ndjson'],help='Output the '+ANSI_.BOLD_TEXT_+
+        'normalized'+ANSI_.ALL_OFF_+' component records (one per line, '+
+        'with their site and kind)\n\tinstead of the reports as the '+
+        'Storage Array sends them')
+    CLI_PARSER_.add_argument('--fields',action='store',default=None,
+        metavar=ANSI_.BOLD_TEXT_+'<FIELD>,...'+ANSI_.ALL_OFF_,
+        help='\tThe fields of the records output by '+ANSI_.BOLD_TEXT_+
+        '--format'+ANSI_.ALL_OFF_+' or '+ANSI_.BOLD_TEXT_+'--poll'+
+        ANSI_.ALL_OFF_+' (default is all of them), from\n\t'+
+        ANSI_.BOLD_TEXT_+', '.join(RECORD_FIELDS_)+ANSI_.ALL_OFF_)
     CLI_PARSER_.add_argument('-q',action='store_true',default=False,
         required=False,help='Minimize output (useful if parsing the '+
         'output in another process)')
     # The -c, -e, -f, -p and -t arguments are mutually exclusive, and not
     #    required
     OPTION_GROUP_ = CLI_PARSER_.add_mutually_exclusive_group(required=False)
+    OPTION_GROUP_.add_argument('--reports',action='store',default=None,
+        metavar=ANSI_.BOLD_TEXT_+'<REPORT>,...'+ANSI_.ALL_OFF_,
+        help='\tThe reports to request (all at the same time), from\n\t'+
+        ANSI_.BOLD_TEXT_+', '.join(REPORT_TYPES_)+ANSI_.ALL_OFF_+
+        '\n\t(or '+ANSI_.BOLD_TEXT_+'all'+ANSI_.ALL_OFF_+'); the default is '+
+        'the first five\n\tThis option is exclusive with '+
+        ANSI_.BOLD_TEXT_+'-c'+ANSI_.ALL_OFF_+', '+
+        ANSI_.BOLD_TEXT_+'-e'+ANSI_.ALL_OFF_+', '+
+        ANSI_.BOLD_TEXT_+'-f'+ANSI_.ALL_OFF_+', '+
+        ANSI_.BOLD_TEXT_+'-p'+ANSI_.ALL_OFF_+', and '+
+        ANSI_.BOLD_TEXT_+'-t'+ANSI_.ALL_OFF_)
     OPTION_GROUP_.add_argument('-c',action='store_true',default=False,
         help='Limit output to information about the '+ANSI_.BOLD_TEXT_+
         'Controllers'+ANSI_.ALL_OFF_+'\n\tThis option is exclusive with '+
@@ -269,64 +1459,174 @@ def main():
     COMMAND_LINE_=argument_parser_func_()
     ARGS_=COMMAND_LINE_.parse_args()
     # Init working variables
-    SITE_NAME_=''
     PWFILE_=''
-    SITE_INDEX_=0
     # USERNAME_ is used to contruct string referencing home
     #   directory of invoking user; it is not used to login
     #   to the Management Controller
     USERNAME_=''
 
-    # Determine if the argument to -s is valid
-    SITE_VALID_=False
-    # First, is it an integer?
-    if ARGS_.s.isdigit():
-        # Yes, make sure it is in valid range
-        if MIN_SITE_INDEX_ <= int(ARGS_.s) <= MAX_SITE_INDEX_:
-          SITE_INDEX_=int(ARGS_.s)
-          # Determine Site Name
-          # This uses SITE_INFO_ to match a numeric argument to
-          #   to the string identifying that site
-          for key,value in SITE_INFO_.items():
-            if key == SITE_INDEX_:
-              SITE_VALID_=True
-              SITE_NAME_=value
-              break
+    # Exactly one of -s (any number of times) and --all-sites
+    if (len(ARGS_.s) == 0) == (not ARGS_.all_sites):
+        COMMAND_LINE_.error('Specify either -s (one or more times) or --all-sites')
+    if ARGS_.site_timeout < 1:
+        COMMAND_LINE_.error('--site-timeout must be at least 1 second')
+    if ARGS_.poll is not None:
+        if ARGS_.poll < 1:
+            COMMAND_LINE_.error('--poll must be at least 1 second')
+        if ARGS_.format == 'csv':
+            COMMAND_LINE_.error('--poll always outputs ndjson')
+    if ARGS_.delta is not None:
+        if ARGS_.delta < 1:
+            COMMAND_LINE_.error('--delta must be at least 1 second')
+        if ARGS_.poll is not None or ARGS_.j:
+            COMMAND_LINE_.error('--delta can not be used with --poll or -j')
+    if ARGS_.record is not None:
+        if ARGS_.record < 1:
+            COMMAND_LINE_.error('--record must be at least 1 second')
+        if (ARGS_.poll is not None or ARGS_.delta is not None or ARGS_.j or
+                ARGS_.format is not None or ARGS_.fields is not None):
+            COMMAND_LINE_.error('--record can not be used with --poll, --delta, '+
+                '-j, --format or --fields')
+    if ARGS_.query is not None:
+        if (ARGS_.poll is not None or ARGS_.delta is not None or
+                ARGS_.record is not None or ARGS_.j):
+            COMMAND_LINE_.error('--query can not be used with --poll, --delta, '+
+                '--record or -j')
+        QUERY_NOW_=time.time()
+        QUERY_WINDOW_=[query_time_func_(TIME_TEXT_,QUERY_NOW_)
+            for TIME_TEXT_ in (ARGS_.query+',0s').split(',')[:2]]
+        if None in QUERY_WINDOW_ or QUERY_WINDOW_[0] > QUERY_WINDOW_[1]:
+            COMMAND_LINE_.error('--query needs <START>[,<END>], each a local time '+
+                '(2026-10-17T13:45) or a time ago (90m, 6h, 2d), START first')
+    if ARGS_.j and ARGS_.format is not None:
+        COMMAND_LINE_.error('-j and --format are mutually exclusive')
+    # --delta and --query output rates rather than records, so have their
+    #   own fields
+    if ARGS_.delta is not None:
+        KNOWN_FIELDS_=DELTA_FIELDS_
+    elif ARGS_.query is not None:
+        KNOWN_FIELDS_=QUERY_FIELDS_
     else:
-        # No, should be a string of chars
-        if MIN_SITE_LEN_ <= len(ARGS_.s) <= MAX_SITE_LEN_:
-            # Determine if Site Name is valid
-            SITE_NAME_=ARGS_.s.upper()
-            for key,value in SITE_INFO_.items():
-                if value == SITE_NAME_:
-                    SITE_VALID_=True
-                    SITE_INDEX_=key
-                    break
-
-    # At this point, SITE_NAME_ should contain a string and
-    #    SITE_INDEX_ should be an positive integer
-    # If not, then the argument to -s was not valid
-    if not SITE_VALID_:
-        print(ANSI_.BOLD_TEXT_+ANSI_.MAGENTA_BLACK_+'FATAL ERROR: '+
-            ANSI_.RED_BLACK_+'The '+ANSI_.YELLOW_BLACK_+'-s'+
-            ANSI_.RED_BLACK_+' parameter is invalid (must be '+
-            ' a positive integer between '+ANSI_.MAGENTA_BLACK_+
-            MIN_SITE_INDEX_+ANSI_.RED_BLACK_+' and '+
-            ANSI_.MAGENTA_BLACK_+MAX_SITE_INDEX_+ANSI_.RED_BLACK+
-            ', inclusive; or a string of '+ANSI_.MAGENTA_BLACK_+
-            MIN_SITE_LEN_+ANSI_.RED_BLACK_+' to '+ANSI_.MAGENTA_BLACK_+
-            MAX_SITE_LEN_+ANSI_.RED_BLACK_+' characters)'+
-            ANSI_.ALL_OFF_+'\n')
-        COMMAND_LINE_.print_help()
-        sys.exit(1)
+        KNOWN_FIELDS_=RECORD_FIELDS_
+    if ARGS_.fields is not None:
+        if ARGS_.format is None and ARGS_.poll is None:
+            COMMAND_LINE_.error('--fields requires --format or --poll')
+        FIELD_LIST_=[FIELD_NAME_.strip() for FIELD_NAME_ in ARGS_.fields.split(',')]
+        for FIELD_NAME_ in FIELD_LIST_:
+            if FIELD_NAME_ not in KNOWN_FIELDS_:
+                COMMAND_LINE_.error('Unknown field '+FIELD_NAME_+' (choose from '+
+                    ', '.join(KNOWN_FIELDS_)+')')
+    elif ARGS_.delta is not None:
+        FIELD_LIST_=DELTA_FIELDS_
+    elif ARGS_.query is not None:
+        FIELD_LIST_=QUERY_FIELDS_
+    else:
+        FIELD_LIST_=None
+    # Which reports --reports asks for, each once, in order
+    if ARGS_.reports is not None:
+        SELECTED_REPORTS_=[]
+        for THIS_REPORT_ in ARGS_.reports.split(','):
+            THIS_REPORT_=THIS_REPORT_.strip().lower()
+            if THIS_REPORT_ == 'all':
+                SELECTED_REPORTS_+=list(REPORT_TYPES_)
+            elif THIS_REPORT_ in REPORT_TYPES_:
+                SELECTED_REPORTS_.append(THIS_REPORT_)
+            else:
+                COMMAND_LINE_.error('Unknown report '+THIS_REPORT_+' (choose from '+
+                    ', '.join(REPORT_TYPES_)+', or all)')
+        SELECTED_REPORTS_=list(dict.fromkeys(SELECTED_REPORTS_))
+
+    # The CLI parser took care of preventing conflicting parameters but I
+    #    still need to figure out if one was given
+    if ARGS_.reports is not None:
+        REPORT_LIST_=SELECTED_REPORTS_
+    elif ((ARGS_.c) or (ARGS_.e) or (ARGS_.f) or (ARGS_.p) or (ARGS_.t)):
+        # Only one of these will "hit"
+        if ARGS_.c:
+            REPORT_LIST_=[ 'controllers' ]
+        if ARGS_.e:
+            REPORT_LIST_=[ 'enclosures' ]
+        if ARGS_.f:
+            REPORT_LIST_=[ 'fan-modules' ]
+        if ARGS_.p:
+            REPORT_LIST_=[ 'power-supplies' ]
+        if ARGS_.t:
+            REPORT_LIST_=[ 'sensor-status' ]
+    elif ARGS_.poll is not None:
+        REPORT_LIST_=POLL_REPORT_LIST_
+    elif ARGS_.delta is not None or ARGS_.record is not None:
+        REPORT_LIST_=STATISTICS_REPORT_LIST_
+    else:
+        # List the first 5 reports
+        REPORT_LIST_=[ 'controllers', 'enclosures', 'fan-modules', 'power-supplies', 'sensor-status' ]
+    if ARGS_.delta is not None or ARGS_.record is not None:
+        REPORT_LIST_=[THIS_REPORT_ for THIS_REPORT_ in REPORT_LIST_
+            if THIS_REPORT_ in STATISTICS_REPORT_LIST_]
+        if not REPORT_LIST_:
+            COMMAND_LINE_.error('--delta and --record need at least one of '+
+                ', '.join(STATISTICS_REPORT_LIST_))
+
+    # Nothing but the records is written when they are meant to be
+    #   parsed by another process
+    QUIET_=(ARGS_.q or ARGS_.poll is not None or ARGS_.record is not None or
+        ARGS_.format is not None)
+
+    # Determine if the arguments to -s are valid; SITE_LIST_ holds a
+    #    tuple of the SITE_INDEX_ and SITE_NAME_ of each site to query
+    if ARGS_.all_sites:
+        SITE_LIST_=sorted(SITE_INFO_.items())
     else:
-        # Get the user name
-        USERNAME_=getpass.getuser()
+        SITE_LIST_=[]
+        for THIS_SITE_ARG_ in ARGS_.s:
+            (SITE_INDEX_,SITE_NAME_)=site_lookup_func_(THIS_SITE_ARG_)
+            # If SITE_INDEX_ is not a positive integer, the argument
+            #    to -s was not valid
+            if SITE_INDEX_ == 0:
+                print(ANSI_.BOLD_TEXT_+ANSI_.MAGENTA_BLACK_+'FATAL ERROR: '+
+                    ANSI_.RED_BLACK_+'The '+ANSI_.YELLOW_BLACK_+'-s'+
+                    ANSI_.RED_BLACK_+' parameter '+ANSI_.BLUE_BLACK_+
+                    THIS_SITE_ARG_+ANSI_.RED_BLACK_+' is invalid (must be'+
+                    ' a positive integer between '+ANSI_.MAGENTA_BLACK_+
+                    str(MIN_SITE_INDEX_)+ANSI_.RED_BLACK_+' and '+
+                    ANSI_.MAGENTA_BLACK_+str(MAX_SITE_INDEX_)+ANSI_.RED_BLACK_+
+                    ', inclusive; or a string of '+ANSI_.MAGENTA_BLACK_+
+                    str(MIN_SITE_LEN_)+ANSI_.RED_BLACK_+' to '+ANSI_.MAGENTA_BLACK_+
+                    str(MAX_SITE_LEN_)+ANSI_.RED_BLACK_+' characters)'+
+                    ANSI_.ALL_OFF_+'\n')
+                COMMAND_LINE_.print_help()
+                sys.exit(1)
+            # Each site is only queried once
+            if (SITE_INDEX_,SITE_NAME_) not in SITE_LIST_:
+                SITE_LIST_.append((SITE_INDEX_,SITE_NAME_))
 
-    #print('\nSITE_NAME_ is '+SITE_NAME_)
+    # --query only reads the files --record wrote; no password needed
+    if ARGS_.query is not None:
+        if ARGS_.format == 'csv':
+            CSV_WRITER_=csv.DictWriter(sys.stdout,fieldnames=FIELD_LIST_,restval='')
+            CSV_WRITER_.writeheader()
+        for (SITE_INDEX_,SITE_NAME_) in SITE_LIST_:
+            QUERY_ROWS_=query_series_func_(SITE_NAME_,QUERY_WINDOW_[0],QUERY_WINDOW_[1])
+            if ARGS_.format is None:
+                if not QUIET_:
+                    print('\n\t'+ANSI_.BOLD_TEXT_+SITE_NAME_+ANSI_.ALL_OFF_+' from '+
+                        time.strftime('%Y-%m-%d %H:%M:%S',time.localtime(QUERY_WINDOW_[0]))+
+                        ' to '+time.strftime('%Y-%m-%d %H:%M:%S',time.localtime(QUERY_WINDOW_[1])))
+                print_query_func_(QUERY_ROWS_)
+            for QUERY_ROW_ in QUERY_ROWS_:
+                if ARGS_.format == 'csv':
+                    CSV_WRITER_.writerow({FIELD_NAME_: QUERY_ROW_[FIELD_NAME_]
+                        for FIELD_NAME_ in FIELD_LIST_})
+                elif ARGS_.format == 'ndjson':
+                    print(json.dumps({FIELD_NAME_: QUERY_ROW_[FIELD_NAME_]
+                        for FIELD_NAME_ in FIELD_LIST_},separators=(',',':')))
+        sys.exit(0)
+
+    # Get the user name
+    USERNAME_=getpass.getuser()
+
+    #print('\nSITE_LIST_ is '+str(SITE_LIST_))
     #print('\nPWFILE_ is '+PWFILE_)
     #print('\nUSERNAME_ is '+USERNAME_)
-    #print('\nSITE_INDEX_ is '+str(SITE_INDEX_))
     # If invoked with -a, check that file exists
     if ARGS_.a:
         PWFILE_='/home/'+USERNAME_+'/'+PW_FILENAME_
@@ -340,19 +1640,26 @@ def main():
         except FileNotFoundError:
             # File does not exist, ignore -a
             USERPW_=''
+            PWFILE_=''
             if not ARGS_.q:
                 print('\n\t'+ANSI_.BOLD_TEXT_+'WARNING: Did not find '+
-                    ANSI_.BLUE_BLACK_+PWFILE_+ANSI_.ALL_OFF_+
-                    ANSI_.BOLD_TEXT_+'; ignoring '+ANSI_.MAGENTA_BLACK_+
-                    '-a'+ANSI_.ALL_OFF_+'\n')
+                    ANSI_.BLUE_BLACK_+'/home/'+USERNAME_+'/'+PW_FILENAME_+
+                    ANSI_.ALL_OFF_+ANSI_.BOLD_TEXT_+'; ignoring '+
+                    ANSI_.MAGENTA_BLACK_+'-a'+ANSI_.ALL_OFF_+'\n')
     else:
         USERPW_=''
         PWFILE_=''
 
-    # Do I need to get a password from the user?
+    # Do I need to get a password from the user? (Only once, no matter
+    #   how many sites are queried)
     if PWFILE_=='':
         if USERPW_=='':
-            USERPW_=getpass.getpass(prompt='\n\tDell PowerVault in '+SITE_NAME_+' Storage Array Password: ')
+            if len(SITE_LIST_) == 1:
+                USERPW_=getpass.getpass(prompt='\n\tDell PowerVault in '+
+                    SITE_LIST_[0][1]+' Storage Array Password: ')
+            else:
+                USERPW_=getpass.getpass(prompt='\n\tDell PowerVault Storage '+
+                    'Array Password (for all '+str(len(SITE_LIST_))+' sites): ')
     else:
         # I found a PWFILE_, make sure it had something
         if USERPW_=='':
@@ -362,62 +1669,122 @@ def main():
                 ANSI_.ALL_OFF_+'\n')
             COMMAND_LINE_.print_help()
             sys.exit(1)
-    # If invoked with -q, minimize output
-    if not ARGS_.q:
+    # If invoked with -q (or --poll or --format), minimize output
+    if not QUIET_:
         print('\n'+ANSI_.BOLD_TEXT_+THIS_TOOL_+' - '+
             ANSI_.GREEN_BLACK_+TOOL_DESC_+ANSI_.BLUE_BLACK_+' v'+
             TOOL_VERSION_+ANSI_.ALL_OFF_)
     #print('\nUSERPW_ is '+USERPW_)
 
-    # The CLI parser took care of preventing conflicting parameters but I
-    #    still need to figure out if one was given
-    if ((ARGS_.c) or (ARGS_.e) or (ARGS_.f) or (ARGS_.p) or (ARGS_.t)):
-        # Only one of these will "hit"
-        if ARGS_.c:
-            REPORT_LIST_=[ 'controllers' ]
-        if ARGS_.e:
-            REPORT_LIST_=[ 'enclosures' ]
-        if ARGS_.f:
-            REPORT_LIST_=[ 'fan-modules' ]
-        if ARGS_.p:
-            REPORT_LIST_=[ 'power-supplies' ]
-        if ARGS_.t:
-            REPORT_LIST_=[ 'sensor-status' ]
-    else:
-        # List all 5 reports
-        REPORT_LIST_=[ 'controllers', 'enclosures', 'fan-modules', 'power-supplies', 'sensor-status' ]
-
     #print(REPORT_LIST_)
-    # Construct the URL
-    TARGET_URL_='https://'+NETWORK_BASE_+str(SITE_INDEX_)+MC_IP_ADDR_
-    if not ARGS_.q:
-        print('\n\tQuerying '+ANSI_.BOLD_TEXT_+SITE_NAME_+ANSI_.ALL_OFF_+' Storage Array at '+
-            ANSI_.BOLD_TEXT_+TARGET_URL_+ANSI_.ALL_OFF_)
-    AUTH_STRING_=hashlib.sha256(b''+DEVICE_USER_+str.encode(USERPW_)).hexdigest()
-    #print('\nTARGET_URL_ is '+TARGET_URL_)
+    # The Management Controller expects the sha256 of "user_password"
+    AUTH_STRING_=hashlib.sha256(str.encode(DEVICE_USER_+'_'+USERPW_)).hexdigest()
     #print('\nAUTH_STRING_ is '+AUTH_STRING_)
 
-    # Login and obtain the session key
-    HEADERS_={'datatype':'json'}
-    QUERY_=requests.get(TARGET_URL_+'/api/login/'+AUTH_STRING_,headers=HEADERS_,verify=False)
-    RESPONSE_=json.loads(QUERY_.content)
-    SESSION_KEY_=RESPONSE_['status'][0]['response']
-    #print('\nSESSION_KEY__ is '+SESSION_KEY_)
+    if ARGS_.poll is not None:
+        poll_sites_func_(SITE_LIST_,AUTH_STRING_,REPORT_LIST_,ARGS_.poll,
+            ARGS_.site_timeout,lambda SITE_NAME_,EMIT_: change_detector_func_(
+            SITE_NAME_,REPORT_LIST_,FIELD_LIST_,EMIT_))
+        sys.exit(0)
+    if ARGS_.record is not None:
+        poll_sites_func_(SITE_LIST_,AUTH_STRING_,REPORT_LIST_,ARGS_.record,
+            ARGS_.site_timeout,lambda SITE_NAME_,EMIT_: series_writer_func_(SITE_NAME_))
+        sys.exit(0)
 
-    # Generate requested report(s)
-    for THIS_REPORT_ in REPORT_LIST_:
-        if not ARGS_.q:
-            print('\n\t\tQuerying '+ANSI_.BOLD_TEXT_+THIS_REPORT_+ANSI_.ALL_OFF_)
+    if ARGS_.j or ARGS_.format is not None:
+        DATATYPE_='json'
+    else:
+        DATATYPE_='console'
 
-        if ARGS_.j:
-            HEADERS_={'sessionKey': SESSION_KEY_, 'datatype':'json'}
-        else:
-            HEADERS_={'sessionKey': SESSION_KEY_, 'datatype':'console'}
-        QUERY_=requests.get(TARGET_URL_+'/api/show/'+THIS_REPORT_,headers=HEADERS_,verify=False)
-        if ARGS_.j:
-            print(QUERY_.content)
-        else:
-            print('\n'+QUERY_.content.decode('UTF-8')+'\n')
+    # Query every site at the same time; each one in its own (daemon)
+    #    thread, so a site that never answers can not keep this tool
+    #    from finishing; SITE_RESULTS_ holds, by SITE_INDEX_, a tuple
+    #    of the list of reports (or of rates, with --delta; or None) and
+    #    the error (or None)
+    SITE_RESULTS_={}
+    def site_worker_func_(SITE_INDEX_):
+        try:
+            if ARGS_.delta is not None:
+                SITE_RESULTS_[SITE_INDEX_]=(sample_site_func_(SITE_INDEX_,AUTH_STRING_,
+                    REPORT_LIST_,ARGS_.site_timeout,ARGS_.delta),None)
+                return
+            SITE_RESULTS_[SITE_INDEX_]=(query_site_func_(SITE_INDEX_,AUTH_STRING_,
+                REPORT_LIST_,DATATYPE_,ARGS_.site_timeout,
+                PARSE_=ARGS_.format is not None),None)
+        except Exception as SITE_ERROR_:
+            SITE_RESULTS_[SITE_INDEX_]=(None,str(SITE_ERROR_))
+    SITE_THREADS_={}
+    for (SITE_INDEX_,SITE_NAME_) in SITE_LIST_:
+        SITE_THREADS_[SITE_INDEX_]=threading.Thread(target=site_worker_func_,
+            args=(SITE_INDEX_,),daemon=True)
+        SITE_THREADS_[SITE_INDEX_].start()
+    # (--delta adds the time between the two samples)
+    SITE_DEADLINE_=time.time()+ARGS_.site_timeout+(ARGS_.delta or 0)
+
+    # With --format, every field of the kinds of records requested (plus
+    #   site and kind) unless --fields says otherwise
+    if ARGS_.format is not None and FIELD_LIST_ is None:
+        FIELD_LIST_=['site','kind']
+        for THIS_REPORT_ in REPORT_LIST_:
+            FIELD_LIST_+=[FIELD_NAME_ for FIELD_NAME_ in REPORT_TYPES_[THIS_REPORT_].__slots__
+                if FIELD_NAME_ not in FIELD_LIST_]
+    if ARGS_.format == 'csv':
+        CSV_WRITER_=csv.DictWriter(sys.stdout,fieldnames=FIELD_LIST_,restval='')
+        CSV_WRITER_.writeheader()
+
+    # Display the results site by site, in order
+    FAILED_SITES_=[]
+    for (SITE_INDEX_,SITE_NAME_) in SITE_LIST_:
+        if not QUIET_:
+            print('\n\tQuerying '+ANSI_.BOLD_TEXT_+SITE_NAME_+ANSI_.ALL_OFF_+' Storage Array at '+
+                ANSI_.BOLD_TEXT_+site_url_func_(SITE_INDEX_)+ANSI_.ALL_OFF_)
+        SITE_THREADS_[SITE_INDEX_].join(max(0,SITE_DEADLINE_-time.time()))
+        (SITE_REPORTS_,SITE_ERROR_)=SITE_RESULTS_.get(SITE_INDEX_,
+            (None,'no answer within '+str(ARGS_.site_timeout)+' seconds'))
+        if SITE_REPORTS_ is None:
+            FAILED_SITES_.append(SITE_NAME_)
+            print('\n\t'+ANSI_.BOLD_TEXT_+ANSI_.MAGENTA_BLACK_+'ERROR: '+
+                ANSI_.RED_BLACK_+SITE_NAME_+' failed ('+SITE_ERROR_+')'+
+                ANSI_.ALL_OFF_+'\n',file=sys.stderr if QUIET_ else sys.stdout)
+            continue
+        if ARGS_.delta is not None:
+            for DELTA_ROW_ in SITE_REPORTS_:
+                DELTA_ROW_['site']=SITE_NAME_
+                if ARGS_.format == 'csv':
+                    CSV_WRITER_.writerow({FIELD_NAME_: DELTA_ROW_[FIELD_NAME_]
+                        for FIELD_NAME_ in FIELD_LIST_})
+                elif ARGS_.format == 'ndjson':
+                    print(json.dumps({FIELD_NAME_: DELTA_ROW_[FIELD_NAME_]
+                        for FIELD_NAME_ in FIELD_LIST_},separators=(',',':')))
+            if ARGS_.format is None:
+                print_delta_func_(SITE_REPORTS_)
+            continue
+        if ARGS_.format is not None:
+            for REPORT_RECORDS_ in SITE_REPORTS_:
+                for THIS_RECORD_ in REPORT_RECORDS_:
+                    RECORD_ROW_=record_row_func_(SITE_NAME_,THIS_RECORD_,FIELD_LIST_)
+                    if ARGS_.format == 'csv':
+                        CSV_WRITER_.writerow(RECORD_ROW_)
+                    else:
+                        print(json.dumps(RECORD_ROW_,separators=(',',':')))
+            continue
+        for THIS_REPORT_,REPORT_CONTENT_ in zip(REPORT_LIST_,SITE_REPORTS_):
+            if not QUIET_:
+                print('\n\t\tQuerying '+ANSI_.BOLD_TEXT_+THIS_REPORT_+ANSI_.ALL_OFF_)
+            if ARGS_.j:
+                print(REPORT_CONTENT_)
+            else:
+                print('\n'+REPORT_CONTENT_.decode('UTF-8')+'\n')
+
+    # With several sites, finish with which of them answered
+    if len(SITE_LIST_) > 1 and not QUIET_:
+        print('\n\t'+ANSI_.BOLD_TEXT_+str(len(SITE_LIST_)-len(FAILED_SITES_))+
+            ' of '+str(len(SITE_LIST_))+' sites answered'+ANSI_.ALL_OFF_)
+        if FAILED_SITES_:
+            print('\t'+ANSI_.BOLD_TEXT_+ANSI_.RED_BLACK_+'Failed: '+
+                ', '.join(FAILED_SITES_)+ANSI_.ALL_OFF_+'\n')
+    if FAILED_SITES_:
+        sys.exit(1)
 
 if __name__ == "__main__":
     main()
@@ -21,6 +21,40 @@
 #       (using the host name, not the FQDN), written to stdout (but
 #       easily re-directed to a file); the purpose is to provide data to
 #       other tools
+#   2) Every time a SUMA is contacted, the list of its registered hosts
+#       is saved in a local SQLite database (INVENTORY_FILE_); when
+#       invoked with "-c" or "-n", that inventory is used instead of
+#       contacting the SUMA, as long as it is no older than
+#       INVENTORY_TTL_ seconds (override with --max-age); if the
+#       database can not be opened, an in-memory one is used instead
+#   3) Invoking with "-f" answers the same question as "-c" for a list
+#       of host names (one per line, read from a file or from stdin),
+#       writing one "<HOSTNAME><TAB><SECONDS>" line per name; it
+#       contacts each SUMA at most once, no matter how many names are
+#       in the list
+#
+#   4) A SUMA session key is saved (readable only by the invoking user)
+#       in SESSION_FILE_ and re-used by later invocations for up to
+#       SESSION_TTL_ seconds, after a quick check that the SUMA still
+#       accepts it; when invoked with "--logout", or if the key could
+#       not be saved, the tool logs out of the SUMA when it exits
+#   5) The full listing is written as the running kernels arrive, one
+#       batch at a time, rather than after every lookup has finished;
+#       "-o csv" and "-o ndjson" give machine-readable output (which
+#       includes whether the host is past CHECKIN_LIMIT_ and whether
+#       it is running something other than LATEST_KERNEL_), and
+#       "--sort" orders each Data Center by something other than host
+#       name (which means waiting for all of its lookups)
+#   6) With "--delta", the full listing compares each SUMA against the
+#       snapshot the previous full listing saved (-c, -f and -n do
+#       not change it); a running kernel can only
+#       change when a host reboots, so kernels are only looked up for
+#       hosts that are new, whose last_boot moved, or whose kernel was
+#       not known, and the rest are taken from the snapshot; hosts
+#       added, rebooted and removed since the snapshot are reported
+#       (a "change" field in CSV/NDJSON, a summary in text), along
+#       with how many checked in after the snapshot's watermark (the
+#       latest checkin it held)
 #
 # KNOWN BUGS:
 #   0) There is no error detection when attempting to contact the
@@ -30,10 +64,19 @@
 #   0) Explore error-handling SUMA comm issues
 #
 #######################################################################
-TOOL_VERSION_='100'
+TOOL_VERSION_='109'
 #######################################################################
 # Change Log (Reverse Chronological Order)
 # Who When______ What__________________________________________________
+# dxb 2026-10-17 Add --delta; only look up kernels of rebooted/new hosts
+# dxb 2026-10-17 Decode SUMA timestamps once per host; flag hosts in bulk
+# dxb 2026-10-17 Stream the full listing as text, CSV or NDJSON (-o, --sort)
+# dxb 2026-10-17 Re-use cached SUMA sessions, log out once at exit
+# dxb 2026-10-17 Add -f to check a list of hosts in one pass; fix -c checks
+# dxb 2026-10-17 Answer -c and -n from a local inventory cache (--max-age)
+# dxb 2026-10-17 Fetch kernel batches in parallel, rate-limited, with retry
+# dxb 2026-10-17 Collect from the SUMAs concurrently (--workers)
+# dxb 2026-10-17 Batch the running kernel lookups with XMLRPC multicall
 # dxb 2020-10-06 Update LATEST_KERNEL_ to the "-47" version
 # dxb 2019-11-15 Original creation
 #######################################################################
@@ -47,13 +90,35 @@ from os import system, name
 
 # Command-line argument parser
 import argparse
+# Exit handlers
+import atexit
+# Saving SUMA session keys between invocations
+import json
 # Low-level network functions
 import socket
 # XMLRPC support
 import xmlrpc.client as xc
+# Local host inventory cache
+import sqlite3
+# Worker threads for contacting the SUMAs concurrently
+import concurrent.futures
+import threading
+# HTTP-level exceptions raised by the XMLRPC transport
+import http.client
 # Additional date and time functions
-import datetime
 import time
+# Compact arrays of Epoch times
+import array
+# Machine-readable output
+import csv
+import itertools
+
+# NumPy is optional; when it is installed, the staleness and kernel
+#   checks for a whole Data Center are done with it
+try:
+  import numpy
+except ImportError:
+  numpy = None
 
 # Declare a Class (instead of a dictionary or variable names)
 #   of ANSI codes for screen control and Colors for text output
@@ -83,17 +148,14 @@ class ANSI_:
 # Create a Dictionary containing IP addresses of SuSE Managers, indexed
 #       by Data Center
 SUMAS_ = dict()
-SUMAS_['ADC'] = '10.0.1.79'
-SUMAS_['BDC'] = '10.0.2.79'
+SUMAS_['DC1'] = '10.0.1.79'
+SUMAS_['DC2'] = '10.0.2.79'
 
 # Create a Dictionary containing User Credentials to access the SUMA API
 CREDENTIALS_ = dict()
 CREDENTIALS_['MANAGER_LOGIN'] = "YOUR_APP_ID"
 CREDENTIALS_['MANAGER_PASSWORD'] = "APP_ID_PASSWORD"
 
-# Date format string - used when calling date manipulation functions
-DATE_FORMAT_ = '%Y%m%dT%H:%M:%S'
-
 # Latest kernel version package name - when invoked without parameters,
 #       and the SUMA-indicated running kernel version on a host does NOT
 #       match this string, the table entry is highlighted
@@ -103,9 +165,903 @@ LATEST_KERNEL_ = '4.12.14-150.47-default'
 #       (7200 = 2 hours) before host is flagged when being displayed
 CHECKIN_LIMIT_ = 7200
 
+# Number of running kernel lookups grouped into a single XMLRPC
+#       multicall when producing the full listing (override with -b)
+KERNEL_BATCH_SIZE_ = 100
+
+# Number of worker threads fetching kernel batches from each SUMA at
+#       the same time (override with --fetch-workers)
+FETCH_WORKERS_ = 4
+
+# Maximum number of XMLRPC requests per second sent to each SUMA while
+#       fetching kernels, so the SUMA Tomcat is not flooded (override
+#       with --rate; 0 means no limit)
+FETCH_RATE_ = 10.0
+
+# Number of times a kernel fetch request is retried after a transient
+#       failure, and the delay (in seconds) before the first retry; the
+#       delay doubles for each subsequent retry
+FETCH_RETRIES_ = 3
+FETCH_BACKOFF_ = 0.5
+
+# XMLRPC Fault codes that indicate a temporary problem on the SUMA
+#       (-1 is the generic internal error returned, for example, when
+#       the SUMA database times out) and are worth retrying
+TRANSIENT_FAULT_CODES_ = [ -1 ]
+
+# Text displayed when SUMA could not provide the running kernel for
+#       a host
+UNKNOWN_KERNEL_ = 'UNKNOWN'
+
+# Fields of a host record that --sort can order the full listing by
+SORT_FIELDS_ = { 'name': 'name', 'checkin': 'last_checkin',
+  'boot': 'last_boot', 'kernel': 'kernel' }
+
+# Columns of the full listing when written with "-o csv" (these are
+#       also the keys of each "-o ndjson" record); "--delta" adds
+#       DELTA_COLUMN_, which is "added", "rebooted", "removed" or empty
+CSV_COLUMNS_ = [ 'dc', 'name', 'last_checkin', 'last_boot', 'kernel',
+  'seconds_since_checkin', 'stale', 'outdated_kernel' ]
+DELTA_COLUMN_ = 'change'
+
+# Local database holding the most recent list of hosts registered to
+#       each SUMA, and the maximum age (in seconds) of that list before
+#       "-c" and "-n" contact the SUMA again (override with --max-age)
+INVENTORY_FILE_ = '/var/cache/sumareport/inventory.db'
+INVENTORY_TTL_ = 300
+
+# File (in the home directory of the invoking user) where SUMA session
+#       keys are saved for re-use, and the number of seconds a saved key
+#       is re-used before logging in again (the SUMA expires sessions
+#       after an hour by default)
+SESSION_FILE_ = os.path.expanduser('~/.cache/sumareport/sessions.json')
+SESSION_TTL_ = 1800
+
 # Define how tool was invoked
 OUR_TOOL_ = os.path.realpath(__file__)
 
+# Per-thread storage for the kernel fetch workers; each worker keeps
+#       its own ServerProxy (ServerProxy objects can not be shared
+#       between threads) and so re-uses its own keep-alive connection
+FETCH_THREAD_DATA_ = threading.local()
+
+# Sessions in use by this invocation, indexed by SUMA URL; each entry
+#       holds the session key and whether it was saved in SESSION_FILE_
+#       (sessions that were not saved are logged out at exit)
+ACTIVE_SESSIONS_ = dict()
+# Serializes access to ACTIVE_SESSIONS_ and SESSION_FILE_ between the
+#       SUMA worker threads
+SESSION_LOCK_ = threading.Lock()
+
+# Declare a Class that paces requests to a SUMA using a "token bucket";
+#   tokens accumulate at a fixed rate up to a small maximum, and every
+#   request must take one before it is sent
+class TOKEN_BUCKET_:
+  '''
+  Limits the rate at which requests are made, across all threads
+  sharing the object
+  '''
+  def __init__(self, RATE_, CAPACITY_):
+    '''
+    Arguments: RATE_ - Tokens added per second (0 disables the limit)
+               CAPACITY_ - Maximum number of tokens that can build up,
+                 and so the largest burst of requests allowed
+    '''
+    self.RATE_ = RATE_
+    self.CAPACITY_ = max(1.0, float(CAPACITY_))
+    self.TOKENS_ = self.CAPACITY_
+    self.LAST_REFILL_ = time.monotonic()
+    self.LOCK_ = threading.Lock()
+
+  def take(self):
+    '''
+    Wait until a token is available, then consume it
+    '''
+    if self.RATE_ <= 0:
+      return
+    while True:
+      with self.LOCK_:
+        NOW_ = time.monotonic()
+        self.TOKENS_ = min(self.CAPACITY_,
+          self.TOKENS_ + (NOW_ - self.LAST_REFILL_) * self.RATE_)
+        self.LAST_REFILL_ = NOW_
+        if self.TOKENS_ >= 1:
+          self.TOKENS_ -= 1
+          return
+        WAIT_TIME_ = (1 - self.TOKENS_) / self.RATE_
+      # Sleep outside the lock so other threads can refill/check
+      time.sleep(WAIT_TIME_)
+
+#######################################################################
+# Function: fetch_client_func                                         #
+# Local Variables: None                                               #
+# Global Variables: FETCH_THREAD_DATA_                                #
+#######################################################################
+def fetch_client_func(MANAGER_URL_):
+  '''
+  Return the ServerProxy belonging to the calling thread for a SUMA,
+  creating it on first use
+    Arguments: MANAGER_URL_ - URL of the SUMA XMLRPC API
+    Returns: An XMLRPC ServerProxy object
+  '''
+  if not hasattr(FETCH_THREAD_DATA_, 'CLIENTS_'):
+    FETCH_THREAD_DATA_.CLIENTS_ = dict()
+  if MANAGER_URL_ not in FETCH_THREAD_DATA_.CLIENTS_:
+    FETCH_THREAD_DATA_.CLIENTS_[MANAGER_URL_] = xc.ServerProxy(MANAGER_URL_, verbose=0)
+  return FETCH_THREAD_DATA_.CLIENTS_[MANAGER_URL_]
+
+#######################################################################
+# Function: retry_call_func                                           #
+# Local Variables: ATTEMPT_ = Number of the current attempt           #
+#                  CALL_ERROR_ = Exception raised by the request      #
+#                  LAST_ERROR_ = Copy of CALL_ERROR_ for the message  #
+# Global Variables: ARGS_, FETCH_RETRIES_, FETCH_BACKOFF_,            #
+#                   TRANSIENT_FAULT_CODES_                            #
+#######################################################################
+def retry_call_func(RATE_LIMITER_, REQUEST_FUNC_):
+  '''
+  Make an XMLRPC request, pacing it with the rate limiter and retrying
+  with exponential backoff if it fails for a transient reason
+    Arguments: RATE_LIMITER_ - TOKEN_BUCKET_ object for the SUMA
+               REQUEST_FUNC_ - Function (no arguments) that performs
+                 the request
+    Returns: Whatever REQUEST_FUNC_ returns; the last exception is
+               raised if all the retries fail, and any other Fault is
+               raised immediately
+  '''
+  for ATTEMPT_ in range(FETCH_RETRIES_ + 1):
+    RATE_LIMITER_.take()
+    try:
+      return REQUEST_FUNC_()
+    except xc.Fault as CALL_ERROR_:
+      if (CALL_ERROR_.faultCode not in TRANSIENT_FAULT_CODES_) or (ATTEMPT_ == FETCH_RETRIES_):
+        raise
+      LAST_ERROR_ = CALL_ERROR_
+    except (socket.error, xc.ProtocolError, http.client.HTTPException) as CALL_ERROR_:
+      if ATTEMPT_ == FETCH_RETRIES_:
+        raise
+      LAST_ERROR_ = CALL_ERROR_
+    if ARGS_.d:
+      print('Retrying after ' + str(LAST_ERROR_))
+    time.sleep(FETCH_BACKOFF_ * (2 ** ATTEMPT_))
+
+#######################################################################
+# Function: fetch_kernel_batch_func                                   #
+# Local Variables: KERNEL_MAP_ = Dictionary of kernels, by host ID    #
+#                  SUMA_CLIENT_ = This thread's ServerProxy           #
+#                  MULTI_CALL_ = XMLRPC MultiCall object              #
+#                  BATCH_RESULTS_ = Results returned by the multicall #
+#                  RESULT_INDEX_ = Index into BATCH_RESULTS_          #
+#                  THIS_HOST_ID_ = Host ID being processed            #
+# Global Variables: ARGS_, UNKNOWN_KERNEL_                            #
+#######################################################################
+def fetch_kernel_batch_func(MANAGER_URL_, SUMA_KEY_, BATCH_IDS_, RATE_LIMITER_):
+  '''
+  Retrieve the running kernel of a batch of hosts with a single XMLRPC
+  multicall; runs in a kernel fetch worker thread
+    Arguments: MANAGER_URL_ - URL of the SUMA XMLRPC API
+               SUMA_KEY_ - Authentication key returned by auth.login
+               BATCH_IDS_ - List of SUMA system IDs in this batch
+               RATE_LIMITER_ - TOKEN_BUCKET_ object for the SUMA
+    Returns: A Dictionary of running kernel strings, indexed by host
+               ID; a host whose lookup failed maps to UNKNOWN_KERNEL_
+  '''
+  KERNEL_MAP_ = dict()
+  SUMA_CLIENT_ = fetch_client_func(MANAGER_URL_)
+
+  # Queue up one getRunningKernel call per host; nothing goes over
+  #   the wire until the MultiCall object is called
+  MULTI_CALL_ = xc.MultiCall(SUMA_CLIENT_)
+  for THIS_HOST_ID_ in BATCH_IDS_:
+    MULTI_CALL_.system.getRunningKernel(SUMA_KEY_, THIS_HOST_ID_)
+
+  try:
+    BATCH_RESULTS_ = retry_call_func(RATE_LIMITER_, MULTI_CALL_)
+  except xc.Fault as MULTI_FAULT_:
+    # The SUMA refused the multicall as a whole; fall back to one
+    #   call per host for this batch so the listing still completes
+    if ARGS_.d:
+      print('Multicall failed (' + str(MULTI_FAULT_) +
+        '), falling back to single calls')
+    for THIS_HOST_ID_ in BATCH_IDS_:
+      try:
+        KERNEL_MAP_[THIS_HOST_ID_] = retry_call_func(RATE_LIMITER_,
+          lambda: SUMA_CLIENT_.system.getRunningKernel(SUMA_KEY_, THIS_HOST_ID_))
+      except xc.Fault:
+        KERNEL_MAP_[THIS_HOST_ID_] = UNKNOWN_KERNEL_
+    return KERNEL_MAP_
+
+  # Each entry in the multicall result either holds the value or
+  #   raises the Fault for that one call when it is accessed, so a
+  #   bad host does not discard the rest of the batch
+  for RESULT_INDEX_, THIS_HOST_ID_ in enumerate(BATCH_IDS_):
+    try:
+      KERNEL_MAP_[THIS_HOST_ID_] = BATCH_RESULTS_[RESULT_INDEX_]
+    except xc.Fault as HOST_FAULT_:
+      if ARGS_.d:
+        print('Kernel lookup failed for host ID ' + str(THIS_HOST_ID_) +
+          ': ' + str(HOST_FAULT_))
+      KERNEL_MAP_[THIS_HOST_ID_] = UNKNOWN_KERNEL_
+
+  return KERNEL_MAP_
+
+#######################################################################
+# Function: decode_dates_func                                         #
+# Local Variables: EPOCH_TIMES_ = Array of converted times            #
+#                  HOUR_CACHE_ = Epoch time of each hour, by hour     #
+#                  DATE_TEXT_ = Date as text, YYYYMMDDTHH:MM:SS       #
+#                  HOUR_START_ = Epoch time of the start of the hour  #
+# Global Variables: None                                              #
+#######################################################################
+def decode_dates_func(DATE_VALUES_):
+  '''
+  Convert many SUMA timestamps (XMLRPC DateTime objects, which hold
+  local time as text in the form YYYYMMDDTHH:MM:SS) to Epoch format;
+  the text is sliced apart rather than parsed with strptime, and the
+  time zone work (mktime) is only done once per distinct hour, since
+  Daylight Saving Time only ever changes on the hour
+    Arguments: DATE_VALUES_ - Iterable of DateTime objects
+    Returns: An array of integer Epoch times, in the same order
+  '''
+  EPOCH_TIMES_ = array.array('q')
+  HOUR_CACHE_ = dict()
+  for THIS_VALUE_ in DATE_VALUES_:
+    DATE_TEXT_ = THIS_VALUE_.value
+    HOUR_START_ = HOUR_CACHE_.get(DATE_TEXT_[0:11])
+    if HOUR_START_ is None:
+      HOUR_START_ = int(time.mktime((int(DATE_TEXT_[0:4]), int(DATE_TEXT_[4:6]),
+        int(DATE_TEXT_[6:8]), int(DATE_TEXT_[9:11]), 0, 0, 0, 0, -1)))
+      HOUR_CACHE_[DATE_TEXT_[0:11]] = HOUR_START_
+    EPOCH_TIMES_.append(HOUR_START_ + int(DATE_TEXT_[12:14]) * 60 + int(DATE_TEXT_[15:17]))
+  return EPOCH_TIMES_
+
+#######################################################################
+# Function: stale_flags_func                                          #
+# Local Variables: None                                               #
+# Global Variables: _CURRENT_TIME, CHECKIN_LIMIT_                     #
+#######################################################################
+def stale_flags_func(CHECKIN_TIMES_):
+  '''
+  Determine, for many hosts at once, the seconds since last checkin
+  and whether that exceeds CHECKIN_LIMIT_
+    Arguments: CHECKIN_TIMES_ - Array of Epoch checkin times
+    Returns: A tuple of a List of ages (in seconds) and a List of
+               True/False staleness flags, in the same order
+  '''
+  if numpy is not None:
+    CHECKIN_AGES_ = int(_CURRENT_TIME) - numpy.frombuffer(CHECKIN_TIMES_, dtype=numpy.int64)
+    return (CHECKIN_AGES_.tolist(), (CHECKIN_AGES_ > CHECKIN_LIMIT_).tolist())
+  CHECKIN_AGES_ = [int(_CURRENT_TIME) - THIS_TIME_ for THIS_TIME_ in CHECKIN_TIMES_]
+  return (CHECKIN_AGES_, [THIS_AGE_ > CHECKIN_LIMIT_ for THIS_AGE_ in CHECKIN_AGES_])
+
+#######################################################################
+# Function: outdated_flags_func                                       #
+# Local Variables: None                                               #
+# Global Variables: LATEST_KERNEL_                                    #
+#######################################################################
+def outdated_flags_func(KERNEL_LIST_):
+  '''
+  Determine, for many hosts at once, whether each is running a kernel
+  other than LATEST_KERNEL_
+    Arguments: KERNEL_LIST_ - List of running kernel strings
+    Returns: A List of True/False flags, in the same order
+  '''
+  if numpy is not None:
+    return (numpy.array(KERNEL_LIST_, dtype=object) != LATEST_KERNEL_).tolist()
+  return [THIS_KERNEL_ != LATEST_KERNEL_ for THIS_KERNEL_ in KERNEL_LIST_]
+
+#######################################################################
+# Function: decode_hosts_func                                         #
+# Local Variables: CHECKIN_TIMES_ = Epoch checkin time of each host   #
+#                  BOOT_TIMES_ = Epoch boot time of each host         #
+#                  CHECKIN_AGES_ = Seconds since each host checked in #
+#                  STALE_FLAGS_ = If each host is past the limit      #
+# Global Variables: None                                              #
+#######################################################################
+def decode_hosts_func(REGISTERED_HOSTS_):
+  '''
+  Decode the timestamps of every host of a SUMA in one pass, and add
+  them to each host record as 'checkin_epoch', 'boot_epoch',
+  'checkin_age' and 'stale'; nothing afterwards needs to look at the
+  DateTime objects again
+    Arguments: REGISTERED_HOSTS_ - List of host records
+    Returns: N/A
+  '''
+  CHECKIN_TIMES_ = decode_dates_func([THIS_HOST_['last_checkin'] for THIS_HOST_ in REGISTERED_HOSTS_])
+  BOOT_TIMES_ = decode_dates_func([THIS_HOST_['last_boot'] for THIS_HOST_ in REGISTERED_HOSTS_])
+  (CHECKIN_AGES_, STALE_FLAGS_) = stale_flags_func(CHECKIN_TIMES_)
+  for THIS_HOST_, THIS_CHECKIN_, THIS_BOOT_, THIS_AGE_, THIS_FLAG_ in zip(REGISTERED_HOSTS_,
+    CHECKIN_TIMES_, BOOT_TIMES_, CHECKIN_AGES_, STALE_FLAGS_):
+    THIS_HOST_['checkin_epoch'] = THIS_CHECKIN_
+    THIS_HOST_['boot_epoch'] = THIS_BOOT_
+    THIS_HOST_['checkin_age'] = THIS_AGE_
+    THIS_HOST_['stale'] = THIS_FLAG_
+
+#######################################################################
+# Function: start_kernel_fetch_func                                   #
+# Local Variables: RATE_LIMITER_ = TOKEN_BUCKET_ for this SUMA        #
+#                  FETCH_POOL_ = Pool of kernel fetch worker threads  #
+#                  KERNEL_BATCHES_ = List of batches being fetched    #
+#                  BATCH_HOSTS_ = Host records in the batch           #
+#                  BATCH_IDS_ = IDs in the batch needing a lookup     #
+#                  LOOKUP_COUNT_ = Total number of lookups submitted  #
+#                  BATCH_FUTURE_ = Future for a batch with no lookups #
+# Global Variables: ARGS_                                             #
+#######################################################################
+def start_kernel_fetch_func(MANAGER_URL_, SUMA_KEY_, REGISTERED_HOSTS_):
+  '''
+  Start retrieving the running kernel of many hosts; the lookups are
+  grouped into XMLRPC multicalls (-b per batch) that are sent by a
+  pool of worker threads (--fetch-workers) at a limited rate (--rate);
+  hosts whose record already holds a 'kernel' (from the snapshot, with
+  --delta) are not looked up, but still ride along in a batch so the
+  hosts stay in order
+    Arguments: MANAGER_URL_ - URL of the SUMA XMLRPC API
+               SUMA_KEY_ - Authentication key returned by auth.login
+               REGISTERED_HOSTS_ - List of host records
+    Returns: A List, in the same order as REGISTERED_HOSTS_, of tuples
+               of a batch of host records and the Future that will
+               hold the Dictionary of their looked-up kernels, indexed
+               by host ID
+  '''
+  # One rate limiter per SUMA, shared by all of its fetch workers
+  RATE_LIMITER_ = TOKEN_BUCKET_(ARGS_.rate, ARGS_.fetch_workers)
+  FETCH_POOL_ = concurrent.futures.ThreadPoolExecutor(max_workers=ARGS_.fetch_workers)
+  KERNEL_BATCHES_ = []
+  BATCH_HOSTS_ = []
+  BATCH_IDS_ = []
+  LOOKUP_COUNT_ = 0
+  for THIS_HOST_ in REGISTERED_HOSTS_:
+    BATCH_HOSTS_.append(THIS_HOST_)
+    if 'kernel' not in THIS_HOST_:
+      BATCH_IDS_.append(THIS_HOST_['id'])
+    # A batch is full once it holds -b lookups
+    if len(BATCH_IDS_) == ARGS_.b:
+      KERNEL_BATCHES_.append((BATCH_HOSTS_, FETCH_POOL_.submit(fetch_kernel_batch_func,
+        MANAGER_URL_, SUMA_KEY_, BATCH_IDS_, RATE_LIMITER_)))
+      LOOKUP_COUNT_ += len(BATCH_IDS_)
+      BATCH_HOSTS_ = []
+      BATCH_IDS_ = []
+  if BATCH_IDS_:
+    KERNEL_BATCHES_.append((BATCH_HOSTS_, FETCH_POOL_.submit(fetch_kernel_batch_func,
+      MANAGER_URL_, SUMA_KEY_, BATCH_IDS_, RATE_LIMITER_)))
+    LOOKUP_COUNT_ += len(BATCH_IDS_)
+  elif BATCH_HOSTS_:
+    # Nothing left to look up; the trailing hosts get a Future that is
+    #   already complete
+    BATCH_FUTURE_ = concurrent.futures.Future()
+    BATCH_FUTURE_.set_result(dict())
+    KERNEL_BATCHES_.append((BATCH_HOSTS_, BATCH_FUTURE_))
+  if ARGS_.d:
+    print('Fetching kernels for ' + str(LOOKUP_COUNT_) + ' of ' +
+      str(len(REGISTERED_HOSTS_)) + ' hosts in ' + str(len(KERNEL_BATCHES_)) +
+      ' batches from ' + MANAGER_URL_)
+  # Nothing more will be submitted; the workers finish the queued
+  #   batches and then go away
+  FETCH_POOL_.shutdown(wait=False)
+  return KERNEL_BATCHES_
+
+#######################################################################
+# Function: host_rows_func                                            #
+# Local Variables: BATCH_HOSTS_ = Host records in the batch           #
+#                  THIS_FUTURE_ = Future holding the batch's kernels  #
+#                  KERNEL_MAP_ = Dictionary of kernels, by host ID    #
+#                  OUTDATED_FLAGS_ = If each host's kernel is old     #
+#                  THIS_HOST_ = Host record being processed           #
+#                  THIS_ROW_ = Row being produced                     #
+# Global Variables: ARGS_, UNKNOWN_KERNEL_, DELTA_COLUMN_             #
+#######################################################################
+def host_rows_func(KERNEL_BATCHES_):
+  '''
+  Generator - produce one row per host, in the order of the batches,
+  as soon as the kernels of each batch have arrived; whatever has been
+  written to stdout is flushed before waiting on a batch, so output
+  appears while the rest of the lookups are still running
+    Arguments: KERNEL_BATCHES_ - List from start_kernel_fetch_func
+    Yields: A Dictionary per host, holding the short 'name', the
+              'last_checkin' and 'last_boot' times in Epoch format, the
+              'kernel', the 'seconds_since_checkin', and the 'stale'
+              and 'outdated_kernel' flags (plus the DELTA_COLUMN_ with
+              --delta); the kernel is also stored in the host record,
+              for the inventory
+  '''
+  for BATCH_HOSTS_, THIS_FUTURE_ in KERNEL_BATCHES_:
+    if not THIS_FUTURE_.done():
+      sys.stdout.flush()
+    try:
+      KERNEL_MAP_ = THIS_FUTURE_.result()
+    except (socket.error, xc.ProtocolError, http.client.HTTPException) as BATCH_ERROR_:
+      # Out of retries; report these hosts as unknown rather than
+      #   abandoning the whole listing
+      if ARGS_.d:
+        print('Giving up on batch after ' + str(BATCH_ERROR_))
+      KERNEL_MAP_ = dict()
+    for THIS_HOST_ in BATCH_HOSTS_:
+      THIS_HOST_['kernel'] = KERNEL_MAP_.get(THIS_HOST_['id'],
+        THIS_HOST_.get('kernel', UNKNOWN_KERNEL_))
+    # Check the kernels of the whole batch at once
+    OUTDATED_FLAGS_ = outdated_flags_func([THIS_HOST_['kernel'] for THIS_HOST_ in BATCH_HOSTS_])
+    for THIS_HOST_, THIS_FLAG_ in zip(BATCH_HOSTS_, OUTDATED_FLAGS_):
+      THIS_ROW_ = { 'name': THIS_HOST_['name'].split('.')[0],
+        'last_checkin': THIS_HOST_['checkin_epoch'],
+        'last_boot': THIS_HOST_['boot_epoch'],
+        'kernel': THIS_HOST_['kernel'],
+        'seconds_since_checkin': THIS_HOST_['checkin_age'],
+        'stale': THIS_HOST_['stale'],
+        'outdated_kernel': THIS_FLAG_ }
+      if ARGS_.delta:
+        THIS_ROW_[DELTA_COLUMN_] = THIS_HOST_.get(DELTA_COLUMN_, '')
+      yield THIS_ROW_
+
+#######################################################################
+# Function: sorted_rows_func                                          #
+# Local Variables: None                                               #
+# Global Variables: None                                              #
+#######################################################################
+def sorted_rows_func(HOST_ROWS_, SORT_FIELD_):
+  '''
+  Sort rows on a field (then by name); the host records of a Data
+  Center are already held in memory, so its rows are simply sorted
+  there
+    Arguments: HOST_ROWS_ - Iterable of rows, in name order, as from
+                 host_rows_func
+               SORT_FIELD_ - Key of the row to sort on
+    Returns: An Iterable of the rows, in sorted order (HOST_ROWS_
+               itself when sorting by name, so the rows are still
+               written as the kernel lookups complete)
+  '''
+  # The rows already arrive in name order
+  if SORT_FIELD_ == 'name':
+    return HOST_ROWS_
+  return sorted(HOST_ROWS_, key=lambda THIS_ROW_: (THIS_ROW_[SORT_FIELD_], THIS_ROW_['name']))
+
+#######################################################################
+# Function: read_sessions_func                                        #
+# Local Variables: FILE_OBJECT_ = Handle for SESSION_FILE_            #
+#                  FILE_STATUS_ = Owner and mode of SESSION_FILE_     #
+# Global Variables: ARGS_, SESSION_FILE_                              #
+#######################################################################
+def read_sessions_func():
+  '''
+  Read the saved SUMA session keys; a file that anyone other than its
+    owner (who must be the user running this tool) can read is ignored
+    Arguments: None
+    Returns: A Dictionary, indexed by "<URL> <LOGIN>", of Dictionaries
+               holding the 'key' and the time it was 'saved'; empty if
+               the file is missing, unreadable or not private
+  '''
+  try:
+    with open(SESSION_FILE_, mode='r') as FILE_OBJECT_:
+      FILE_STATUS_ = os.fstat(FILE_OBJECT_.fileno())
+      if (FILE_STATUS_.st_uid != os.getuid()) or (FILE_STATUS_.st_mode & 0o077):
+        if ARGS_.d:
+          print('Ignoring ' + SESSION_FILE_ + ', it is not private to this user')
+        return dict()
+      return json.load(FILE_OBJECT_)
+  except (OSError, ValueError):
+    return dict()
+
+#######################################################################
+# Function: write_sessions_func                                       #
+# Local Variables: TEMP_FILE_ = Name of the file being written        #
+#                  FILE_HANDLE_ = Low-level handle for TEMP_FILE_     #
+# Global Variables: ARGS_, SESSION_FILE_                              #
+#######################################################################
+def write_sessions_func(SAVED_SESSIONS_):
+  '''
+  Save the SUMA session keys; the file is created with mode 0600 (in a
+    directory with mode 0700), never re-using a file or link already
+    at that name, and swapped into place in one step, so it is never
+    readable by others nor seen half-written
+    Arguments: SAVED_SESSIONS_ - Dictionary as from read_sessions_func
+    Returns: True if the file was written, False otherwise
+  '''
+  TEMP_FILE_ = SESSION_FILE_ + '.' + str(os.getpid())
+  try:
+    os.makedirs(os.path.dirname(SESSION_FILE_), mode=0o700, exist_ok=True)
+    FILE_HANDLE_ = os.open(TEMP_FILE_, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+    with os.fdopen(FILE_HANDLE_, mode='w') as FILE_OBJECT_:
+      json.dump(SAVED_SESSIONS_, FILE_OBJECT_)
+    os.replace(TEMP_FILE_, SESSION_FILE_)
+    return True
+  except OSError as FILE_ERROR_:
+    if ARGS_.d:
+      print('Unable to save sessions in ' + SESSION_FILE_ + ' (' +
+        str(FILE_ERROR_) + ')')
+    return False
+
+#######################################################################
+# Function: suma_login_func                                           #
+# Local Variables: CACHE_ID_ = Index of this session in SESSION_FILE_ #
+#                  SAVED_SESSIONS_ = Contents of SESSION_FILE_        #
+#                  SAVED_ENTRY_ = Saved session for this SUMA, if any #
+#                  SUMA_KEY_ = Session key to be returned             #
+#                  KEY_SAVED_ = If the key is held in SESSION_FILE_   #
+# Global Variables: ARGS_, CREDENTIALS_, SESSION_TTL_,                #
+#                   ACTIVE_SESSIONS_, SESSION_LOCK_                   #
+#######################################################################
+def suma_login_func(SUMA_CLIENT_, MANAGER_URL_):
+  '''
+  Obtain a session key for a SUMA, re-using a saved one if the SUMA
+    still accepts it, and otherwise logging in (and saving the new key)
+    Arguments: SUMA_CLIENT_ - XMLRPC ServerProxy for the SUMA
+               MANAGER_URL_ - URL of the SUMA XMLRPC API
+    Returns: The session key
+  '''
+  CACHE_ID_ = MANAGER_URL_ + ' ' + CREDENTIALS_['MANAGER_LOGIN']
+  SUMA_KEY_ = None
+  KEY_SAVED_ = False
+
+  with SESSION_LOCK_:
+    SAVED_ENTRY_ = read_sessions_func().get(CACHE_ID_)
+  if (SAVED_ENTRY_ is not None) and (time.time() - SAVED_ENTRY_['saved'] < SESSION_TTL_):
+    # Asking for the details of my own login is about the cheapest
+    #   call that proves the key is still good
+    try:
+      SUMA_CLIENT_.user.getDetails(SAVED_ENTRY_['key'], CREDENTIALS_['MANAGER_LOGIN'])
+      SUMA_KEY_ = SAVED_ENTRY_['key']
+      KEY_SAVED_ = True
+      if ARGS_.d:
+        print('Re-using saved session for ' + MANAGER_URL_)
+    except xc.Fault:
+      if ARGS_.d:
+        print('Saved session for ' + MANAGER_URL_ + ' is no longer valid')
+
+  if SUMA_KEY_ is None:
+    # Authenticate to the SUMA - I get back what amounts to a key that
+    #       I'll attach to our subsequent queries so SUMA recognizes
+    #       this tool as authenticated
+    SUMA_KEY_ = SUMA_CLIENT_.auth.login(CREDENTIALS_['MANAGER_LOGIN'], CREDENTIALS_['MANAGER_PASSWORD'])
+    # Save it for later invocations (unless I'll be logging out)
+    if not ARGS_.logout:
+      with SESSION_LOCK_:
+        SAVED_SESSIONS_ = read_sessions_func()
+        SAVED_SESSIONS_[CACHE_ID_] = { 'key': SUMA_KEY_, 'saved': time.time() }
+        KEY_SAVED_ = write_sessions_func(SAVED_SESSIONS_)
+
+  with SESSION_LOCK_:
+    ACTIVE_SESSIONS_[MANAGER_URL_] = { 'key': SUMA_KEY_, 'saved': KEY_SAVED_ }
+  return SUMA_KEY_
+
+#######################################################################
+# Function: suma_logout_func                                          #
+# Local Variables: SAVED_SESSIONS_ = Contents of SESSION_FILE_        #
+#                  THIS_URL_ = URL of the SUMA being logged out of    #
+#                  THIS_SESSION_ = Entry from ACTIVE_SESSIONS_        #
+# Global Variables: ARGS_, CREDENTIALS_, ACTIVE_SESSIONS_             #
+#######################################################################
+def suma_logout_func():
+  '''
+  Exit Handler - log out, exactly once, of every SUMA session used by
+    this invocation that is not being kept for re-use (with --logout,
+    that is all of them, and they are also removed from SESSION_FILE_)
+    Arguments: None
+    Returns: N/A
+  '''
+  if ARGS_.logout:
+    SAVED_SESSIONS_ = read_sessions_func()
+    for THIS_URL_ in ACTIVE_SESSIONS_:
+      SAVED_SESSIONS_.pop(THIS_URL_ + ' ' + CREDENTIALS_['MANAGER_LOGIN'], None)
+    write_sessions_func(SAVED_SESSIONS_)
+
+  for THIS_URL_, THIS_SESSION_ in ACTIVE_SESSIONS_.items():
+    if THIS_SESSION_['saved'] and not ARGS_.logout:
+      continue
+    if ARGS_.d:
+      print('Logging out of ' + THIS_URL_)
+    # What I'm really doing is telling the SUMA to no longer accept
+    #   my key as valid
+    try:
+      xc.ServerProxy(THIS_URL_, verbose=0).auth.logout(THIS_SESSION_['key'])
+    except (xc.Fault, xc.ProtocolError, socket.error, http.client.HTTPException):
+      pass
+
+#######################################################################
+# Function: collect_suma_func                                         #
+# Local Variables: MANAGER_URL_ = URL of the SUMA XMLRPC API          #
+#                  SUMA_CLIENT_ = XMLRPC ServerProxy for the SUMA     #
+#                  SUMA_KEY_ = Authentication key from the SUMA       #
+#                  REGISTERED_HOSTS_ = List of host records           #
+#                  KERNEL_BATCHES_ = Kernel lookups being made        #
+#                  REMOVED_HOSTS_ = Snapshot rows no longer present   #
+# Global Variables: ARGS_, SUMAS_                                     #
+#######################################################################
+def collect_suma_func(DC_NAME_, NEED_KERNELS_, SNAPSHOT_=None):
+  '''
+  Retrieve the registered hosts from the SUMA of one Data Center;
+  runs in a worker thread, so it uses its own ServerProxy and session
+  and does not print anything other than debugging messages
+    Arguments: DC_NAME_ - Data Center whose SUMA is contacted (a key
+                 of SUMAS_)
+               NEED_KERNELS_ - If True, also start retrieving the
+                 running kernel of each host
+               SNAPSHOT_ - Dictionary from load_snapshot_func (only
+                 with --delta; None otherwise, or if there is none)
+    Returns: A tuple of the List of host records (as returned by
+               system.listSystems), sorted by host name, the List from
+               start_kernel_fetch_func (None if NEED_KERNELS_ is
+               False), and the List of snapshot rows of hosts no longer
+               registered (None if there is no SNAPSHOT_)
+  '''
+  MANAGER_URL_ = "http://" + SUMAS_[DC_NAME_] + "/rpc/api"
+  if ARGS_.d:
+    print('MANAGER_URL_ for ' + DC_NAME_ + ' is ' + MANAGER_URL_)
+  # Create an XMLRPC object - this translates between conformable
+  #   Python objects and XML
+  SUMA_CLIENT_ = xc.ServerProxy(MANAGER_URL_, verbose=0)
+  # Get an authenticated session with the SUMA (re-using a saved one
+  #   if possible)
+  SUMA_KEY_ = suma_login_func(SUMA_CLIENT_, MANAGER_URL_)
+
+  # Get a list of all systems registered in the SUMA
+  REGISTERED_HOSTS_ = SUMA_CLIENT_.system.listSystems(SUMA_KEY_)
+
+  # Sort by name so the listing is the same from one run to the next,
+  #   no matter what order the SUMA returned the hosts in
+  REGISTERED_HOSTS_.sort(key=lambda THIS_HOST_: THIS_HOST_['name'])
+  # Convert the timestamps of every host, once
+  decode_hosts_func(REGISTERED_HOSTS_)
+
+  # Compare against the snapshot, so only the kernels that may have
+  #   changed are looked up
+  REMOVED_HOSTS_ = None
+  if SNAPSHOT_ is not None:
+    REMOVED_HOSTS_ = delta_hosts_func(REGISTERED_HOSTS_, SNAPSHOT_)
+
+  # Start retrieving the running kernel of every host, in batches,
+  #   rather than making one round trip per host; the results are
+  #   picked up while the listing is written
+  KERNEL_BATCHES_ = None
+  if NEED_KERNELS_:
+    KERNEL_BATCHES_ = start_kernel_fetch_func(MANAGER_URL_, SUMA_KEY_, REGISTERED_HOSTS_)
+
+  return (REGISTERED_HOSTS_, KERNEL_BATCHES_, REMOVED_HOSTS_)
+
+#######################################################################
+# Function: hostname_error_func                                       #
+# Local Variables: None                                               #
+# Global Variables: None                                              #
+#######################################################################
+def hostname_error_func(HOST_NAME_):
+  '''
+  Check a host name against the naming convention
+    Arguments: HOST_NAME_ - Short host name to check
+    Returns: None if the name is valid; otherwise a tuple of the letter
+               identifying the failed check and the offending part of
+               the name, for use in the FATAL ERROR message
+  '''
+  # Must be 13 characters, no more or less
+  if len(HOST_NAME_) != 13:
+    return ('A', 'length')
+  # First two must be 'at' or 'bt'
+  if (HOST_NAME_[0:2] != 'at') and (HOST_NAME_[0:2] != 'bt'):
+    return ('B', HOST_NAME_[0:2])
+  # The 5th and 6th characters must be 'sn'
+  if HOST_NAME_[4:6] != 'sn':
+    return ('C', HOST_NAME_[4:6])
+  # The 7th and 8th characters must be 'm0'
+  if HOST_NAME_[6:8] != 'm0':
+    return ('D', HOST_NAME_[6:8])
+  return None
+
+#######################################################################
+# Function: hostname_dc_func                                          #
+# Local Variables: None                                               #
+# Global Variables: None                                              #
+#######################################################################
+def hostname_dc_func(HOST_NAME_):
+  '''
+  Determine the Data Center whose SUMA a host is registered to, based
+    on the first character of its (valid) name
+    Arguments: HOST_NAME_ - Short host name
+    Returns: A key of SUMAS_
+  '''
+  if HOST_NAME_[0:1] == 'a':
+    return 'DC1'
+  return 'DC2'
+
+#######################################################################
+# Function: open_inventory_func                                       #
+# Local Variables: INVENTORY_DB_ = SQLite connection object           #
+# Global Variables: ARGS_, INVENTORY_FILE_                            #
+#######################################################################
+def open_inventory_func():
+  '''
+  Open (creating if needed) the local host inventory database; if the
+    file can not be used (for example, no write access to its
+    directory), an in-memory database is used so the rest of the tool
+    works the same way, just without anything being kept between runs
+    Arguments: None
+    Returns: An sqlite3 Connection object
+  '''
+  try:
+    os.makedirs(os.path.dirname(INVENTORY_FILE_), mode=0o755, exist_ok=True)
+    # Wait (rather than fail) if another copy of this tool is in the
+    #   middle of refreshing the inventory
+    INVENTORY_DB_ = sqlite3.connect(INVENTORY_FILE_, timeout=30)
+    # Write-Ahead Logging lets readers continue while a refresh is
+    #   being written
+    INVENTORY_DB_.execute('PRAGMA journal_mode=WAL')
+  except (OSError, sqlite3.Error) as DB_ERROR_:
+    if ARGS_.d:
+      print('Unable to use ' + INVENTORY_FILE_ + ' (' + str(DB_ERROR_) +
+        '), using an in-memory inventory')
+    INVENTORY_DB_ = sqlite3.connect(':memory:')
+
+  # One row per registered host; timestamps are in Epoch format
+  INVENTORY_DB_.execute('CREATE TABLE IF NOT EXISTS hosts (dc TEXT, id INTEGER, '
+    'name TEXT, fqdn TEXT, last_checkin INTEGER, last_boot INTEGER, kernel TEXT, '
+    'PRIMARY KEY (dc, id))')
+  INVENTORY_DB_.execute('CREATE INDEX IF NOT EXISTS hosts_name ON hosts (name)')
+  # When the hosts of each Data Center were last refreshed
+  INVENTORY_DB_.execute('CREATE TABLE IF NOT EXISTS refresh (dc TEXT PRIMARY KEY, '
+    'refreshed REAL)')
+  # The snapshot --delta compares against: the hosts as of the last
+  #   full listing, and the latest checkin (in Epoch format) among
+  #   them; -c, -f and -n never change it
+  INVENTORY_DB_.execute('CREATE TABLE IF NOT EXISTS snapshot_hosts (dc TEXT, id INTEGER, '
+    'name TEXT, last_checkin INTEGER, last_boot INTEGER, kernel TEXT, '
+    'PRIMARY KEY (dc, id))')
+  INVENTORY_DB_.execute('CREATE TABLE IF NOT EXISTS snapshot (dc TEXT PRIMARY KEY, '
+    'last_checkin INTEGER)')
+  INVENTORY_DB_.commit()
+  return INVENTORY_DB_
+
+#######################################################################
+# Function: inventory_age_func                                        #
+# Local Variables: REFRESH_ROW_ = Row from the refresh table          #
+# Global Variables: None                                              #
+#######################################################################
+def inventory_age_func(INVENTORY_DB_, DC_NAME_):
+  '''
+  Determine how long ago the inventory of a Data Center was refreshed
+    Arguments: INVENTORY_DB_ - sqlite3 Connection object
+               DC_NAME_ - Data Center to check
+    Returns: The age in seconds, or None if there is no inventory
+  '''
+  REFRESH_ROW_ = INVENTORY_DB_.execute('SELECT refreshed FROM refresh WHERE dc = ?',
+    (DC_NAME_,)).fetchone()
+  if REFRESH_ROW_ is None:
+    return None
+  return time.time() - REFRESH_ROW_[0]
+
+#######################################################################
+# Function: store_inventory_func                                      #
+# Local Variables: SAVED_KERNELS_ = Last boot and kernel of the hosts #
+#                    already in the inventory, by host ID             #
+#                  SAVED_ROW_ = Saved last boot and kernel of a host  #
+#                  THIS_KERNEL_ = Kernel saved for the host           #
+#                  INVENTORY_ROWS_ = Rows to insert                   #
+# Global Variables: None                                              #
+#######################################################################
+def store_inventory_func(INVENTORY_DB_, DC_NAME_, REGISTERED_HOSTS_):
+  '''
+  Replace the inventory of a Data Center with freshly-collected host
+    records; this is done in a single transaction, so anyone reading
+    the database sees either the old inventory or the new one; a host
+    whose record has no kernel (-c, -f and -n do not look them up)
+    keeps the kernel already saved for it, as long as it has not
+    rebooted since
+    Arguments: INVENTORY_DB_ - sqlite3 Connection object
+               DC_NAME_ - Data Center the hosts belong to
+               REGISTERED_HOSTS_ - List of host records from
+                 collect_suma_func (already decoded)
+    Returns: N/A
+  '''
+  with INVENTORY_DB_:
+    SAVED_KERNELS_ = { THIS_ROW_[0]: THIS_ROW_[1:] for THIS_ROW_ in INVENTORY_DB_.execute(
+      'SELECT id, last_boot, kernel FROM hosts WHERE dc = ?', (DC_NAME_,)) }
+    INVENTORY_ROWS_ = []
+    for THIS_HOST_ in REGISTERED_HOSTS_:
+      THIS_KERNEL_ = THIS_HOST_.get('kernel')
+      SAVED_ROW_ = SAVED_KERNELS_.get(THIS_HOST_['id'])
+      if ((THIS_KERNEL_ is None) and (SAVED_ROW_ is not None) and
+        (SAVED_ROW_[0] == THIS_HOST_['boot_epoch'])):
+        THIS_KERNEL_ = SAVED_ROW_[1]
+      INVENTORY_ROWS_.append((DC_NAME_, THIS_HOST_['id'], THIS_HOST_['name'].split('.')[0],
+        THIS_HOST_['name'], THIS_HOST_['checkin_epoch'], THIS_HOST_['boot_epoch'],
+        THIS_KERNEL_))
+    INVENTORY_DB_.execute('DELETE FROM hosts WHERE dc = ?', (DC_NAME_,))
+    INVENTORY_DB_.executemany('INSERT INTO hosts VALUES (?, ?, ?, ?, ?, ?, ?)',
+      INVENTORY_ROWS_)
+    INVENTORY_DB_.execute('INSERT OR REPLACE INTO refresh VALUES (?, ?)',
+      (DC_NAME_, time.time()))
+
+#######################################################################
+# Function: store_snapshot_func                                       #
+# Local Variables: THIS_HOST_ = Host record being saved               #
+# Global Variables: None                                              #
+#######################################################################
+def store_snapshot_func(INVENTORY_DB_, DC_NAME_, REGISTERED_HOSTS_):
+  '''
+  Replace the --delta snapshot of a Data Center; only the full listing
+    does this, so the snapshot always holds the hosts (and kernels) as
+    of the last full listing, however often -c, -f and -n refresh the
+    inventory in between
+    Arguments: INVENTORY_DB_ - sqlite3 Connection object
+               DC_NAME_ - Data Center the hosts belong to
+               REGISTERED_HOSTS_ - List of host records from
+                 collect_suma_func, with their kernels
+    Returns: N/A
+  '''
+  with INVENTORY_DB_:
+    INVENTORY_DB_.execute('DELETE FROM snapshot_hosts WHERE dc = ?', (DC_NAME_,))
+    INVENTORY_DB_.executemany('INSERT INTO snapshot_hosts VALUES (?, ?, ?, ?, ?, ?)',
+      [(DC_NAME_, THIS_HOST_['id'], THIS_HOST_['name'].split('.')[0],
+        THIS_HOST_['checkin_epoch'], THIS_HOST_['boot_epoch'],
+        THIS_HOST_.get('kernel')) for THIS_HOST_ in REGISTERED_HOSTS_])
+    INVENTORY_DB_.execute('INSERT OR REPLACE INTO snapshot VALUES (?, ?)',
+      (DC_NAME_, max([THIS_HOST_['checkin_epoch'] for THIS_HOST_ in REGISTERED_HOSTS_],
+        default=0)))
+
+#######################################################################
+# Function: load_snapshot_func                                        #
+# Local Variables: WATERMARK_ROW_ = Row from the snapshot table       #
+# Global Variables: None                                              #
+#######################################################################
+def load_snapshot_func(INVENTORY_DB_, DC_NAME_):
+  '''
+  Read the previous snapshot of a Data Center from the inventory, as
+    saved by store_snapshot_func (this
+    is done before the SUMA workers start, since an sqlite3 Connection
+    can only be used by the thread that opened it)
+    Arguments: INVENTORY_DB_ - sqlite3 Connection object
+               DC_NAME_ - Data Center to read
+    Returns: None if there is no snapshot; otherwise a Dictionary
+               holding the 'watermark' and the 'hosts', a Dictionary
+               (indexed by host ID) of tuples of the name, last
+               checkin, last boot and kernel
+  '''
+  WATERMARK_ROW_ = INVENTORY_DB_.execute('SELECT last_checkin FROM snapshot WHERE dc = ?',
+    (DC_NAME_,)).fetchone()
+  if WATERMARK_ROW_ is None:
+    return None
+  return { 'watermark': WATERMARK_ROW_[0],
+    'hosts': { THIS_ROW_[0]: THIS_ROW_[1:] for THIS_ROW_ in INVENTORY_DB_.execute(
+      'SELECT id, name, last_checkin, last_boot, kernel FROM snapshot_hosts WHERE dc = ?',
+      (DC_NAME_,)) } }
+
+#######################################################################
+# Function: delta_hosts_func                                          #
+# Local Variables: SAVED_HOSTS_ = Snapshot rows, by host ID           #
+#                  SAVED_ROW_ = Snapshot row of the host              #
+#                  CURRENT_IDS_ = IDs of the hosts registered now     #
+# Global Variables: ARGS_, DELTA_COLUMN_, UNKNOWN_KERNEL_              #
+#######################################################################
+def delta_hosts_func(REGISTERED_HOSTS_, SNAPSHOT_):
+  '''
+  Compare freshly-collected (and decoded) host records against the
+    snapshot; a host whose last boot has not moved is still running
+    the kernel the snapshot holds, so that kernel is copied into its
+    record (and it will not be looked up); every record gets a
+    DELTA_COLUMN_ of "added", "rebooted" or empty
+    Arguments: REGISTERED_HOSTS_ - List of host records
+               SNAPSHOT_ - Dictionary from load_snapshot_func
+    Returns: A List of the snapshot rows (name, last checkin, last
+               boot, kernel) of hosts that are no longer registered
+  '''
+  SAVED_HOSTS_ = SNAPSHOT_['hosts']
+  CURRENT_IDS_ = set()
+  for THIS_HOST_ in REGISTERED_HOSTS_:
+    CURRENT_IDS_.add(THIS_HOST_['id'])
+    SAVED_ROW_ = SAVED_HOSTS_.get(THIS_HOST_['id'])
+    if SAVED_ROW_ is None:
+      THIS_HOST_[DELTA_COLUMN_] = 'added'
+    elif SAVED_ROW_[2] != THIS_HOST_['boot_epoch']:
+      THIS_HOST_[DELTA_COLUMN_] = 'rebooted'
+    else:
+      THIS_HOST_[DELTA_COLUMN_] = ''
+      # A kernel that could not be retrieved is looked up again
+      if SAVED_ROW_[3] not in (None, UNKNOWN_KERNEL_):
+        THIS_HOST_['kernel'] = SAVED_ROW_[3]
+  if ARGS_.d:
+    print('Snapshot watermark is ' + str(SNAPSHOT_['watermark']) + '; ' +
+      str(sum(1 for THIS_HOST_ in REGISTERED_HOSTS_
+        if THIS_HOST_['checkin_epoch'] > SNAPSHOT_['watermark'])) +
+      ' hosts checked in since')
+  return [SAVED_ROW_ for THIS_ID_, SAVED_ROW_ in sorted(SAVED_HOSTS_.items(),
+    key=lambda THIS_ITEM_: THIS_ITEM_[1][0]) if THIS_ID_ not in CURRENT_IDS_]
+
 #################
 # Program Start #
 #################
@@ -116,7 +1072,14 @@ HELP_TEXT_=(DESC_TEXT_+"\n \n\t"+ANSI_.BOLD_TEXT+"Usage:"+ANSI_.ALL_OFF+
   " %(prog)s "+ANSI_.BOLD_TEXT+"-c"+ANSI_.BLUE_BLACK+" <HOSTNAME>"+
   ANSI_.ALL_OFF+" [ "+ANSI_.BOLD_TEXT+"-d"+ANSI_.ALL_OFF+" ] | "+
   ANSI_.BOLD_TEXT+"-n"+ANSI_.ALL_OFF+" [ "+ANSI_.BOLD_TEXT+"-d"+
-  ANSI_.ALL_OFF+" ] | "+ANSI_.BOLD_TEXT+"-h"+ANSI_.ALL_OFF)
+  ANSI_.ALL_OFF+" ] | [ "+ANSI_.BOLD_TEXT+"-o"+ANSI_.BLUE_BLACK+" <FORMAT>"+ANSI_.ALL_OFF+
+  " ] [ "+ANSI_.BOLD_TEXT+"--sort"+ANSI_.BLUE_BLACK+" <FIELD>"+ANSI_.ALL_OFF+
+  " ] [ "+ANSI_.BOLD_TEXT+"--delta"+ANSI_.ALL_OFF+" ] [ "+ANSI_.BOLD_TEXT+"-b"+ANSI_.BLUE_BLACK+" <SIZE>"+
+  ANSI_.ALL_OFF+" ] [ "+ANSI_.BOLD_TEXT+"--fetch-workers"+ANSI_.BLUE_BLACK+" <COUNT>"+
+  ANSI_.ALL_OFF+" ] [ "+ANSI_.BOLD_TEXT+"--rate"+ANSI_.BLUE_BLACK+" <PER_SECOND>"+
+  ANSI_.ALL_OFF+" ] [ "+ANSI_.BOLD_TEXT+"--workers"+ANSI_.BLUE_BLACK+" <COUNT>"+
+  ANSI_.ALL_OFF+" ] [ "+ANSI_.BOLD_TEXT+"--logout"+ANSI_.ALL_OFF+" ] [ "+ANSI_.BOLD_TEXT+"-d"+ANSI_.ALL_OFF+" ] | "+
+  ANSI_.BOLD_TEXT+"-h"+ANSI_.ALL_OFF)
 EPILOG_TEXT_=("\tIf no command-line parameters are given, a full listing of all hosts from both DCs is displayed\n"+
   "\t"+ANSI_.BOLD_TEXT+"SuSE Manager Login ID is "+ANSI_.BLUE_BLACK+
   CREDENTIALS_['MANAGER_LOGIN']+ANSI_.ALL_OFF+"\n \n")
@@ -127,16 +1090,36 @@ EPILOG_TEXT_=("\tIf no command-line parameters are given, a full listing of all
 #   formatter_class=argparse.RawTextHelpFormatter - Allows me to control
 #                               help screen formatting
 COMMAND_LINE_ = argparse.ArgumentParser(usage=argparse.SUPPRESS,description=HELP_TEXT_,epilog=EPILOG_TEXT_,formatter_class=argparse.RawTextHelpFormatter,add_help=True)
+COMMAND_LINE_.add_argument('-b',action='store',type=int,default=KERNEL_BATCH_SIZE_,metavar=ANSI_.BOLD_TEXT+'<SIZE>'+ANSI_.ALL_OFF+'\t\t\tNumber of running kernel lookups sent in each XMLRPC multicall',help='\tOnly used for the full listing (default is '+ANSI_.BOLD_TEXT+str(KERNEL_BATCH_SIZE_)+ANSI_.ALL_OFF+')')
 COMMAND_LINE_.add_argument('-c',action='store',default='',metavar=ANSI_.BOLD_TEXT+'<HOSTNAME>'+ANSI_.ALL_OFF+'\t\tQuery if a specific host is registered (use the "m" name, for example '+ANSI_.BOLD_TEXT+'axdcsnm0abc00' + ANSI_.ALL_OFF + ')',help='\tWrites to ' + ANSI_.BOLD_TEXT + 'stdout' + ANSI_.ALL_OFF + ' a positive integer equal to the number of seconds since last\n\tcheck-in; or '+ANSI_.BOLD_TEXT+'0'+ANSI_.ALL_OFF+' if the host is not registered or a problem occurred')
+COMMAND_LINE_.add_argument('--delta',action='store_true',help='Only look up the running kernels of hosts that are new or rebooted since the\n\tlast snapshot (in the local inventory), and report hosts added, rebooted and removed\n\tOnly used for the full listing')
 COMMAND_LINE_.add_argument('-d',action='store_true',help='Enable debugging messages to '+ANSI_.BOLD_TEXT+'stdout'+ANSI_.ALL_OFF)
+COMMAND_LINE_.add_argument('-f',action='store',default='',metavar=ANSI_.BOLD_TEXT+'<FILE>'+ANSI_.ALL_OFF+'\t\tQuery a list of host names, one per line, read from '+ANSI_.BOLD_TEXT+'<FILE>'+ANSI_.ALL_OFF+' (use '+ANSI_.BOLD_TEXT+'-'+ANSI_.ALL_OFF+' for '+ANSI_.BOLD_TEXT+'stdin'+ANSI_.ALL_OFF+')',help='\tWrites to ' + ANSI_.BOLD_TEXT + 'stdout' + ANSI_.ALL_OFF + ' one line per host name, holding the name, a TAB, and the value\n\tthat '+ANSI_.BOLD_TEXT+'-c'+ANSI_.ALL_OFF+' would give for that name\n\t(Conflicts with '+ANSI_.BOLD_TEXT+'-c'+ANSI_.ALL_OFF+' and '+ANSI_.BOLD_TEXT+'-n'+ANSI_.ALL_OFF+')')
+COMMAND_LINE_.add_argument('--logout',action='store_true',help='Log out of the SUMA(s) at exit instead of saving the session for re-use\n\t(also discards any saved sessions for the SUMA(s) contacted)')
+COMMAND_LINE_.add_argument('--max-age',action='store',type=int,default=INVENTORY_TTL_,metavar=ANSI_.BOLD_TEXT+'<SECONDS>'+ANSI_.ALL_OFF+'\t\tMaximum age of the local inventory used to answer '+ANSI_.BOLD_TEXT+'-c'+ANSI_.ALL_OFF+', '+ANSI_.BOLD_TEXT+'-f'+ANSI_.ALL_OFF+' and '+ANSI_.BOLD_TEXT+'-n'+ANSI_.ALL_OFF,help='\tDefault is '+ANSI_.BOLD_TEXT+str(INVENTORY_TTL_)+ANSI_.ALL_OFF+'; '+ANSI_.BOLD_TEXT+'0'+ANSI_.ALL_OFF+' always contacts the SUMA')
 COMMAND_LINE_.add_argument('-n',action='store_true',help='Write a list of all hosts registered (in both Data Centers) to '+ANSI_.BOLD_TEXT+'stdout'+ANSI_.ALL_OFF+'\n\t(Conflicts with '+ANSI_.BOLD_TEXT+'-c'+ANSI_.ALL_OFF+')')
+COMMAND_LINE_.add_argument('-o',action='store',default='text',choices=['text','csv','ndjson'],metavar=ANSI_.BOLD_TEXT+'<FORMAT>'+ANSI_.ALL_OFF+'\t\tFormat of the full listing: '+ANSI_.BOLD_TEXT+'text'+ANSI_.ALL_OFF+' (the default), '+ANSI_.BOLD_TEXT+'csv'+ANSI_.ALL_OFF+' or '+ANSI_.BOLD_TEXT+'ndjson'+ANSI_.ALL_OFF,help='\tWith '+ANSI_.BOLD_TEXT+'csv'+ANSI_.ALL_OFF+' and '+ANSI_.BOLD_TEXT+'ndjson'+ANSI_.ALL_OFF+', times are in Epoch format and nothing else is written')
+COMMAND_LINE_.add_argument('--sort',action='store',default='name',choices=list(SORT_FIELDS_),metavar=ANSI_.BOLD_TEXT+'<FIELD>'+ANSI_.ALL_OFF+'\t\tOrder each Data Center of the full listing by '+ANSI_.BOLD_TEXT+'name'+ANSI_.ALL_OFF+' (the default),\n\t\t\t'+ANSI_.BOLD_TEXT+'checkin'+ANSI_.ALL_OFF+', '+ANSI_.BOLD_TEXT+'boot'+ANSI_.ALL_OFF+' or '+ANSI_.BOLD_TEXT+'kernel'+ANSI_.ALL_OFF,help='\tAnything other than '+ANSI_.BOLD_TEXT+'name'+ANSI_.ALL_OFF+' waits for all of the kernel lookups of a Data Center')
+COMMAND_LINE_.add_argument('--fetch-workers',action='store',type=int,default=FETCH_WORKERS_,metavar=ANSI_.BOLD_TEXT+'<COUNT>'+ANSI_.ALL_OFF+'\tMaximum number of kernel batches fetched from each SUMA at the same time',help='\tOnly used for the full listing (default is '+ANSI_.BOLD_TEXT+str(FETCH_WORKERS_)+ANSI_.ALL_OFF+')')
+COMMAND_LINE_.add_argument('--rate',action='store',type=float,default=FETCH_RATE_,metavar=ANSI_.BOLD_TEXT+'<PER_SECOND>'+ANSI_.ALL_OFF+'\tMaximum number of kernel fetch requests per second sent to each SUMA',help='\tDefault is '+ANSI_.BOLD_TEXT+str(FETCH_RATE_)+ANSI_.ALL_OFF+'; '+ANSI_.BOLD_TEXT+'0'+ANSI_.ALL_OFF+' removes the limit')
+COMMAND_LINE_.add_argument('--workers',action='store',type=int,default=len(SUMAS_),metavar=ANSI_.BOLD_TEXT+'<COUNT>'+ANSI_.ALL_OFF+'\t\tMaximum number of SUMAs contacted at the same time',help='\tDefault is '+ANSI_.BOLD_TEXT+str(len(SUMAS_))+ANSI_.ALL_OFF+' (all of them); '+ANSI_.BOLD_TEXT+'1'+ANSI_.ALL_OFF+' contacts them one after the other')
 # Parse the command-line based on the added arguments
 ARGS_=COMMAND_LINE_.parse_args()
 
 if ARGS_.d:
+  print("ARGS_.b is " + str(ARGS_.b))
   print("ARGS_.c is " + ARGS_.c)
   print("ARGS_.d is " + str(ARGS_.d))
+  print("ARGS_.delta is " + str(ARGS_.delta))
+  print("ARGS_.f is " + ARGS_.f)
   print("ARGS_.n is " + str(ARGS_.n))
+  print("ARGS_.o is " + ARGS_.o)
+  print("ARGS_.fetch_workers is " + str(ARGS_.fetch_workers))
+  print("ARGS_.logout is " + str(ARGS_.logout))
+  print("ARGS_.max_age is " + str(ARGS_.max_age))
+  print("ARGS_.rate is " + str(ARGS_.rate))
+  print("ARGS_.sort is " + ARGS_.sort)
+  print("ARGS_.workers is " + str(ARGS_.workers))
 
 # Validate command-line options
 # The -n and -c arguments conflict (checked first so I don't waste time
@@ -148,6 +1131,48 @@ if (ARGS_.c != '') and (ARGS_.n):
     ANSI_.ALL_OFF+'\n')
   sys.exit(1)
 
+# The multicall batch size must be a positive number
+if ARGS_.b < 1:
+  print(DESC_TEXT_+'\n\n\t'+ANSI_.BOLD_TEXT+ANSI_.MAGENTA_BLACK+'FATAL ERROR: '+
+    ANSI_.RED_BLACK+'The '+ANSI_.YELLOW_BLACK+'-b'+ANSI_.RED_BLACK+
+    ' command-line parameter must be greater than zero'+ANSI_.ALL_OFF+'\n')
+  sys.exit(1)
+
+# There must be at least one worker fetching kernels, and the rate
+#   limit can not be negative
+if ARGS_.fetch_workers < 1:
+  print(DESC_TEXT_+'\n\n\t'+ANSI_.BOLD_TEXT+ANSI_.MAGENTA_BLACK+'FATAL ERROR: '+
+    ANSI_.RED_BLACK+'The '+ANSI_.YELLOW_BLACK+'--fetch-workers'+ANSI_.RED_BLACK+
+    ' command-line parameter must be greater than zero'+ANSI_.ALL_OFF+'\n')
+  sys.exit(1)
+if ARGS_.rate < 0:
+  print(DESC_TEXT_+'\n\n\t'+ANSI_.BOLD_TEXT+ANSI_.MAGENTA_BLACK+'FATAL ERROR: '+
+    ANSI_.RED_BLACK+'The '+ANSI_.YELLOW_BLACK+'--rate'+ANSI_.RED_BLACK+
+    ' command-line parameter can not be negative'+ANSI_.ALL_OFF+'\n')
+  sys.exit(1)
+
+# The inventory age limit can not be negative
+if ARGS_.max_age < 0:
+  print(DESC_TEXT_+'\n\n\t'+ANSI_.BOLD_TEXT+ANSI_.MAGENTA_BLACK+'FATAL ERROR: '+
+    ANSI_.RED_BLACK+'The '+ANSI_.YELLOW_BLACK+'--max-age'+ANSI_.RED_BLACK+
+    ' command-line parameter can not be negative'+ANSI_.ALL_OFF+'\n')
+  sys.exit(1)
+
+# There must be at least one worker to contact the SUMAs
+if ARGS_.workers < 1:
+  print(DESC_TEXT_+'\n\n\t'+ANSI_.BOLD_TEXT+ANSI_.MAGENTA_BLACK+'FATAL ERROR: '+
+    ANSI_.RED_BLACK+'The '+ANSI_.YELLOW_BLACK+'--workers'+ANSI_.RED_BLACK+
+    ' command-line parameter must be greater than zero'+ANSI_.ALL_OFF+'\n')
+  sys.exit(1)
+
+# The -f argument conflicts with both -c and -n
+if (ARGS_.f != '') and ((ARGS_.c != '') or (ARGS_.n)):
+  print(DESC_TEXT_+'\n\n\t'+ANSI_.BOLD_TEXT+ANSI_.MAGENTA_BLACK+'FATAL ERROR: '+
+    ANSI_.RED_BLACK+'The '+ANSI_.YELLOW_BLACK+'-f'+ANSI_.RED_BLACK+
+    ' command-line parameter conflicts with '+ANSI_.YELLOW_BLACK+'-c'+
+    ANSI_.RED_BLACK+' and '+ANSI_.YELLOW_BLACK+'-n'+ANSI_.ALL_OFF+'\n')
+  sys.exit(1)
+
 # Was -c specified?
 if ARGS_.c != '':
   # Yes, I need to validate the hostname
@@ -158,45 +1183,43 @@ if ARGS_.c != '':
     print("ARGS_.c[4:6] is " + ARGS_.c[4:6])
     print("ARGS_.c[6:8] is " + ARGS_.c[6:8])
 
-    # Must be 13 characters, no more or less
-    if len(ARGS_.c) != 13:
-      print(DESC_TEXT_+"\n\n\t"+ANSI_.BOLD_TEXT+ANSI_.MAGENTA_BLACK+"FATAL ERROR A: "+
-        ANSI_.ALL_OFF+ANSI_.BOLD_TEXT+ARGS_.c+ANSI_.RED_BLACK+
-        " is not a valid hostname (length)"+ANSI_.ALL_OFF+"\n")
-      sys.exit(1)
-    elif (ARGS_.c[0:2] != 'at') and (ARGS_.c[0:2] != 'bt'):
-      # First two must be 'at' or 'bt'
-      print(DESC_TEXT_+"\n\n\t"+ANSI_.BOLD_TEXT+ANSI_.MAGENTA_BLACK+"FATAL ERROR B: "+
-        ANSI_.ALL_OFF+ANSI_.BOLD_TEXT+ARGS_.c+ANSI_.RED_BLACK+" is not a valid hostname ("+
-        ARGS_.c[0:2]+")"+ANSI_.ALL_OFF+"\n")
-      sys.exit(1)
-    elif (ARGS_.c[4:6] != 'sn'):
-      # The 5th and 6th characters must be 'sn'
-      print(DESC_TEXT_+"\n\n\t"+ANSI_.BOLD_TEXT+ANSI_.MAGENTA_BLACK+
-        "FATAL ERROR C: "+ANSI_.ALL_OFF+ANSI_.BOLD_TEXT+ARGS_.c+
-        ANSI_.RED_BLACK+" is not a valid hostname ("+ARGS_.c[4:6]+
-        ")"+ANSI_.ALL_OFF+"\n")
-      sys.exit(1)
-    elif (ARGS_.c[6:8] != 'm0'):
-      # The 7th and 8th characters must be 'm0'
-      print(DESC_TEXT_+"\n\n\t"+ANSI_.BOLD_TEXT+ANSI_.MAGENTA_BLACK+
-        "FATAL ERROR D: "+ANSI_.ALL_OFF+ANSI_.BOLD_TEXT+ARGS_.c+
-        ANSI_.RED_BLACK+" is not a valid hostname ("+ARGS_.c[6:8]+
-        ")"+ANSI_.ALL_OFF+"\n")
+  HOSTNAME_ERROR_ = hostname_error_func(ARGS_.c)
+  if HOSTNAME_ERROR_ is not None:
+    print(DESC_TEXT_+"\n\n\t"+ANSI_.BOLD_TEXT+ANSI_.MAGENTA_BLACK+"FATAL ERROR "+
+      HOSTNAME_ERROR_[0]+": "+ANSI_.ALL_OFF+ANSI_.BOLD_TEXT+ARGS_.c+ANSI_.RED_BLACK+
+      " is not a valid hostname ("+HOSTNAME_ERROR_[1]+")"+ANSI_.ALL_OFF+"\n")
+    sys.exit(1)
+  SUMA_LIST_ = [ hostname_dc_func(ARGS_.c) ]
+elif ARGS_.f != '':
+  # Read the list of host names; blank lines are ignored
+  if ARGS_.f == '-':
+    QUERY_NAMES_ = [THIS_LINE_.strip() for THIS_LINE_ in sys.stdin]
+  else:
+    try:
+      with open(ARGS_.f, mode='r') as FILE_OBJECT_:
+        QUERY_NAMES_ = [THIS_LINE_.strip() for THIS_LINE_ in FILE_OBJECT_]
+    except OSError as FILE_ERROR_:
+      print(DESC_TEXT_+'\n\n\t'+ANSI_.BOLD_TEXT+ANSI_.MAGENTA_BLACK+'FATAL ERROR: '+
+        ANSI_.RED_BLACK+'Unable to read '+ANSI_.BLUE_BLACK+ARGS_.f+ANSI_.RED_BLACK+
+        ' ('+str(FILE_ERROR_)+')'+ANSI_.ALL_OFF+'\n')
       sys.exit(1)
-    else:
-      if ARGS_.c[0:1] == 'e':
-        SUMA_LIST_ = [ SUMAS_['DC1'] ]
-      else:
-        SUMA_LIST_ = [ SUMAS_['DC2'] ]
+  QUERY_NAMES_ = [THIS_NAME_ for THIS_NAME_ in QUERY_NAMES_ if THIS_NAME_ != '']
+  # Only contact the SUMAs that valid names belong to; an invalid name
+  #   is simply reported as "0", the same as an unregistered host
+  SUMA_LIST_ = []
+  for THIS_NAME_ in QUERY_NAMES_:
+    if hostname_error_func(THIS_NAME_) is None:
+      if hostname_dc_func(THIS_NAME_) not in SUMA_LIST_:
+        SUMA_LIST_.append(hostname_dc_func(THIS_NAME_))
+  SUMA_LIST_.sort()
 else:
-  SUMA_LIST_ = [ SUMAS_['DC1'] , SUMAS_['DC2'] ]
-  # If NOT invoked with -n, ID this tool
-  if not ARGS_.n:
+  SUMA_LIST_ = [ 'DC1' , 'DC2' ]
+  # If NOT invoked with -n, and the listing is plain text, ID this tool
+  if (not ARGS_.n) and (ARGS_.o == 'text'):
     print(DESC_TEXT_)
 
-# SUMA_LIST_ is now populated with the list of SUMAs the tool will
-#   be contacting
+# SUMA_LIST_ is now populated with the list of Data Centers whose SUMA
+#   the tool will be contacting
 
 # I'll be calculating time differences between the current system
 #   time and various timestamps I retrieve from SUMA - so get the
@@ -206,133 +1229,210 @@ if ARGS_.d:
   print("SUMA_LIST_ is " + str(SUMA_LIST_))
   print("_CURRENT_TIME is " + str(_CURRENT_TIME))
 
+# Register an exit handler that logs out of the SUMA sessions that
+#   are not being kept for re-use
+atexit.register(suma_logout_func)
+
+# Open the local inventory of registered hosts
+INVENTORY_DB_ = open_inventory_func()
+
+# The kernel lookups are only needed for the full listing, which
+#   always contacts the SUMAs; -c, -f and -n only contact the SUMAs
+#   whose inventory is missing or older than --max-age
+NEED_KERNELS_ = (not ARGS_.n) and (ARGS_.c == '') and (ARGS_.f == '')
+if NEED_KERNELS_:
+  COLLECT_LIST_ = SUMA_LIST_
+else:
+  COLLECT_LIST_ = []
+  for THIS_DC_ in SUMA_LIST_:
+    INVENTORY_AGE_ = inventory_age_func(INVENTORY_DB_, THIS_DC_)
+    if ARGS_.d:
+      print('Inventory age for ' + THIS_DC_ + ' is ' + str(INVENTORY_AGE_))
+    if (INVENTORY_AGE_ is None) or (INVENTORY_AGE_ > ARGS_.max_age):
+      COLLECT_LIST_.append(THIS_DC_)
+
+# With --delta, read the previous snapshot of each Data Center now,
+#   while still in the thread that opened the inventory
+SNAPSHOTS_ = dict()
+if NEED_KERNELS_ and ARGS_.delta:
+  for THIS_DC_ in COLLECT_LIST_:
+    SNAPSHOTS_[THIS_DC_] = load_snapshot_func(INVENTORY_DB_, THIS_DC_)
+    if ARGS_.d and (SNAPSHOTS_[THIS_DC_] is None):
+      print('No snapshot for ' + THIS_DC_ + ', every kernel will be looked up')
+
+# Collect the data from every SUMA that needs it before displaying
+#   anything; each SUMA is handled by its own worker (at most --workers
+#   at a time), so the wait is that of the slowest SUMA rather than the
+#   sum of all of them
+SUMA_RESULTS_ = dict()
+if COLLECT_LIST_:
+  with concurrent.futures.ThreadPoolExecutor(max_workers=ARGS_.workers) as SUMA_POOL_:
+    SUMA_FUTURES_ = { THIS_DC_: SUMA_POOL_.submit(collect_suma_func, THIS_DC_, NEED_KERNELS_,
+      SNAPSHOTS_.get(THIS_DC_)) for THIS_DC_ in COLLECT_LIST_ }
+    for THIS_DC_ in COLLECT_LIST_:
+      SUMA_RESULTS_[THIS_DC_] = SUMA_FUTURES_[THIS_DC_].result()
+      # Save what I collected for later invocations of -c and -n (the
+      #   full listing does this once it has the kernels)
+      if not NEED_KERNELS_:
+        store_inventory_func(INVENTORY_DB_, THIS_DC_, SUMA_RESULTS_[THIS_DC_][0])
+
+# If invoked with -f, build a hash index of the last checkin time of
+#   every host in the inventories involved, keyed by Data Center and
+#   short name, then answer every name from it; as with -c, each name
+#   is only looked for in the Data Center it belongs to, since the same
+#   short name can be registered in both
+if ARGS_.f != '':
+  CHECKIN_INDEX_ = dict()
+  for THIS_DC_ in SUMA_LIST_:
+    for (THIS_NAME_, THIS_CHECKIN_) in INVENTORY_DB_.execute(
+      'SELECT name, last_checkin FROM hosts WHERE dc = ?', (THIS_DC_,)):
+      CHECKIN_INDEX_[(THIS_DC_, THIS_NAME_)] = THIS_CHECKIN_
+  if ARGS_.d:
+    print('CHECKIN_INDEX_ holds ' + str(len(CHECKIN_INDEX_)) + ' hosts')
+  OUTPUT_LINES_ = []
+  for THIS_NAME_ in QUERY_NAMES_:
+    INDEX_KEY_ = (hostname_dc_func(THIS_NAME_), THIS_NAME_)
+    if (hostname_error_func(THIS_NAME_) is None) and (INDEX_KEY_ in CHECKIN_INDEX_):
+      OUTPUT_LINES_.append(THIS_NAME_ + '\t' +
+        str(int(_CURRENT_TIME - CHECKIN_INDEX_[INDEX_KEY_])))
+    else:
+      OUTPUT_LINES_.append(THIS_NAME_ + '\t0')
+  if OUTPUT_LINES_:
+    sys.stdout.write('\n'.join(OUTPUT_LINES_) + '\n')
+  sys.exit(0)
+
 # Create a flag to catch when -c has been matched
-#   If it gets set, then I need to exit both "for" loops
 HOST_MATCH_FOUND_ = 0
 
-# Cycle through list of SUMAs
-for SUMA_TARGET_ in SUMA_LIST_:
+# With "-o csv", the column names are written once, before any rows
+if NEED_KERNELS_ and (ARGS_.o == 'csv'):
+  if ARGS_.delta:
+    CSV_WRITER_ = csv.DictWriter(sys.stdout, fieldnames=CSV_COLUMNS_ + [ DELTA_COLUMN_ ])
+  else:
+    CSV_WRITER_ = csv.DictWriter(sys.stdout, fieldnames=CSV_COLUMNS_)
+  CSV_WRITER_.writeheader()
+
+# Cycle through the Data Centers in SUMA_LIST_ order, no matter which
+#   SUMA answered first, so the output is always in the same order
+for THIS_DC_ in SUMA_LIST_:
   if ARGS_.d:
-    print('SUMA_TARGET_ is ' + SUMA_TARGET_)
+    print('THIS_DC_ is ' + THIS_DC_)
 
-  MANAGER_URL_ = "http://" + SUMA_TARGET_ + "/rpc/api"
-  # Create an XMLRPC object - this translates between conformable
-  #   Python objects and XML
-  SUMA_CLIENT_ = xc.ServerProxy(MANAGER_URL_, verbose=0)
-  # Authenticate to the SUMA - I get back what amounts to a key that
-  #       I'll attach to our subsequent queries so SUMA recognizes this
-  #       tool as authenticated
-  # NOTE: This tool does not login to the SUMA, per se - that is, no
-  #       stateful session is created; as a result, using an Exit
-  #       Handler is not appropriate
-  SUMA_KEY_ = SUMA_CLIENT_.auth.login(CREDENTIALS_['MANAGER_LOGIN'], CREDENTIALS_['MANAGER_PASSWORD'])
+  # If invoked with -n, then write out the names from the inventory
+  #   and skip to the next Data Center
+  if ARGS_.n:
+    for (THIS_HOST_NAME_,) in INVENTORY_DB_.execute(
+      'SELECT name FROM hosts WHERE dc = ? ORDER BY fqdn', (THIS_DC_,)):
+      print(THIS_HOST_NAME_)
+    continue
 
-  # Get a list of all systems registered in the SUMA
-  REGISTERED_HOSTS_ = SUMA_CLIENT_.system.listSystems(SUMA_KEY_)
+  # If the tool was passed a host name to check against, then look
+  #   it up in the inventory and compute the seconds since it last
+  #   checked in
+  if ARGS_.c != '':
+    INVENTORY_ROW_ = INVENTORY_DB_.execute(
+      'SELECT last_checkin FROM hosts WHERE dc = ? AND name = ?',
+      (THIS_DC_, ARGS_.c)).fetchone()
+    if INVENTORY_ROW_ is not None:
+      SECONDS_SINCE_CHECKIN_ = int(_CURRENT_TIME - INVENTORY_ROW_[0])
+      HOST_MATCH_FOUND_ = 1
+      break
+    continue
 
-  # Counter for the number of host records I display
-  HOST_COUNTER_ = 0
+  # The full listing works from what was just collected, producing
+  #   the rows as the kernel lookups complete
+  (REGISTERED_HOSTS_, KERNEL_BATCHES_, REMOVED_HOSTS_) = SUMA_RESULTS_[THIS_DC_]
+  HOST_ROWS_ = sorted_rows_func(host_rows_func(KERNEL_BATCHES_),
+    SORT_FIELDS_[ARGS_.sort])
 
-  # If not invoked with -n and not invoked with -c, print header
-  if (not ARGS_.n) and (ARGS_.c == ''):
+  # With --delta, hosts that are gone since the snapshot follow the
+  #   rows of the hosts that are still registered
+  REMOVED_ROWS_ = []
+  if REMOVED_HOSTS_ is not None:
+    REMOVED_ROWS_ = [ { 'name': SAVED_ROW_[0], 'last_checkin': SAVED_ROW_[1],
+      'last_boot': SAVED_ROW_[2], 'kernel': SAVED_ROW_[3],
+      'seconds_since_checkin': int(_CURRENT_TIME - SAVED_ROW_[1]),
+      'stale': (_CURRENT_TIME - SAVED_ROW_[1]) > CHECKIN_LIMIT_,
+      'outdated_kernel': SAVED_ROW_[3] != LATEST_KERNEL_,
+      DELTA_COLUMN_: 'removed' } for SAVED_ROW_ in REMOVED_HOSTS_ ]
+
+  # Machine-readable output is just the rows, with no decoration
+  if ARGS_.o == 'csv':
+    for THIS_ROW_ in itertools.chain(HOST_ROWS_, REMOVED_ROWS_):
+      THIS_ROW_['dc'] = THIS_DC_
+      CSV_WRITER_.writerow(THIS_ROW_)
+  elif ARGS_.o == 'ndjson':
+    for THIS_ROW_ in itertools.chain(HOST_ROWS_, REMOVED_ROWS_):
+      THIS_ROW_['dc'] = THIS_DC_
+      sys.stdout.write(json.dumps(THIS_ROW_, sort_keys=True) + '\n')
+  else:
+    # Counter for the number of host records I display
+    HOST_COUNTER_ = 0
+
+    # Print the header for this Data Center
+    print("\n\t\t"+ANSI_.BOLD_TEXT+"Data Center: "+ANSI_.BLUE_BLACK+THIS_DC_+
+      ANSI_.ALL_OFF)
     print("\n\t\t"+ANSI_.BOLD_TEXT+ANSI_.GREEN_BLACK+
       "_Server_Name_\t__Last_Checkin__\t___Last_Boot____\t___System_Kernel______"+ANSI_.ALL_OFF)
 
-    # Loop through the records of registered hosts
-    for THIS_HOST_ in REGISTERED_HOSTS_:
-      # SUMA stores the long FQDN of the host
-      #   (e.g. atxusnm0abc00.blahblah.blah)
-      THIS_HOST_LONGNAME_ = THIS_HOST_['name']
-      # I only want the short name, so split the long name
-      THIS_HOST_NAME_ = THIS_HOST_LONGNAME_.split('.')[0]
-
-      # If invoked with -n, then write out the name and skip
-      #   to next host
-      if ARGS_.n:
-        print(THIS_HOST_NAME_)
-        continue
-
-      # Print a separator line every 5 lines (not with -n)
+    # Loop through the rows of registered hosts
+    for THIS_ROW_ in HOST_ROWS_:
+      THIS_HOST_NAME_ = THIS_ROW_['name']
+
+      # Print a separator line every 5 lines
       if (HOST_COUNTER_ != 0 and HOST_COUNTER_ % 5 == 0):
         print("\t\t" + 87* "-")
 
       if ARGS_.d:
-        print("THIS_HOST_LONGNAME_ is " + THIS_HOST_LONGNAME_)
         print("THIS_HOST_NAME_ is " + THIS_HOST_NAME_)
 
-      # Get a timestamp of the last time the host checked in
-      THIS_HOST_LAST_CHECKIN_ = THIS_HOST_['last_checkin']
-      # Get a timestamp of the last time the host was booted
-      THIS_HOST_LAST_BOOT_ = THIS_HOST_['last_boot']
       # Convert the last checkin and last boot timestamps into my
       #   preferred display format
-      CONVERTED_DATE_FRMT_CHECKIN_=datetime.datetime.strptime(str(THIS_HOST_LAST_CHECKIN_), DATE_FORMAT_)
-      CONVERTED_DATE_FRMT_BOOT_=datetime.datetime.strptime(str(THIS_HOST_LAST_BOOT_), DATE_FORMAT_)
+      THIS_HOST_LAST_CHECKIN_ = time.strftime("%m-%d-%Y %H:%M", time.localtime(THIS_ROW_['last_checkin']))
+      THIS_HOST_LAST_BOOT_ = time.strftime("%m-%d-%Y %H:%M", time.localtime(THIS_ROW_['last_boot']))
       # Get the running kernel version reported by the host
-      THIS_HOST_KERNEL_ = SUMA_CLIENT_.system.getRunningKernel(SUMA_KEY_, THIS_HOST_['id'])
-      # Convert the last checkin time to Epoch format so I can
-      #   compare it
-      EPOCH_LAST_CHECKIN_ = time.mktime(THIS_HOST_LAST_CHECKIN_.timetuple())
-      # Determine # of seconds since last checkin
-      SECONDS_SINCE_CHECKIN_ = int(_CURRENT_TIME - EPOCH_LAST_CHECKIN_)
-
-      # NOTE: Since when invoked with "-c" I provide the number of
-      #       seconds since last checkin, I test for match to the
-      #       host name *after* all the computation
-      # If the tool was passed a host name to check against, then
-      #       do so here - if the host doesn't match, then skip the
-      #       rest of the loop
-      if ARGS_.c != '':
-        if ARGS_.c != THIS_HOST_NAME_:
-          # No match - skip to next record
-          continue
-        else:
-          # Natch found - exit both loops by setting flag
-          HOST_MATCH_FOUND_ = 1
-          break
-
-      # If I get here, I'll be printing out the host info
+      THIS_HOST_KERNEL_ = THIS_ROW_['kernel']
 
       # If the time since last checkin exceeds to limit, add color
       #   to that output
-      if SECONDS_SINCE_CHECKIN_ > CHECKIN_LIMIT_:
+      if THIS_ROW_['stale']:
         THIS_HOST_LAST_CHECKIN_=(ANSI_.BOLD_TEXT+ANSI_.MAGENTA_BLACK+
-          CONVERTED_DATE_FRMT_CHECKIN_.strftime("%m-%d-%Y %H:%M")+ANSI_.ALL_OFF)
-      else:
-        THIS_HOST_LAST_CHECKIN_=CONVERTED_DATE_FRMT_CHECKIN_.strftime("%m-%d-%Y %H:%M")
+          THIS_HOST_LAST_CHECKIN_+ANSI_.ALL_OFF)
 
       # If the kernel version is not equal to the latest, add color
       #   to that output
-      if THIS_HOST_KERNEL_ != LATEST_KERNEL_:
+      if THIS_ROW_['outdated_kernel']:
         THIS_HOST_KERNEL_=(ANSI_.BOLD_TEXT+ANSI_.MAGENTA_BLACK+
           THIS_HOST_KERNEL_+ANSI_.ALL_OFF)
 
       # Print out the info for this host
       print("\t\t"+THIS_HOST_NAME_+"\t"+THIS_HOST_LAST_CHECKIN_+"\t"+
-        CONVERTED_DATE_FRMT_BOOT_.strftime("%m-%d-%Y %H:%M")+
-        "\t"+THIS_HOST_KERNEL_)
+        THIS_HOST_LAST_BOOT_+"\t"+THIS_HOST_KERNEL_)
 
       # Increment counter of records I've displayed
       HOST_COUNTER_ += 1
 
-      # Log out of the SUMA
-      # What I'm really doing is telling the SUMA to no longer accept
-      #   my key as valid
-      SUMA_CLIENT_.auth.logout(SUMA_KEY_)
-
-      # If invoked with -n, skip remainder of loop
-      if ARGS_.n:
-        continue
+    # Display total host entries printed out for this SUMA
+    print("\n\t\t"+ANSI_.BOLD_TEXT+"Server Count: "+ANSI_.ALL_OFF+
+      str(HOST_COUNTER_)+"\n")
 
-      # Am I exiting both loops?
-      if HOST_MATCH_FOUND_ == 1:
-        break
+    # With --delta, summarize what changed since the snapshot
+    if REMOVED_HOSTS_ is not None:
+      print("\t\t"+ANSI_.BOLD_TEXT+"Checked In Since Snapshot: "+ANSI_.ALL_OFF+
+        str(sum(1 for THIS_HOST_ in REGISTERED_HOSTS_
+          if THIS_HOST_['checkin_epoch'] > SNAPSHOTS_[THIS_DC_]['watermark'])))
+      for THIS_CHANGE_ in [ 'added', 'rebooted' ]:
+        CHANGED_NAMES_ = [ THIS_HOST_['name'].split('.')[0] for THIS_HOST_ in REGISTERED_HOSTS_
+          if THIS_HOST_[DELTA_COLUMN_] == THIS_CHANGE_ ]
+        print("\t\t"+ANSI_.BOLD_TEXT+THIS_CHANGE_.capitalize()+": "+ANSI_.ALL_OFF+
+          str(len(CHANGED_NAMES_))+"\t"+" ".join(CHANGED_NAMES_))
+      print("\t\t"+ANSI_.BOLD_TEXT+"Removed: "+ANSI_.ALL_OFF+str(len(REMOVED_ROWS_))+
+        "\t"+" ".join([ THIS_ROW_['name'] for THIS_ROW_ in REMOVED_ROWS_ ])+"\n")
 
-# Display total host entries printed out for this SUMA
-#   Only do this if not invoked with "-c"
-if ARGS_.c == '':
-  print("\n\t\t"+ANSI_.BOLD_TEXT+"Server Count: "+ANSI_.ALL_OFF+
-    str(HOST_COUNTER_)+"\n")
+  # Now that every kernel is known, save what I collected for later
+  #   invocations of -c and -n, and as the snapshot for --delta
+  store_inventory_func(INVENTORY_DB_, THIS_DC_, REGISTERED_HOSTS_)
+  store_snapshot_func(INVENTORY_DB_, THIS_DC_, REGISTERED_HOSTS_)
 
 # If invoked with -n, exit here
 if ARGS_.n:
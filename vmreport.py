@@ -31,14 +31,73 @@
 #       for individual Guests
 #   2) This tool exits with the following return codes:
 #       0 - If invoked WITHOUT the "-c" parameter, then the tool
-#           completed normally; if invoked WITH the "-c" parameter,
-#           then no VM was found with a matching name
+#           completed normally (this includes "-f"); if invoked WITH
+#           the "-c" parameter, then no VM was found with a matching
+#           name
 #       1 - The tool was invoked with "-c" and a VM was found
 #           matching the name provided
-#       252-254 - An invalid host name was provided with the "-c"
+#       251-254 - An invalid host name was provided with the "-c"
 #           parameter
 #       255 - Invalid command-line parameter combination
 #   3) Based in part on listallvms.py by sm
+#   4) The VM properties are retrieved with the PropertyCollector, for
+#       all VMs at once (RETRIEVE_PAGE_SIZE_ per round trip), and only
+#       the property paths listed in VM_COLUMNS_ are fetched; reading
+#       them through the VM objects instead would cost a round trip
+#       per property, per VM
+#   5) When more than one Data Center is listed, each vSphere is
+#       contacted by its own worker thread, with its own connection, so
+#       the wait is that of the slowest vSphere rather than the sum of
+#       all of them; the time each one took is shown with its counts
+#   6) "-c" does not retrieve the VM list; it is answered from a local
+#       cache of VM names (NAME_CACHE_FILE_) when that is no older than
+#       NAME_CACHE_TTL_ seconds (override with --max-age), otherwise by
+#       the vSphere search index (by DNS name), and only if that fails
+#       by retrieving just the names of every VM (which also refreshes
+#       the cache); "-f" checks a list of names (one per line, from a
+#       file or stdin) the same way, with one session per vSphere,
+#       writing one "<HOSTNAME><TAB><1|0>" line per name
+#   7) "--daemon" runs this tool as a long-running service: it keeps an
+#       inventory of every VM (with the properties the listing uses)
+#       current by waiting on vSphere property updates (only changes
+#       are sent once the first update is received), and answers
+#       requests on the Unix socket DAEMON_SOCKET_; while a daemon is
+#       running, the listing, "-c" and "-f" are answered by it (with no
+#       vSphere traffic at all), and only fall back to contacting the
+#       vSpheres for Data Centers it can not answer for
+#   8) "--save <FILE>" writes what the listing collected to a snapshot
+#       file (a JSON header followed by one array per column; see
+#       write_snapshot_func), "--from <FILE>" displays the listing
+#       (honoring -e and -w) from such a file instead of contacting
+#       anything, and "--diff <OLD> <NEW>" shows the VMs that appeared,
+#       disappeared or changed between two of them; a snapshot with a
+#       format version other than SNAPSHOT_VERSION_ is refused
+#   9) The session cookie of each vSphere login is kept (readable only
+#       by the user running the tool) in SESSION_CACHE_DIR_, and the
+#       session is left open at exit, so the next run (for example,
+#       from cron) reuses it rather than logging in again; a new login
+#       is made only when the vSphere no longer accepts the session
+#       (by default, vCenter ends sessions idle for 30 minutes)
+#  10) pyVmomi (and the other modules only needed to contact a vSphere)
+#       is imported by import_vsphere_func the first time a vSphere is
+#       contacted, so "-h", option errors and "-c"/"-f" answered from
+#       the name cache or the daemon do not pay for loading it;
+#       "--profile-startup" reports (on stderr) how long each phase of
+#       startup took
+#  11) "--fields <LIST>" adds columns (any of the keys of FIELD_COLUMNS_,
+#       separated by commas) to the listing; they are retrieved by the
+#       same PropertyCollector requests as the rest of the VM table,
+#       and only the property paths of the requested fields are asked
+#       for; the names of the ESXi hosts and datastores come along in
+#       the same requests (the listing then does not use the daemon,
+#       which only keeps the VM_COLUMNS_ properties)
+#  12) "--summary" displays, instead of the VMs, the VMs, vCPU and vRAM
+#       of each Data Center per power state, cluster and ESXi host,
+#       with the hardware (CPU threads and RAM) of the hosts, retrieved
+#       in the same requests, and the overcommit ratios of the vCPU and
+#       vRAM of the powered-on VMs to it; every VM is counted (unlike
+#       the listing, which skips FT copies and powered-off VMs); numpy
+#       is used for the sums when it is installed
 #
 # KNOWN BUGS:
 #   0) There is no error-handling for comm failures when attempting
@@ -51,10 +110,19 @@
 #   0) Explore handling comm issues that occur with VMware APIs
 #   1) Re-implement using vSphere REST interface
 #######################################################################
-TOOL_VERSION_ = '100'
+TOOL_VERSION_ = '109'
 #######################################################################
 # Change Log (Reverse Chronological Order)
 # Who When______ What__________________________________________________
+# dxb 2026-10-17 Add --summary (capacity and overcommit per cluster/host)
+# dxb 2026-10-17 Add --fields (host, datastores, storage, IP, uptime)
+# dxb 2026-10-17 Import pyVmomi only when needed; add --profile-startup
+# dxb 2026-10-17 Reuse saved vSphere sessions instead of logging in each run
+# dxb 2026-10-17 Add --save/--from snapshot files and --diff
+# dxb 2026-10-17 Add --daemon, kept current by WaitForUpdatesEx, on a socket
+# dxb 2026-10-17 Answer -c from a name cache/search index; add -f; fix DC pick
+# dxb 2026-10-17 Collect from the vSpheres concurrently, report time per DC
+# dxb 2026-10-17 Retrieve VM properties in bulk with the PropertyCollector
 # dxb 2024-01-14 I really need to use "pylint" more
 # dxb 2023-12-09 Sanitized and published to GitHub
 # sm  2020-01-14 Make the credentials into dictionary
@@ -66,6 +134,9 @@ TOOL_VERSION_ = '100'
 ##################
 # System-specific functions/parameters
 import sys
+# Timing of each vSphere, and of each phase of startup
+import time
+STARTUP_CLOCK_ = time.perf_counter()
 # OS-specific functions
 import os
 from os import system, name
@@ -76,14 +147,29 @@ import argparse
 import atexit
 # Low-level network functions
 import socket
-# TLS/SSL wrapper for socket objects
-import ssl
+# Local cache of VM names
+import sqlite3
+# Snapshot files
+import array
+import mmap
+import struct
+# The daemon and its Unix socket
+import json
+import signal
+import socketserver
+import threading
 
-# VMware-provided ESXi APIs
-from pyVmomi import vmodl
-from pyVmomi import vim
-from pyVim import connect
-from pyVim.connect import SmartConnect, Disconnect
+# VMware-provided ESXi APIs, the TLS/SSL wrapper for socket objects,
+#   and worker threads for contacting the vSpheres concurrently are
+#   imported by import_vsphere_func, only once a vSphere is actually
+#   going to be contacted (pyVmomi takes far longer to load than all of
+#   the rest of this tool)
+vmodl = None
+vim = None
+connect = None
+ssl = None
+concurrent = None
+IMPORTS_SECONDS_ = time.perf_counter() - STARTUP_CLOCK_
 
 # Declare a Class (instead of a dictionary or variable names)
 #   of ANSI codes for screen control and Colors for text output
@@ -122,24 +208,242 @@ CREDENTIALS_ = dict()
 CREDENTIALS_['USER'] = 'service_id'
 CREDENTIALS_['PASSWORD'] = 'password'
 
+# Columns of the VM table, and the VM property path each is
+#   retrieved from
+VM_COLUMNS_ = dict()
+VM_COLUMNS_['name'] = 'name'
+VM_COLUMNS_['power_state'] = 'runtime.powerState'
+VM_COLUMNS_['tools_status'] = 'guest.toolsStatus'
+VM_COLUMNS_['memory_mb'] = 'config.hardware.memoryMB'
+VM_COLUMNS_['num_cpu'] = 'config.hardware.numCPU'
+VM_COLUMNS_['ft_state'] = 'runtime.faultToleranceState'
+
+# Optional columns of the listing (--fields), and their property paths
+FIELD_COLUMNS_ = dict()
+FIELD_COLUMNS_['host'] = 'runtime.host'
+FIELD_COLUMNS_['datastores'] = 'datastore'
+FIELD_COLUMNS_['storage_gb'] = 'summary.storage.committed'
+FIELD_COLUMNS_['ip'] = 'guest.ipAddress'
+FIELD_COLUMNS_['uptime'] = 'summary.quickStats.uptimeSeconds'
+# Fields whose property is a reference (or list of references) to
+#   other managed objects, and the type of those objects; each
+#   reference is replaced by the name of the object
+FIELD_REFERENCES_ = dict()
+FIELD_REFERENCES_['host'] = 'HostSystem'
+FIELD_REFERENCES_['datastores'] = 'Datastore'
+
+# Columns of the host table (--summary), and their property paths
+HOST_COLUMNS_ = dict()
+HOST_COLUMNS_['name'] = 'name'
+HOST_COLUMNS_['cluster'] = 'parent'
+HOST_COLUMNS_['cpu_threads'] = 'summary.hardware.numCpuThreads'
+HOST_COLUMNS_['memory_mb'] = 'summary.hardware.memorySize'
+# What aggregate_vm_table_func sums, in order
+AGGREGATE_METRICS_ = ['vms', 'vms_on', 'vcpu', 'vram_mb', 'vcpu_on', 'vram_mb_on']
+
+# Columns retrieved when only the VM names are needed (-c and -f)
+NAME_COLUMNS_ = dict()
+NAME_COLUMNS_['name'] = 'name'
+
+# Maximum number of VMs returned by each PropertyCollector round trip
+RETRIEVE_PAGE_SIZE_ = 1000
+
+# Local database of VM names used to answer "-c" and "-f", and the
+#   maximum age (in seconds) of what it holds (override with --max-age)
+NAME_CACHE_FILE_ = '/var/cache/vmreport/names.db'
+NAME_CACHE_TTL_ = 300
+
+# How long each phase of startup took (--profile-startup), as a list
+#   of tuples of the phase and its seconds, and when the last one ended
+STARTUP_PHASES_ = []
+# Serializes import_vsphere_func between worker threads
+VSPHERE_IMPORT_LOCK_ = threading.Lock()
+
+# Directory holding the session cookie of each vSphere (one file per
+#   vSphere, mode 0600, in a directory of mode 0700)
+SESSION_CACHE_DIR_ = '/var/cache/vmreport/sessions'
+
+# Snapshot files start with SNAPSHOT_MAGIC_ and the version of their
+#   format, which changes whenever the layout does
+SNAPSHOT_MAGIC_ = b'VMRS'
+SNAPSHOT_VERSION_ = 1
+# How each column of the VM table is stored in a snapshot file: 'int'
+#   (32-bit integers), 'enum' (one byte per VM, plus the list of
+#   distinct values) or 'text' (the default)
+SNAPSHOT_KINDS_ = dict()
+SNAPSHOT_KINDS_['power_state'] = 'enum'
+SNAPSHOT_KINDS_['tools_status'] = 'enum'
+SNAPSHOT_KINDS_['ft_state'] = 'enum'
+SNAPSHOT_KINDS_['memory_mb'] = 'int'
+SNAPSHOT_KINDS_['num_cpu'] = 'int'
+SNAPSHOT_KINDS_['storage_gb'] = 'int'
+SNAPSHOT_KINDS_['uptime'] = 'int'
+
+# Unix socket the daemon (--daemon) answers requests on, how long each
+#   wait for vSphere updates lasts, how long to wait before reconnecting
+#   to a vSphere after a failure, and how long a client waits for an
+#   answer (all in seconds)
+DAEMON_SOCKET_ = '/run/vmreport/vmreport.sock'
+DAEMON_WAIT_SECONDS_ = 60
+DAEMON_RETRY_SECONDS_ = 30
+DAEMON_CLIENT_TIMEOUT_ = 2
+
+# Inventory kept by the daemon: the properties of each VM (by property
+#   path), by moref, by Data Center; only Data Centers whose inventory
+#   is current are present
+DAEMON_INVENTORY_ = dict()
+# Sets of the VM names of each Data Center, built when first needed
+#   after each change to its inventory
+DAEMON_NAMES_ = dict()
+# Serializes access to DAEMON_INVENTORY_ and DAEMON_NAMES_
+DAEMON_LOCK_ = threading.Lock()
+
 # Define how tool was invoked
 OUR_TOOL_ = os.path.realpath(__file__)
 
+#######################################################################
+# Function: note_startup_func                                         #
+# Local Variables: NOW_CLOCK_ = Current time                          #
+# Global Variables: STARTUP_CLOCK_, STARTUP_PHASES_                   #
+#######################################################################
+def note_startup_func(PHASE_NAME_):
+    """
+    Record how long a phase of startup took (since the previous phase)
+      Arguments: PHASE_NAME_ - Description of the phase that just ended
+      Returns: N/A
+    """
+    global STARTUP_CLOCK_
+    NOW_CLOCK_ = time.perf_counter()
+    STARTUP_PHASES_.append((PHASE_NAME_, NOW_CLOCK_ - STARTUP_CLOCK_))
+    STARTUP_CLOCK_ = NOW_CLOCK_
+
+#######################################################################
+# Function: print_startup_func                                        #
+# Local Variables: None                                               #
+# Global Variables: STARTUP_PHASES_                                   #
+#######################################################################
+def print_startup_func():
+    """
+    Display how long each phase of startup took (on stderr, so the
+    output of the tool itself is unchanged)
+      Arguments: None
+      Returns: N/A
+    """
+    note_startup_func('until exit')
+    for (THIS_PHASE_, THIS_SECONDS_) in STARTUP_PHASES_:
+      sys.stderr.write('%8.1f ms  %s\n' % (THIS_SECONDS_ * 1000, THIS_PHASE_))
+    sys.stderr.write('%8.1f ms  total (after interpreter startup)\n' %
+                     (sum(THIS_SECONDS_ for (THIS_PHASE_, THIS_SECONDS_) in STARTUP_PHASES_) * 1000))
+
+#######################################################################
+# Function: import_vsphere_func                                       #
+# Local Variables: None                                               #
+# Global Variables: vmodl, vim, connect, ssl, concurrent,             #
+#                   VSPHERE_IMPORT_LOCK_                              #
+#######################################################################
+def import_vsphere_func():
+    """
+    Import the modules needed to contact the vSpheres, the first time
+    this is called (later calls return at once)
+      Arguments: None
+      Returns: N/A
+    """
+    global vmodl, vim, connect, ssl, concurrent
+    with VSPHERE_IMPORT_LOCK_:
+      if vim is not None:
+        return
+      import ssl
+      import concurrent.futures
+      from pyVmomi import vmodl
+      from pyVim import connect
+      # Assigned last, since it is what tells other callers the imports
+      #   are done
+      from pyVmomi import vim
+      note_startup_func('vSphere API imports (pyVmomi, pyVim, ssl)')
+
+#######################################################################
+# Function: load_session_func                                         #
+# Local Variables: SESSION_FILE_ = File holding the session cookie    #
+#                  FILE_STATUS_ = Owner and mode of SESSION_FILE_     #
+#                  SAVED_SESSION_ = Contents of SESSION_FILE_         #
+# Global Variables: ARGS_, CREDENTIALS_, SESSION_CACHE_DIR_           #
+#######################################################################
+def load_session_func(VSPHERE_HOST_):
+    """
+    Read the session cookie saved by an earlier run for a vSphere; a
+    file that anyone other than its owner (who must be the user running
+    this tool) can read, or that was saved for another vSphere user,
+    is ignored
+      Arguments: VSPHERE_HOST_ - Hostname/IP of the target vSphere
+      Returns: The saved cookie, or None
+    """
+    SESSION_FILE_ = os.path.join(SESSION_CACHE_DIR_, VSPHERE_HOST_)
+    try:
+      with open(SESSION_FILE_, mode='r') as FILE_OBJECT_:
+        FILE_STATUS_ = os.fstat(FILE_OBJECT_.fileno())
+        if (FILE_STATUS_.st_uid != os.getuid()) or (FILE_STATUS_.st_mode & 0o077):
+          if ARGS_.d:
+            print('Ignoring '+SESSION_FILE_+', it is not private to this user')
+          return None
+        SAVED_SESSION_ = json.load(FILE_OBJECT_)
+    except (OSError, ValueError):
+      return None
+    if SAVED_SESSION_.get('user') != CREDENTIALS_['USER']:
+      return None
+    return SAVED_SESSION_.get('cookie')
+
+#######################################################################
+# Function: save_session_func                                         #
+# Local Variables: SESSION_FILE_ = File holding the session cookie    #
+#                  TEMP_FILE_ = File written, then renamed            #
+# Global Variables: ARGS_, CREDENTIALS_, SESSION_CACHE_DIR_           #
+#######################################################################
+def save_session_func(VSPHERE_HOST_, ESX_CONN_):
+    """
+    Save the session cookie of a vSphere connection, for later runs to
+    reuse; the file is created with mode 0600 and renamed into place,
+    so the cookie is never readable by anyone else, even briefly
+      Arguments: VSPHERE_HOST_ - Hostname/IP of the target vSphere
+                 ESX_CONN_ - Connection to the vSphere
+      Returns: True if the cookie was saved, False otherwise
+    """
+    SESSION_FILE_ = os.path.join(SESSION_CACHE_DIR_, VSPHERE_HOST_)
+    TEMP_FILE_ = SESSION_FILE_+'.'+str(os.getpid())+'.'+str(threading.get_ident())
+    try:
+      os.makedirs(SESSION_CACHE_DIR_, mode=0o700, exist_ok=True)
+      with os.fdopen(os.open(TEMP_FILE_, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600),
+                     mode='w') as FILE_OBJECT_:
+        json.dump({'user': CREDENTIALS_['USER'], 'cookie': ESX_CONN_._stub.cookie},
+                  FILE_OBJECT_)
+      os.replace(TEMP_FILE_, SESSION_FILE_)
+    except OSError as SESSION_ERROR_:
+      if ARGS_.d:
+        print('Unable to save the session in '+SESSION_FILE_+' ('+
+              str(SESSION_ERROR_)+')')
+      return False
+    return True
+
 #######################################################################
 # Function: vsphere_connect_func                                      #
 # Local Variables: SSL_OBJECT_ = An SSL socket object                 #
-# Global Variables: VSPHERE_TARGET_ = Hostname/IP of the target       #
-#                     vSphere                                         #
+#                  SAVED_COOKIE_ = Session cookie from an earlier run #
+#                  SESSION_STUB_ = SOAP stub carrying SAVED_COOKIE_   #
+#                  ESX_CONN_ = Connection to the vSphere              #
+# Global Variables: ARGS_, CREDENTIALS_                               #
 #######################################################################
-def vsphere_connect_func(**kwargs):
+def vsphere_connect_func(VSPHERE_HOST_):
     """
-    Create a connection to a vSphere host, including an Exit Handler
-    to close the connection at exit
-      Arguments: **kwargs = Double pointer to keyword arguments
-                referenced by socket methods
-      Returns: vsphere_connect_func.ESX, an object referencing the
-                connection to the vSphere host
+    Create a connection to a vSphere host, resuming the session saved
+    by an earlier run if the vSphere still accepts it, and logging in
+    (and saving the new session) otherwise; every call makes a new
+    connection, so each worker thread can have its own (each one keeps
+    its HTTPS connection alive between requests)
+      Arguments: VSPHERE_HOST_ - Hostname/IP of the target vSphere
+      Returns: ESX_CONN_, an object referencing the connection to the
+                vSphere host
     """
+    import_vsphere_func()
+
     # Create an SSL socket object
     #   PROTOCOL_SSLv23 specifies both SSL and TLS support and is the
     #               most-interoperable option
@@ -149,148 +453,1058 @@ def vsphere_connect_func(**kwargs):
     #   by the remote host, then no validity check is made
     SSL_OBJECT_.verify_mode = ssl.CERT_NONE
 
+    # Try the saved session first; the vSphere reports no current
+    #   session if it has expired (or was ended)
+    ESX_CONN_ = None
+    SAVED_COOKIE_ = load_session_func(VSPHERE_HOST_)
+    if SAVED_COOKIE_ is not None:
+      try:
+        SESSION_STUB_ = connect.SmartStubAdapter(host=VSPHERE_HOST_,
+                                                 sslContext=SSL_OBJECT_)
+        SESSION_STUB_.cookie = SAVED_COOKIE_
+        ESX_CONN_ = vim.ServiceInstance('ServiceInstance', SESSION_STUB_)
+        if ESX_CONN_.content.sessionManager.currentSession is None:
+          ESX_CONN_ = None
+      except Exception as SESSION_ERROR_:
+        if ARGS_.d:
+          print('Unable to resume the session on '+VSPHERE_HOST_+' ('+
+                str(SESSION_ERROR_)+')')
+        ESX_CONN_ = None
+      if ARGS_.d:
+        print(VSPHERE_HOST_+' session resumed is '+str(ESX_CONN_ is not None))
+    if ESX_CONN_ is not None:
+      return ESX_CONN_
+
     # Connect to the vSphere
-    ESX_CONN_ = connect.SmartConnect(host=VSPHERE_TARGET_, \
+    ESX_CONN_ = connect.SmartConnect(host=VSPHERE_HOST_, \
                 user=CREDENTIALS_['USER'], pwd=CREDENTIALS_['PASSWORD'], \
                 sslContext=SSL_OBJECT_)
 
-    # Put the vSphere connector object into the kwargs for this function
-    vsphere_connect_func.ESX = ESX_CONN_
+    # Keep the session open for the next run; if it can not be saved,
+    #   register an exit handler that will disconnect from the vSphere
+    #   when this tool exits, rather than leave it open for nothing
+    if not save_session_func(VSPHERE_HOST_, ESX_CONN_):
+      atexit.register(connect.Disconnect, ESX_CONN_)
+
+    return ESX_CONN_
+
+#######################################################################
+# Function: collect_dc_func                                           #
+# Local Variables: START_TIME_ = When the collection started          #
+#                  ESX_CONN_ = Connection to the vSphere              #
+#                  VM_TABLE_ = Table of VM properties                 #
+# Global Variables: ARGS_, VSPHERES_                                  #
+#######################################################################
+def collect_dc_func(DC_NAME_, COLUMNS_=VM_COLUMNS_, HOST_TABLE_=None):
+    """
+    Connect to the vSphere of one Data Center and retrieve its VM
+    table; runs in a worker thread, so it uses its own connection and
+    does not print anything other than debugging messages
+      Arguments: DC_NAME_ - Data Center whose vSphere is contacted (a
+                key of VSPHERES_)
+                 COLUMNS_ - Dictionary of the property path of each
+                  column to retrieve (VM_COLUMNS_ unless given)
+                 HOST_TABLE_ - Empty Dictionary to fill with the host
+                  table, or None (the default)
+      Returns: A tuple of the VM table (from collect_vm_table_func)
+                and the number of seconds the collection took
+    """
+    START_TIME_ = time.time()
+    if ARGS_.d:
+      print('Contacting ' + VSPHERES_[DC_NAME_] + ' for ' + DC_NAME_)
+    ESX_CONN_ = vsphere_connect_func(VSPHERES_[DC_NAME_])
+    VM_TABLE_ = collect_vm_table_func(ESX_CONN_, COLUMNS_, HOST_TABLE_)
+    return(VM_TABLE_, time.time() - START_TIME_)
+
+#######################################################################
+# Function: collect_vm_table_func                                     #
+# Local Variables: SPHERE_CONTENT_ = Content of the vSphere           #
+#                  VM_VIEW_ = ContainerView of every VM               #
+#                  FILTER_SPEC_ = What the PropertyCollector fetches  #
+#                  VM_TABLE_ = Table of VM properties, by column      #
+#                  RETRIEVE_RESULT_ = One page of retrieved VMs       #
+#                  THIS_OBJECT_ = Properties of one VM                #
+#                  THIS_VM_PROPS_ = Property values, by path          #
+#                  REFERENCE_PATHS_ = Paths retrieved from each other #
+#                                     type of object                  #
+#                  REFERENCE_PROPS_ = Properties of those objects     #
+#                  REFERENCE_NAMES_ = Names of those objects, by moref#
+#                  HOST_MOREFS_ = morefs of the ESXi hosts            #
+# Global Variables: ARGS_, VM_COLUMNS_, RETRIEVE_PAGE_SIZE_,          #
+#                   FIELD_REFERENCES_, HOST_COLUMNS_                  #
+#######################################################################
+def collect_vm_table_func(ESX_CONN_, COLUMNS_=VM_COLUMNS_, HOST_TABLE_=None):
+    """
+    Retrieve properties for every VM in a vSphere with the
+    PropertyCollector, a page of RETRIEVE_PAGE_SIZE_ VMs per round
+    trip (rather than a round trip per property of every VM); when a
+    column references other objects (FIELD_REFERENCES_), the names of
+    those objects are retrieved in the same requests, as are the
+    HOST_COLUMNS_ properties of every ESXi host when asked for
+      Arguments: ESX_CONN_ - Connection to the vSphere
+                 COLUMNS_ - Dictionary of the property path of each
+                  column to retrieve (VM_COLUMNS_ unless given)
+                 HOST_TABLE_ - Empty Dictionary to fill with the host
+                  table (indexed by the keys of HOST_COLUMNS_, of Lists
+                  that each hold one value per host), or None (the
+                  default) to not retrieve the hosts
+      Returns: A Dictionary (the VM table), indexed by the keys of
+                COLUMNS_ plus 'moref' (the managed object ID), of Lists
+                that each hold one value per VM; the VMs are in the
+                order the vSphere returned them
+    """
+    SPHERE_CONTENT_ = ESX_CONN_.RetrieveContent()
+    REFERENCE_PATHS_ = {FIELD_REFERENCES_[THIS_COLUMN_]: ['name'] for THIS_COLUMN_ in COLUMNS_
+                        if THIS_COLUMN_ in FIELD_REFERENCES_}
+    if HOST_TABLE_ is not None:
+      REFERENCE_PATHS_['HostSystem'] = list(HOST_COLUMNS_.values())
+      REFERENCE_PATHS_['ClusterComputeResource'] = ['name']
+    # A recursive view of every VM (and every other object needed)
+    #   under the rootFolder
+    VM_VIEW_ = SPHERE_CONTENT_.viewManager.CreateContainerView(
+                  SPHERE_CONTENT_.rootFolder, [vim.VirtualMachine] +
+                  [getattr(vim, THIS_TYPE_) for THIS_TYPE_ in sorted(REFERENCE_PATHS_)], True)
 
-    # Register an exit handler that will disconnect from the vSphere
-    #   when this tool exits
-    atexit.register(connect.Disconnect, ESX_CONN_)
+    FILTER_SPEC_ = vm_filter_spec_func(VM_VIEW_, COLUMNS_, REFERENCE_PATHS_)
+    REFERENCE_PROPS_ = dict()
+    HOST_MOREFS_ = []
+
+    VM_TABLE_ = {THIS_COLUMN_: [] for THIS_COLUMN_ in COLUMNS_}
+    VM_TABLE_['moref'] = []
+    RETRIEVE_RESULT_ = SPHERE_CONTENT_.propertyCollector.RetrievePropertiesEx(
+                  [FILTER_SPEC_],
+                  vmodl.query.PropertyCollector.RetrieveOptions(
+                    maxObjects=RETRIEVE_PAGE_SIZE_))
+    while RETRIEVE_RESULT_ is not None:
+      for THIS_OBJECT_ in RETRIEVE_RESULT_.objects:
+        # A property that is not set (for example, the guest of a VM
+        #   that has never run) is simply missing from propSet
+        THIS_VM_PROPS_ = {THIS_PROP_.name: THIS_PROP_.val
+                          for THIS_PROP_ in THIS_OBJECT_.propSet}
+        if not isinstance(THIS_OBJECT_.obj, vim.VirtualMachine):
+          REFERENCE_PROPS_[THIS_OBJECT_.obj._GetMoId()] = THIS_VM_PROPS_
+          if isinstance(THIS_OBJECT_.obj, vim.HostSystem):
+            HOST_MOREFS_.append(THIS_OBJECT_.obj._GetMoId())
+          continue
+        for THIS_COLUMN_, THIS_PATH_ in COLUMNS_.items():
+          VM_TABLE_[THIS_COLUMN_].append(THIS_VM_PROPS_.get(THIS_PATH_))
+        VM_TABLE_['moref'].append(THIS_OBJECT_.obj._GetMoId())
+      if ARGS_.d:
+        print('\tRetrieved '+str(len(VM_TABLE_['name']))+' VMs so far')
+      # Ask for the next page, if there is one
+      if RETRIEVE_RESULT_.token is None:
+        break
+      RETRIEVE_RESULT_ = SPHERE_CONTENT_.propertyCollector.ContinueRetrievePropertiesEx(
+                  RETRIEVE_RESULT_.token)
+
+    # The view is no longer needed; don't leave it on the server
+    VM_VIEW_.Destroy()
+
+    # Replace each reference with the name of what it references
+    REFERENCE_NAMES_ = {THIS_MOREF_: THIS_PROPS_.get('name')
+                        for THIS_MOREF_, THIS_PROPS_ in REFERENCE_PROPS_.items()}
+    for THIS_COLUMN_ in COLUMNS_:
+      if THIS_COLUMN_ not in FIELD_REFERENCES_:
+        continue
+      VM_TABLE_[THIS_COLUMN_] = [
+        [REFERENCE_NAMES_.get(THIS_REF_._GetMoId()) for THIS_REF_ in THIS_VALUE_]
+        if isinstance(THIS_VALUE_, (list, tuple)) else
+        (REFERENCE_NAMES_.get(THIS_VALUE_._GetMoId()) if THIS_VALUE_ is not None else None)
+        for THIS_VALUE_ in VM_TABLE_[THIS_COLUMN_]]
+
+    # The host table; a host outside of any cluster has no cluster name
+    if HOST_TABLE_ is not None:
+      for THIS_COLUMN_, THIS_PATH_ in HOST_COLUMNS_.items():
+        HOST_TABLE_[THIS_COLUMN_] = [REFERENCE_PROPS_[THIS_MOREF_].get(THIS_PATH_)
+                                     for THIS_MOREF_ in HOST_MOREFS_]
+      HOST_TABLE_['cluster'] = [REFERENCE_NAMES_.get(THIS_VALUE_._GetMoId(), '')
+                                if THIS_VALUE_ is not None else ''
+                                for THIS_VALUE_ in HOST_TABLE_['cluster']]
+      HOST_TABLE_['memory_mb'] = [int((THIS_VALUE_ or 0) / 1048576)
+                                  for THIS_VALUE_ in HOST_TABLE_['memory_mb']]
+      HOST_TABLE_['cpu_threads'] = [THIS_VALUE_ or 0 for THIS_VALUE_ in HOST_TABLE_['cpu_threads']]
+
+    return normalize_vm_table_func(VM_TABLE_)
+
+#######################################################################
+# Function: vm_filter_spec_func                                       #
+# Local Variables: None                                               #
+# Global Variables: None                                              #
+#######################################################################
+def vm_filter_spec_func(VM_VIEW_, COLUMNS_, REFERENCE_PATHS_=None):
+    """
+    Build the PropertyCollector filter for the VMs of a ContainerView:
+    start at the view, step into the VMs it holds, and collect only
+    the property paths in COLUMNS_ from each of them (and only the
+    paths in REFERENCE_PATHS_ from any other objects in the view)
+      Arguments: VM_VIEW_ - ContainerView of the VMs
+                 COLUMNS_ - Dictionary of the property path of each
+                  column
+                 REFERENCE_PATHS_ - Dictionary of the property paths
+                  to retrieve, by name of the other types of object in
+                  the view (none unless given)
+      Returns: A PropertyCollector FilterSpec
+    """
+    if REFERENCE_PATHS_ is None:
+      REFERENCE_PATHS_ = {}
+    return vmodl.query.PropertyCollector.FilterSpec(
+      objectSet=[vmodl.query.PropertyCollector.ObjectSpec(obj=VM_VIEW_,
+        skip=True, selectSet=[vmodl.query.PropertyCollector.TraversalSpec(
+          name='traverseView', path='view', skip=False,
+          type=vim.view.ContainerView)])],
+      propSet=[vmodl.query.PropertyCollector.PropertySpec(
+        type=vim.VirtualMachine, all=False,
+        pathSet=list(COLUMNS_.values()))] +
+        [vmodl.query.PropertyCollector.PropertySpec(
+          type=getattr(vim, THIS_TYPE_), all=False, pathSet=THIS_PATHS_)
+         for THIS_TYPE_, THIS_PATHS_ in sorted(REFERENCE_PATHS_.items())])
+
+#######################################################################
+# Function: normalize_vm_table_func                                   #
+# Local Variables: None                                               #
+# Global Variables: None                                              #
+#######################################################################
+def normalize_vm_table_func(VM_TABLE_):
+    """
+    Convert the values of a VM table, as retrieved, into plain types:
+    enumerations (power state, etc.) become strings, lists become
+    comma-separated strings, bytes become GB, and anything missing an
+    empty string or zero
+      Arguments: VM_TABLE_ - VM table
+      Returns: The same VM table
+    """
+    for THIS_COLUMN_ in ('name', 'power_state', 'tools_status', 'ft_state', 'host', 'ip'):
+      if THIS_COLUMN_ in VM_TABLE_:
+        VM_TABLE_[THIS_COLUMN_] = [str(THIS_VALUE_ or '') for THIS_VALUE_ in VM_TABLE_[THIS_COLUMN_]]
+    for THIS_COLUMN_ in ('memory_mb', 'num_cpu', 'uptime'):
+      if THIS_COLUMN_ in VM_TABLE_:
+        VM_TABLE_[THIS_COLUMN_] = [THIS_VALUE_ or 0 for THIS_VALUE_ in VM_TABLE_[THIS_COLUMN_]]
+    if 'datastores' in VM_TABLE_:
+      VM_TABLE_['datastores'] = [','.join(str(THIS_NAME_) for THIS_NAME_ in (THIS_VALUE_ or []))
+                                 for THIS_VALUE_ in VM_TABLE_['datastores']]
+    if 'storage_gb' in VM_TABLE_:
+      VM_TABLE_['storage_gb'] = [int((THIS_VALUE_ or 0) / 1073741824)
+                                 for THIS_VALUE_ in VM_TABLE_['storage_gb']]
+    return VM_TABLE_
 
 #######################################################################
 # Function: print_vm_info_func                                        #
-# Local Variables: SPHERE_CONTENT_                                    #
-#                  ROOT_DATA_                 These are               #
-#                  VIEW_TYPE_                 all variables           #
-#                  IS_RECURSIVE_              to hold and             #
-#                  VM_DATA_                   manipulate the          #
-#                  VM_LIST_                   data extracted          #
-#                  LINE_COUNT_                from the VMware         #
-#                  FT_SKIP_COUNT_             environment             #
-#                  THIS_VM_                                           #
-#                  THIS_VM_DATA_          THIS_VM_NAME_               #
-#                  THIS_VM_RAM_           THIS_VM_CPU_                #
+# Local Variables: LINE_COUNT_ = Number of VMs displayed              #
+#                  FT_SKIP_COUNT_ = Number of VMs skipped             #
+#                  VM_INDEX_ = Position of the VM in the VM table     #
+#                  THIS_VM_NAME_          THIS_VM_RAM_                #
+#                  THIS_VM_CPU_           THIS_VM_FT_                 #
 #                  THIS_VM_STATE_         THIS_VM_TOOLS_              #
-#                  THIS_VM_FT_                                        #
-# Global Variables: vsphere_connect_func.ESX, the vSphere object      #
-#######################################################################
-def print_vm_info_func(SYSTEM_NAME_):
-    """
-    Gather and display information retrieved by vSphere
-      Arguments: SYSTEM_NAME_ - A string; if not blank, defining a
-                specific host name which will cause this function to
-                return "1" if the VM exists, "0" otherwise
-      Returns: Two integer values
-            If SYSTEM_NAME_ is blank, then the values are, in order,
-              LINE_COUNT_ and FT_SKIP_COUNT_
-            If SYSTEM_NAME_ is not blank, then the first value
-              returned is "1" if a VM with that name exists, "0"
-              otherwise; and the second value is always 0
-    """
-    # Retrieve information from the ESX
-    SPHERE_CONTENT_ = vsphere_connect_func.ESX.RetrieveContent()
-    # Store all VMs that are available in the rootFolder of ESXi cluster
-    ROOT_DATA_ = SPHERE_CONTENT_.rootFolder
-    # Restrict View to only VMs
-    VIEW_TYPE_ = [vim.VirtualMachine]
-    # When looking in rootFolder, recurse
-    IS_RECURSIVE_ = True
-    # Get the data
-    VM_DATA_ = SPHERE_CONTENT_.viewManager.CreateContainerView(ROOT_DATA_, VIEW_TYPE_, IS_RECURSIVE_)
-    # Extract a list of VMs
-    VM_LIST_ = VM_DATA_.view
-
+#                  THIS_VM_FIELDS_ = Values of the --fields columns   #
+# Global Variables: ARGS_                                             #
+#######################################################################
+def print_vm_info_func(VM_TABLE_, FIELD_LIST_=()):
+    """
+    Display information from a VM table
+      Arguments: VM_TABLE_ - VM table from collect_vm_table_func
+                 FIELD_LIST_ - Names of the extra columns to display
+                  (from --fields; none unless given); a column missing
+                  from the table is left blank
+      Returns: Two integer values, in order, LINE_COUNT_ and
+              FT_SKIP_COUNT_
+    """
     # Initalize a counter so I can put in a separator line
     LINE_COUNT_ = 0
     # Initalize a counter to track VMs I skip because they are FT images
     FT_SKIP_COUNT_ = 0
 
-    # Cycle through the list of VMs
-    for THIS_VM_ in VM_LIST_:
-      # Get the block of info for this VM
-      THIS_VM_DATA_ = THIS_VM_.summary
-
+    # Cycle through the VMs in the table
+    for VM_INDEX_ in range(len(VM_TABLE_['name'])):
       # Get the name of the VM as it appears in the vCenter interface
-      THIS_VM_NAME_ = THIS_VM_DATA_.config.name
+      THIS_VM_NAME_ = VM_TABLE_['name'][VM_INDEX_]
       if ARGS_.d:
         print('\tTHIS_VM_NAME_ is '+THIS_VM_NAME_)
 
-      # If passed a host name to check against, then do so here; if the
-      #   host doesn't match, then skip the rest of the loop
-      if SYSTEM_NAME_ != '':
-        if SYSTEM_NAME_ != THIS_VM_NAME_:
-          continue
-        else:
-          # Match found - exit function here
-          return(1, 0)
-
       # This next if/else block is used to exclude FT images on the
       #   other Data Center (that is, it prevents this tool from
       #   displaying the FT image of a DC1-based VM when processing
       #   the DC2 VMs)
-      if (THIS_VM_NAME_[0:3] == 'dc1' or THIS_VM_NAME_[0:3] == 'dc2') and THIS_VM_DATA_.runtime.powerState == 'poweredOn':
+      if (THIS_VM_NAME_[0:3] == 'dc1' or THIS_VM_NAME_[0:3] == 'dc2') and VM_TABLE_['power_state'][VM_INDEX_] == 'poweredOn':
         pass
       else:
         FT_SKIP_COUNT_ += 1
         if ARGS_.d:
           print('\t\tSkipping '+THIS_VM_NAME_+'FT_SKIP_COUNT_ is '+
                 str(FT_SKIP_COUNT_))
-          continue
+        continue
 
-        # Get the RAM in MB
-        THIS_VM_RAM_ = THIS_VM_DATA_.config.memorySizeMB
-        # I want to display it in GB, so change units and round it
-        THIS_VM_RAM_ = int(THIS_VM_RAM_ / 1024)
+      # Get the RAM in MB; I want to display it in GB, so change units
+      #   and round it
+      THIS_VM_RAM_ = int(VM_TABLE_['memory_mb'][VM_INDEX_] / 1024)
 
-        # Get the number of Virtual CPUs
-        THIS_VM_CPU_ = THIS_VM_DATA_.config.numCpu
+      # Get the number of Virtual CPUs
+      THIS_VM_CPU_ = VM_TABLE_['num_cpu'][VM_INDEX_]
 
-        # Determine if this is an FT
-        if (THIS_VM_DATA_.runtime.faultToleranceState == 'running'):
-          THIS_VM_FT_ = ANSI_.BOLD_TEXT+'YES'+ANSI_.ALL_OFF
-        else:
-          THIS_VM_FT_ = ' NO'
+      # Determine if this is an FT
+      if VM_TABLE_['ft_state'][VM_INDEX_] == 'running':
+        THIS_VM_FT_ = ANSI_.BOLD_TEXT+'YES'+ANSI_.ALL_OFF
+      else:
+        THIS_VM_FT_ = ' NO'
 
-        # Determine if it is powered on; if running, also get VMTools status
-        if THIS_VM_DATA_.runtime.powerState == 'poweredOn':
-          THIS_VM_STATE_ = " On"
-          if THIS_VM_DATA_.guest.toolsStatus == 'toolsOk':
-            THIS_VM_TOOLS_ = 'YES'
-          else:
-            if THIS_VM_FT_ == ' NO':
-              THIS_VM_TOOLS_ = 'NO'
-            else:
-              continue
+      # Determine if it is powered on; if running, also get VMTools status
+      if VM_TABLE_['power_state'][VM_INDEX_] == 'poweredOn':
+        THIS_VM_STATE_ = " On"
+        if VM_TABLE_['tools_status'][VM_INDEX_] == 'toolsOk':
+          THIS_VM_TOOLS_ = 'YES'
         else:
-          THIS_VM_STATE_ = ANSI_.BOLD_TEXT+ANSI_.RED_BLACK+'Off'+ANSI_.ALL_OFF
-          # Since the VM is not running, I can't get a status of VMTools
-          THIS_VM_TOOLS_ = '---'
+          if THIS_VM_FT_ == ' NO':
+            THIS_VM_TOOLS_ = 'NO'
+          else:
+            continue
+      else:
+        THIS_VM_STATE_ = ANSI_.BOLD_TEXT+ANSI_.RED_BLACK+'Off'+ANSI_.ALL_OFF
+        # Since the VM is not running, I can't get a status of VMTools
+        THIS_VM_TOOLS_ = '---'
 
-          # Display the information
-          print('\t\t'+THIS_VM_NAME_+'\t   '+THIS_VM_STATE_+'\t\t'+' '+
-                THIS_VM_TOOLS_+'\t\t\t'+'  '+str(THIS_VM_RAM_)+'\t\t\t'+
-                '  '+str(THIS_VM_CPU_)+'\t\t'+'  '+THIS_VM_FT_)
+      # Get the extra columns; uptime is shown in days and hours
+      THIS_VM_FIELDS_ = ''
+      for THIS_FIELD_ in FIELD_LIST_:
+        if THIS_FIELD_ not in VM_TABLE_:
+          THIS_VALUE_ = ''
+        elif THIS_FIELD_ == 'uptime':
+          THIS_VALUE_ = (str(VM_TABLE_['uptime'][VM_INDEX_] // 86400)+'d '+
+                         str(VM_TABLE_['uptime'][VM_INDEX_] % 86400 // 3600)+'h')
+        else:
+          THIS_VALUE_ = str(VM_TABLE_[THIS_FIELD_][VM_INDEX_])
+        THIS_VM_FIELDS_ += '\t\t'+THIS_VALUE_
 
-          # If this is the 5th record, print a separator line
-          if LINE_COUNT_ != 0 and (LINE_COUNT_ % 5 == 0):
-            print('\t\t' + 105* '-')
+      # Display the information
+      print('\t\t'+THIS_VM_NAME_+'\t   '+THIS_VM_STATE_+'\t\t'+' '+
+            THIS_VM_TOOLS_+'\t\t\t'+'  '+str(THIS_VM_RAM_)+'\t\t\t'+
+            '  '+str(THIS_VM_CPU_)+'\t\t'+'  '+THIS_VM_FT_+THIS_VM_FIELDS_)
 
-    # Increment counter
-    LINE_COUNT_ += 1
+      # If this is the 5th record, print a separator line
+      if LINE_COUNT_ != 0 and (LINE_COUNT_ % 5 == 0):
+        print('\t\t' + 105* '-')
 
-    # What I return depends on how tool was invoked
-    if (SYSTEM_NAME_ != ''):
-      # I got done and did not match the host name
-      LINE_COUNT_ = 0
-      FT_SKIP_COUNT_ = 0
+      # Increment counter
+      LINE_COUNT_ += 1
 
     # Return (in order) the count of VMs I displayed, and those skipped
     return(LINE_COUNT_, FT_SKIP_COUNT_)
 
+#######################################################################
+# Function: aggregate_vm_table_func                                   #
+# Local Variables: HOST_CLUSTERS_ = Cluster of each host, by name     #
+#                  GROUP_KEYS_ = Group of each VM, by grouping        #
+#                  VM_METRICS_ = Values summed, one row per metric    #
+#                  GROUP_TOTALS_ = The sums, by grouping and group    #
+# Global Variables: AGGREGATE_METRICS_                                #
+#######################################################################
+def aggregate_vm_table_func(VM_TABLE_, HOST_TABLE_):
+    """
+    Sum the VMs, vCPUs and vRAM (of all VMs, and of the powered-on
+    ones) of a Data Center per power state, cluster, ESXi host and for
+    the whole Data Center, in one pass over the VM table; with numpy
+    available, each sum is a single vectorized bincount
+      Arguments: VM_TABLE_ - VM table with the 'host' column
+                 HOST_TABLE_ - Host table from collect_vm_table_func
+      Returns: A Dictionary, by grouping ('power_state', 'cluster',
+                'host' and 'dc'), of Dictionaries, by group, of Lists of
+                the sums of each of AGGREGATE_METRICS_
+    """
+    # numpy is only loaded when it is needed, and is optional
+    try:
+      import numpy
+    except ImportError:
+      numpy = None
+
+    HOST_CLUSTERS_ = dict(zip(HOST_TABLE_['name'], HOST_TABLE_['cluster']))
+    GROUP_KEYS_ = dict()
+    GROUP_KEYS_['power_state'] = VM_TABLE_['power_state']
+    GROUP_KEYS_['cluster'] = [HOST_CLUSTERS_.get(THIS_HOST_, '') for THIS_HOST_ in VM_TABLE_['host']]
+    GROUP_KEYS_['host'] = VM_TABLE_['host']
+    GROUP_KEYS_['dc'] = [''] * len(VM_TABLE_['name'])
+    GROUP_TOTALS_ = {THIS_GROUPING_: dict() for THIS_GROUPING_ in GROUP_KEYS_}
+
+    if numpy is not None:
+      POWERED_ON_ = numpy.array([THIS_STATE_ == 'poweredOn' for THIS_STATE_ in VM_TABLE_['power_state']],
+                                dtype=numpy.float64)
+      VM_CPU_ = numpy.asarray(VM_TABLE_['num_cpu'], dtype=numpy.float64)
+      VM_RAM_ = numpy.asarray(VM_TABLE_['memory_mb'], dtype=numpy.float64)
+      VM_METRICS_ = [numpy.ones_like(POWERED_ON_), POWERED_ON_, VM_CPU_, VM_RAM_,
+                     VM_CPU_ * POWERED_ON_, VM_RAM_ * POWERED_ON_]
+      for THIS_GROUPING_, THIS_KEYS_ in GROUP_KEYS_.items():
+        GROUP_CODES_ = dict()
+        THIS_CODES_ = numpy.array([GROUP_CODES_.setdefault(THIS_KEY_, len(GROUP_CODES_))
+                                   for THIS_KEY_ in THIS_KEYS_], dtype=numpy.intp)
+        THIS_SUMS_ = [numpy.bincount(THIS_CODES_, weights=THIS_METRIC_, minlength=len(GROUP_CODES_))
+                      for THIS_METRIC_ in VM_METRICS_]
+        for THIS_KEY_, THIS_CODE_ in GROUP_CODES_.items():
+          GROUP_TOTALS_[THIS_GROUPING_][THIS_KEY_] = [int(THIS_SUM_[THIS_CODE_]) for THIS_SUM_ in THIS_SUMS_]
+      return GROUP_TOTALS_
+
+    for VM_INDEX_ in range(len(VM_TABLE_['name'])):
+      THIS_ON_ = int(VM_TABLE_['power_state'][VM_INDEX_] == 'poweredOn')
+      THIS_CPU_ = VM_TABLE_['num_cpu'][VM_INDEX_]
+      THIS_RAM_ = VM_TABLE_['memory_mb'][VM_INDEX_]
+      THIS_VALUES_ = (1, THIS_ON_, THIS_CPU_, THIS_RAM_, THIS_CPU_ * THIS_ON_, THIS_RAM_ * THIS_ON_)
+      for THIS_GROUPING_, THIS_KEYS_ in GROUP_KEYS_.items():
+        THIS_TOTALS_ = GROUP_TOTALS_[THIS_GROUPING_].setdefault(THIS_KEYS_[VM_INDEX_],
+                                                                [0] * len(AGGREGATE_METRICS_))
+        for THIS_METRIC_, THIS_VALUE_ in enumerate(THIS_VALUES_):
+          THIS_TOTALS_[THIS_METRIC_] += THIS_VALUE_
+    return GROUP_TOTALS_
+
+#######################################################################
+# Function: ratio_func                                                #
+# Local Variables: None                                               #
+# Global Variables: None                                              #
+#######################################################################
+def ratio_func(ALLOCATED_, AVAILABLE_):
+    """
+    Format an overcommit ratio for print_capacity_func
+      Arguments: ALLOCATED_ - vCPUs or vRAM allocated
+                 AVAILABLE_ - Hardware threads or RAM available
+      Returns: The ratio, to two decimal places, or a dash when there
+               is nothing to divide by
+    """
+    if AVAILABLE_:
+      return '%.2f' % (ALLOCATED_ / AVAILABLE_)
+    return '-'
+
+#######################################################################
+# Function: print_capacity_func                                       #
+# Local Variables: GROUP_TOTALS_ = Sums from aggregate_vm_table_func  #
+#                  GROUP_CAPACITY_ = Hardware of each cluster/host    #
+#                  ROW_FORMAT_ = Layout of each line                  #
+# Global Variables: None                                              #
+#######################################################################
+def print_capacity_func(VM_TABLE_, HOST_TABLE_):
+    """
+    Display the allocated and available capacity of a Data Center: the
+    VMs, vCPUs and vRAM per power state, then per cluster and per ESXi
+    host (with their hardware threads and RAM, and the overcommit ratio
+    of the powered-on VMs' vCPU and vRAM to them), then the total
+      Arguments: VM_TABLE_ - VM table with the 'host' column
+                 HOST_TABLE_ - Host table from collect_vm_table_func
+      Returns: N/A
+    """
+    GROUP_TOTALS_ = aggregate_vm_table_func(VM_TABLE_, HOST_TABLE_)
+
+    # Hardware of each host, cluster, and the Data Center; a host (or
+    #   cluster) without VMs is still listed
+    GROUP_CAPACITY_ = {'cluster': dict(), 'host': dict(), 'dc': {'': [0, 0]}}
+    for (THIS_HOST_, THIS_CLUSTER_, THIS_THREADS_, THIS_RAM_) in zip(
+          HOST_TABLE_['name'], HOST_TABLE_['cluster'],
+          HOST_TABLE_['cpu_threads'], HOST_TABLE_['memory_mb']):
+      for (THIS_GROUPING_, THIS_KEY_) in (('cluster', THIS_CLUSTER_), ('host', THIS_HOST_), ('dc', '')):
+        THIS_CAPACITY_ = GROUP_CAPACITY_[THIS_GROUPING_].setdefault(THIS_KEY_, [0, 0])
+        THIS_CAPACITY_[0] += THIS_THREADS_
+        THIS_CAPACITY_[1] += THIS_RAM_
+        GROUP_TOTALS_[THIS_GROUPING_].setdefault(THIS_KEY_, [0] * len(AGGREGATE_METRICS_))
+
+    print('\n\t\t'+ANSI_.BOLD_TEXT+ANSI_.GREEN_BLACK+'%-16s%10s%10s%14s' %
+          ('__Power_State__', '__VMs__', '__vCPU__', '__vRAM(GB)__')+ANSI_.ALL_OFF)
+    for THIS_STATE_, THIS_TOTALS_ in sorted(GROUP_TOTALS_['power_state'].items()):
+      print('\t\t%-16s%10d%10d%14d' % (THIS_STATE_ or '(unknown)', THIS_TOTALS_[0],
+                                       THIS_TOTALS_[2], THIS_TOTALS_[3] // 1024))
+
+    ROW_FORMAT_ = '%-24s%8s%8s%10s%10s%14s%14s%14s%14s'
+    for (THIS_GROUPING_, THIS_TITLE_) in (('cluster', '__Cluster__'), ('host', '__ESXi_Host__'),
+                                          ('dc', '__Data_Center__')):
+      print('\n\t\t'+ANSI_.BOLD_TEXT+ANSI_.GREEN_BLACK+ROW_FORMAT_ %
+            (THIS_TITLE_, '__VMs__', '__On__', '__vCPU__', '__pCPU__', '__vCPU:pCPU__',
+             '__vRAM(GB)__', '__pRAM(GB)__', '__vRAM:pRAM__')+ANSI_.ALL_OFF)
+      for THIS_KEY_, THIS_TOTALS_ in sorted(GROUP_TOTALS_[THIS_GROUPING_].items()):
+        (THIS_THREADS_, THIS_RAM_) = GROUP_CAPACITY_[THIS_GROUPING_].get(THIS_KEY_, (0, 0))
+        if THIS_GROUPING_ == 'dc':
+          THIS_KEY_ = 'Total'
+        print('\t\t'+ROW_FORMAT_ % (THIS_KEY_ or '(none)', THIS_TOTALS_[0], THIS_TOTALS_[1],
+              THIS_TOTALS_[4], THIS_THREADS_, ratio_func(THIS_TOTALS_[4], THIS_THREADS_),
+              THIS_TOTALS_[5] // 1024, THIS_RAM_ // 1024, ratio_func(THIS_TOTALS_[5], THIS_RAM_)))
+
+#######################################################################
+# Function: hostname_error_func                                       #
+# Local Variables: None                                               #
+# Global Variables: None                                              #
+#######################################################################
+def hostname_error_func(HOST_NAME_):
+    """
+    Check a host name against the naming convention (see the IMPORTANT
+    NOTE where -c is validated)
+      Arguments: HOST_NAME_ - Host name to check
+      Returns: None if the name is valid; otherwise a tuple of the
+                letter identifying the failed check, the offending
+                part of the name (for the FATAL ERROR message) and the
+                return code to exit with
+    """
+    # Must be 13 characters, no more or less
+    if len(HOST_NAME_) != 13:
+      return('A', 'length', 254)
+    # First two must be 'dc'
+    if HOST_NAME_[0:2] != 'dc':
+      return('B', HOST_NAME_[0:2], 253)
+    # The 5th and 6th characters must be 'xx'
+    if HOST_NAME_[4:6] != 'xx':
+      return('C', HOST_NAME_[4:6], 252)
+    # The 7th and 8th characters must be '00'
+    if HOST_NAME_[6:8] != '00':
+      return('D', HOST_NAME_[6:8], 251)
+    return None
+
+#######################################################################
+# Function: hostname_dc_func                                          #
+# Local Variables: None                                               #
+# Global Variables: None                                              #
+#######################################################################
+def hostname_dc_func(HOST_NAME_):
+    """
+    Determine the Data Center of a (valid) host name, based on its
+    3rd character
+      Arguments: HOST_NAME_ - Host name
+      Returns: A key of VSPHERES_
+    """
+    if HOST_NAME_[2:3] == '1':
+      return 'DC1'
+    return 'DC2'
+
+#######################################################################
+# Function: open_name_cache_func                                      #
+# Local Variables: NAME_CACHE_ = SQLite connection object             #
+# Global Variables: ARGS_, NAME_CACHE_FILE_                           #
+#######################################################################
+def open_name_cache_func():
+    """
+    Open (creating if needed) the local cache of VM names; if the file
+    can not be used, an in-memory database is used instead, so the
+    tool works the same way, just without anything kept between runs
+      Arguments: None
+      Returns: An sqlite3 Connection object
+    """
+    try:
+      os.makedirs(os.path.dirname(NAME_CACHE_FILE_), mode=0o755, exist_ok=True)
+      # Wait (rather than fail) if another copy of this tool is in the
+      #   middle of updating the cache
+      NAME_CACHE_ = sqlite3.connect(NAME_CACHE_FILE_, timeout=30)
+      NAME_CACHE_.execute('PRAGMA journal_mode=WAL')
+    except (OSError, sqlite3.Error) as DB_ERROR_:
+      if ARGS_.d:
+        print('Unable to use '+NAME_CACHE_FILE_+' ('+str(DB_ERROR_)+
+              '), using an in-memory cache')
+      NAME_CACHE_ = sqlite3.connect(':memory:')
+
+    # One row per VM name known to exist, with when it was last seen
+    NAME_CACHE_.execute('CREATE TABLE IF NOT EXISTS vms (dc TEXT, name TEXT, '
+                        'moref TEXT, seen REAL, PRIMARY KEY (dc, name))')
+    # When the complete list of names of each Data Center was last
+    #   retrieved
+    NAME_CACHE_.execute('CREATE TABLE IF NOT EXISTS refresh (dc TEXT PRIMARY KEY, '
+                        'refreshed REAL)')
+    NAME_CACHE_.commit()
+    return NAME_CACHE_
+
+#######################################################################
+# Function: cached_name_func                                          #
+# Local Variables: OLDEST_TIME_ = Oldest time still considered fresh  #
+#                  CACHE_ROW_ = Row from the cache                    #
+# Global Variables: ARGS_                                             #
+#######################################################################
+def cached_name_func(NAME_CACHE_, DC_NAME_, VM_NAME_):
+    """
+    Answer whether a VM exists from the name cache, if the cache can
+    answer; a name seen within --max-age seconds exists, and a name
+    that was not in a complete list retrieved within --max-age
+    seconds does not
+      Arguments: NAME_CACHE_ - sqlite3 Connection object
+                 DC_NAME_ - Data Center of the VM
+                 VM_NAME_ - Name of the VM
+      Returns: True or False, or None if the cache can not answer
+    """
+    OLDEST_TIME_ = time.time() - ARGS_.max_age
+    CACHE_ROW_ = NAME_CACHE_.execute('SELECT seen FROM vms WHERE dc = ? AND name = ?',
+                                     (DC_NAME_, VM_NAME_)).fetchone()
+    if (CACHE_ROW_ is not None) and (CACHE_ROW_[0] >= OLDEST_TIME_):
+      return True
+    CACHE_ROW_ = NAME_CACHE_.execute('SELECT refreshed FROM refresh WHERE dc = ?',
+                                     (DC_NAME_,)).fetchone()
+    if (CACHE_ROW_ is not None) and (CACHE_ROW_[0] >= OLDEST_TIME_):
+      return False
+    return None
+
+#######################################################################
+# Function: store_names_func                                          #
+# Local Variables: NOW_ = Time the names are saved                    #
+# Global Variables: None                                              #
+#######################################################################
+def store_names_func(NAME_CACHE_, DC_NAME_, VM_MOREFS_, IS_COMPLETE_):
+    """
+    Save VM names (and their managed object IDs) in the name cache,
+    in a single transaction
+      Arguments: NAME_CACHE_ - sqlite3 Connection object
+                 DC_NAME_ - Data Center the VMs belong to
+                 VM_MOREFS_ - Dictionary of managed object IDs, indexed
+                  by VM name
+                 IS_COMPLETE_ - If True, VM_MOREFS_ holds every VM of
+                  the Data Center, and replaces what was cached
+      Returns: N/A
+    """
+    NOW_ = time.time()
+    with NAME_CACHE_:
+      if IS_COMPLETE_:
+        NAME_CACHE_.execute('DELETE FROM vms WHERE dc = ?', (DC_NAME_,))
+        NAME_CACHE_.execute('INSERT OR REPLACE INTO refresh VALUES (?, ?)',
+                            (DC_NAME_, NOW_))
+      NAME_CACHE_.executemany('INSERT OR REPLACE INTO vms VALUES (?, ?, ?, ?)',
+                              [(DC_NAME_, THIS_NAME_, THIS_MOREF_, NOW_)
+                               for THIS_NAME_, THIS_MOREF_ in VM_MOREFS_.items()])
+
+#######################################################################
+# Function: lookup_dc_func                                            #
+# Local Variables: ESX_CONN_ = Connection to the vSphere              #
+#                  SPHERE_CONTENT_ = Content of the vSphere           #
+#                  FOUND_VM_ = VM found by the search index           #
+#                  NAME_TABLE_ = Table of every VM name               #
+# Global Variables: ARGS_, VSPHERES_, NAME_COLUMNS_                   #
+#######################################################################
+def lookup_dc_func(DC_NAME_, VM_NAMES_):
+    """
+    Find out which of a list of VM names exist in the vSphere of one
+    Data Center, using a single session; a single name is first looked
+    up with the server-side search index, and if that does not find it
+    (or there are several names) the names of every VM (and nothing
+    else) are retrieved in one PropertyCollector query
+      Arguments: DC_NAME_ - Data Center whose vSphere is contacted
+                 VM_NAMES_ - List of VM names to look for
+      Returns: A tuple of a Dictionary of managed object IDs, indexed
+                by VM name, and True if that Dictionary holds every VM
+                of the Data Center (False if it only holds the one
+                found by the search index)
+    """
+    ESX_CONN_ = vsphere_connect_func(VSPHERES_[DC_NAME_])
+    if len(VM_NAMES_) == 1:
+      SPHERE_CONTENT_ = ESX_CONN_.RetrieveContent()
+      # The "m" name of a host is also its DNS name, which VMware Tools
+      #   reports to the vSphere
+      FOUND_VM_ = SPHERE_CONTENT_.searchIndex.FindByDnsName(dnsName=VM_NAMES_[0],
+                                                            vmSearch=True)
+      if (FOUND_VM_ is not None) and (FOUND_VM_.name == VM_NAMES_[0]):
+        if ARGS_.d:
+          print('Search index found '+VM_NAMES_[0]+' in '+DC_NAME_)
+        return({VM_NAMES_[0]: FOUND_VM_._GetMoId()}, False)
+    NAME_TABLE_ = collect_vm_table_func(ESX_CONN_, NAME_COLUMNS_)
+    if ARGS_.d:
+      print('Retrieved '+str(len(NAME_TABLE_['name']))+' VM names from '+DC_NAME_)
+    return(dict(zip(NAME_TABLE_['name'], NAME_TABLE_['moref'])), True)
+
+#######################################################################
+# Function: watch_dc_func                                             #
+# Local Variables: ESX_CONN_ = Connection to the vSphere              #
+#                  SPHERE_CONTENT_ = Content of the vSphere           #
+#                  VM_VIEW_ = ContainerView of every VM               #
+#                  WATCH_COLLECTOR_ = PropertyCollector for updates   #
+#                  WAIT_OPTIONS_ = Options for WaitForUpdatesEx       #
+#                  UPDATE_VERSION_ = Version of the last update seen  #
+#                  UPDATE_SET_ = Changes since UPDATE_VERSION_        #
+#                  VM_ROWS_ = Properties of each VM, by moref         #
+#                  THIS_ROW_ = Properties of one VM                   #
+# Global Variables: ARGS_, VSPHERES_, VM_COLUMNS_, DAEMON_INVENTORY_, #
+#                   DAEMON_NAMES_, DAEMON_LOCK_, DAEMON_WAIT_SECONDS_,#
+#                   DAEMON_RETRY_SECONDS_                             #
+#######################################################################
+def watch_dc_func(DC_NAME_):
+    """
+    Keep the inventory of one Data Center current, forever; a filter
+    over the VM_COLUMNS_ properties of every VM is created on the
+    vSphere, and WaitForUpdatesEx then returns only what changed (the
+    first call returns everything); if anything fails, the inventory of
+    the Data Center is dropped, and the tool reconnects after
+    DAEMON_RETRY_SECONDS_
+      Arguments: DC_NAME_ - Data Center whose vSphere is watched
+      Returns: N/A (never)
+    """
+    while True:
+      try:
+        ESX_CONN_ = vsphere_connect_func(VSPHERES_[DC_NAME_])
+        SPHERE_CONTENT_ = ESX_CONN_.RetrieveContent()
+        VM_VIEW_ = SPHERE_CONTENT_.viewManager.CreateContainerView(
+                      SPHERE_CONTENT_.rootFolder, [vim.VirtualMachine], True)
+        # A PropertyCollector of my own, so the filter is not shared
+        #   with anything else using the session
+        WATCH_COLLECTOR_ = SPHERE_CONTENT_.propertyCollector.CreatePropertyCollector()
+        WATCH_COLLECTOR_.CreateFilter(vm_filter_spec_func(VM_VIEW_, VM_COLUMNS_),
+                                      partialUpdates=False)
+        WAIT_OPTIONS_ = vmodl.query.PropertyCollector.WaitOptions(
+                          maxWaitSeconds=DAEMON_WAIT_SECONDS_)
+        UPDATE_VERSION_ = ''
+        VM_ROWS_ = dict()
+        while True:
+          UPDATE_SET_ = WATCH_COLLECTOR_.WaitForUpdatesEx(UPDATE_VERSION_, WAIT_OPTIONS_)
+          # Nothing changed within DAEMON_WAIT_SECONDS_
+          if UPDATE_SET_ is None:
+            continue
+          with DAEMON_LOCK_:
+            for FILTER_UPDATE_ in UPDATE_SET_.filterSet:
+              for OBJECT_UPDATE_ in FILTER_UPDATE_.objectSet:
+                if OBJECT_UPDATE_.kind == 'leave':
+                  VM_ROWS_.pop(OBJECT_UPDATE_.obj._GetMoId(), None)
+                  continue
+                THIS_ROW_ = VM_ROWS_.setdefault(OBJECT_UPDATE_.obj._GetMoId(), dict())
+                for THIS_CHANGE_ in OBJECT_UPDATE_.changeSet:
+                  if THIS_CHANGE_.op == 'remove':
+                    THIS_ROW_.pop(THIS_CHANGE_.name, None)
+                  else:
+                    THIS_ROW_[THIS_CHANGE_.name] = THIS_CHANGE_.val
+            # The inventory is only served once the initial (possibly
+            #   truncated) update has been received in full
+            if not UPDATE_SET_.truncated:
+              DAEMON_INVENTORY_[DC_NAME_] = VM_ROWS_
+            DAEMON_NAMES_.pop(DC_NAME_, None)
+          if ARGS_.d:
+            print(DC_NAME_+' is at version '+str(UPDATE_SET_.version)+' with '+
+                  str(len(VM_ROWS_))+' VMs')
+          UPDATE_VERSION_ = UPDATE_SET_.version
+      except Exception as WATCH_ERROR_:
+        # Whatever went wrong, stop serving what may be stale data, and
+        #   start over
+        with DAEMON_LOCK_:
+          DAEMON_INVENTORY_.pop(DC_NAME_, None)
+          DAEMON_NAMES_.pop(DC_NAME_, None)
+        sys.stderr.write(time.strftime('%Y-%m-%d %H:%M:%S')+' '+DC_NAME_+': '+
+                         str(WATCH_ERROR_)+'\n')
+        # The connection is just dropped, not logged out: its session
+        #   is the one saved in SESSION_CACHE_DIR_, which every other
+        #   run of this tool is re-using
+        time.sleep(DAEMON_RETRY_SECONDS_)
+
+#######################################################################
+# Function: daemon_reply_func                                         #
+# Local Variables: VM_ROWS_ = Properties of each VM, by moref         #
+#                  VM_TABLE_ = Table of VM properties                 #
+#                  DC_NAMES_ = Set of the VM names of a Data Center   #
+#                  VM_EXISTS_ = Answers, by VM name                   #
+# Global Variables: VM_COLUMNS_, DAEMON_INVENTORY_, DAEMON_NAMES_,    #
+#                   DAEMON_LOCK_                                      #
+#######################################################################
+def daemon_reply_func(REQUEST_):
+    """
+    Answer one request made to the daemon, from its inventory
+      Arguments: REQUEST_ - Dictionary holding the 'op' and, for
+                "table", the 'dc', or for "exists", the 'names'
+      Returns: A Dictionary holding the 'table' (a VM table), or the
+                'exists' answers (by VM name; names of a Data Center
+                whose inventory is not current are left out), or an
+                'error'
+    """
+    with DAEMON_LOCK_:
+      if REQUEST_.get('op') == 'table':
+        if REQUEST_.get('dc') not in DAEMON_INVENTORY_:
+          return {'error': 'no inventory for '+str(REQUEST_.get('dc'))}
+        VM_ROWS_ = DAEMON_INVENTORY_[REQUEST_['dc']]
+        VM_TABLE_ = {THIS_COLUMN_: [THIS_ROW_.get(THIS_PATH_) for THIS_ROW_ in VM_ROWS_.values()]
+                     for THIS_COLUMN_, THIS_PATH_ in VM_COLUMNS_.items()}
+        VM_TABLE_['moref'] = list(VM_ROWS_)
+        return {'table': normalize_vm_table_func(VM_TABLE_)}
+      if REQUEST_.get('op') == 'exists':
+        VM_EXISTS_ = dict()
+        for THIS_NAME_ in REQUEST_.get('names', []):
+          if hostname_error_func(THIS_NAME_) is not None:
+            VM_EXISTS_[THIS_NAME_] = False
+            continue
+          if hostname_dc_func(THIS_NAME_) not in DAEMON_INVENTORY_:
+            continue
+          # The set of names is rebuilt only after the inventory changes
+          DC_NAMES_ = DAEMON_NAMES_.get(hostname_dc_func(THIS_NAME_))
+          if DC_NAMES_ is None:
+            DC_NAMES_ = set([str(THIS_ROW_.get('name'))
+                             for THIS_ROW_ in DAEMON_INVENTORY_[hostname_dc_func(THIS_NAME_)].values()])
+            DAEMON_NAMES_[hostname_dc_func(THIS_NAME_)] = DC_NAMES_
+          VM_EXISTS_[THIS_NAME_] = THIS_NAME_ in DC_NAMES_
+        return {'exists': VM_EXISTS_}
+    return {'error': 'unknown request'}
+
+# Declare a Class that handles one connection to the daemon's socket:
+#   a single line holding a JSON request, answered with a single line
+#   holding a JSON reply
+class DAEMON_HANDLER_(socketserver.StreamRequestHandler):
+    """
+    Read one request from a client of the daemon, and write the reply
+    """
+    def handle(self):
+      try:
+        REQUEST_ = json.loads(self.rfile.readline())
+        REPLY_ = daemon_reply_func(REQUEST_)
+      except (ValueError, AttributeError):
+        REPLY_ = {'error': 'malformed request'}
+      self.wfile.write((json.dumps(REPLY_)+'\n').encode())
+
+#######################################################################
+# Function: run_daemon_func                                           #
+# Local Variables: OLD_UMASK_ = umask to restore after bind()         #
+#                  DAEMON_SERVER_ = Server listening on the socket    #
+# Global Variables: ARGS_, DAEMON_SOCKET_                             #
+#######################################################################
+def run_daemon_func(DC_LIST_):
+    """
+    Run as a daemon (in the foreground, as a service manager expects):
+    watch the vSphere of each Data Center in its own thread, and answer
+    requests on the Unix socket DAEMON_SOCKET_ from the inventory kept
+    by those threads
+      Arguments: DC_LIST_ - List of Data Centers to watch
+      Returns: N/A (only returns on an interrupt or SIGTERM)
+    """
+    os.makedirs(os.path.dirname(DAEMON_SOCKET_), mode=0o750, exist_ok=True)
+    # A socket file left behind by an earlier daemon would block bind()
+    if os.path.exists(DAEMON_SOCKET_):
+      os.unlink(DAEMON_SOCKET_)
+    # Only the owner and group of the daemon may query it; the socket
+    #   is created with mode 0660 by bind() itself, so no one else can
+    #   connect to it even briefly (this is done before the watch
+    #   threads start, as the umask applies to the whole process)
+    OLD_UMASK_ = os.umask(0o117)
+    try:
+      DAEMON_SERVER_ = socketserver.ThreadingUnixStreamServer(DAEMON_SOCKET_, DAEMON_HANDLER_)
+    finally:
+      os.umask(OLD_UMASK_)
+    DAEMON_SERVER_.daemon_threads = True
+
+    for THIS_DC_ in DC_LIST_:
+      threading.Thread(target=watch_dc_func, args=(THIS_DC_,), daemon=True).start()
+    if ARGS_.d:
+      print('Listening on '+DAEMON_SOCKET_)
+    # A service manager stops the daemon with SIGTERM; treat it like an
+    #   interrupt, so the socket is removed
+    signal.signal(signal.SIGTERM, signal.default_int_handler)
+    try:
+      DAEMON_SERVER_.serve_forever()
+    except KeyboardInterrupt:
+      pass
+    finally:
+      DAEMON_SERVER_.server_close()
+      os.unlink(DAEMON_SOCKET_)
+
+#######################################################################
+# Function: daemon_request_func                                       #
+# Local Variables: CLIENT_SOCKET_ = Connection to the daemon          #
+#                  REPLY_ = Reply from the daemon                     #
+# Global Variables: ARGS_, DAEMON_SOCKET_, DAEMON_CLIENT_TIMEOUT_     #
+#######################################################################
+def daemon_request_func(REQUEST_):
+    """
+    Ask a running daemon (see --daemon) for something
+      Arguments: REQUEST_ - Dictionary holding the request (see
+                daemon_reply_func)
+      Returns: The reply Dictionary, or None if there is no daemon,
+                it did not answer, or it answered with an error
+    """
+    if not os.path.exists(DAEMON_SOCKET_):
+      return None
+    try:
+      with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as CLIENT_SOCKET_:
+        CLIENT_SOCKET_.settimeout(DAEMON_CLIENT_TIMEOUT_)
+        CLIENT_SOCKET_.connect(DAEMON_SOCKET_)
+        CLIENT_SOCKET_.sendall((json.dumps(REQUEST_)+'\n').encode())
+        with CLIENT_SOCKET_.makefile('rb') as REPLY_FILE_:
+          REPLY_ = json.loads(REPLY_FILE_.readline())
+    except (OSError, ValueError) as DAEMON_ERROR_:
+      if ARGS_.d:
+        print('No answer from the daemon ('+str(DAEMON_ERROR_)+')')
+      return None
+    if 'error' in REPLY_:
+      if ARGS_.d:
+        print('The daemon said: '+REPLY_['error'])
+      return None
+    return REPLY_
+
+#######################################################################
+# Function: add_block_func                                            #
+# Local Variables: BLOCK_OFFSET_ = Where the block starts             #
+# Global Variables: None                                              #
+#######################################################################
+def add_block_func(SNAPSHOT_BODY_, BLOCK_BYTES_):
+    """
+    Append one array to the body of a snapshot file, starting it on an
+    8-byte boundary
+      Arguments: SNAPSHOT_BODY_ - bytearray holding the body so far
+                 BLOCK_BYTES_ - Contents of the array
+      Returns: The offset of the array within the body
+    """
+    SNAPSHOT_BODY_.extend(bytes(-len(SNAPSHOT_BODY_) % 8))
+    BLOCK_OFFSET_ = len(SNAPSHOT_BODY_)
+    SNAPSHOT_BODY_.extend(BLOCK_BYTES_)
+    return BLOCK_OFFSET_
+
+#######################################################################
+# Function: write_snapshot_func                                       #
+# Local Variables: SNAPSHOT_HEADER_ = Description of the snapshot     #
+#                  SNAPSHOT_BODY_ = The column data                   #
+#                  DC_HEADER_ = Description of one Data Center        #
+#                  COLUMN_KIND_ = How a column is stored              #
+#                  ENUM_VALUES_ = Distinct values of an enum column   #
+#                  TEXT_VALUES_ = Encoded values of a text column     #
+#                  TEXT_OFFSETS_ = Where each text value starts       #
+#                  HEADER_BYTES_ = Encoded SNAPSHOT_HEADER_           #
+#                  TEMP_FILE_ = File written, then renamed            #
+# Global Variables: SNAPSHOT_MAGIC_, SNAPSHOT_VERSION_,               #
+#                   SNAPSHOT_KINDS_                                   #
+#######################################################################
+def write_snapshot_func(SNAPSHOT_FILE_, DC_RESULTS_):
+    """
+    Save the VM tables of one or more Data Centers in a snapshot file;
+    each column is stored as one contiguous array (integers as 32-bit
+    values, enumerations as one byte per VM plus the list of distinct
+    values, text as an array of offsets plus the UTF-8 text), after a
+    JSON header describing where each column is; the file is written
+    under a temporary name and renamed, so readers never see half of it
+      Arguments: SNAPSHOT_FILE_ - Path of the snapshot file
+                 DC_RESULTS_ - Dictionary of tuples of a VM table and
+                  the seconds its collection took, by Data Center
+      Returns: N/A
+    """
+    SNAPSHOT_HEADER_ = {'created': time.time(), 'byteorder': sys.byteorder, 'dcs': dict()}
+    SNAPSHOT_BODY_ = bytearray()
+
+    for THIS_DC_, (VM_TABLE_, DC_WALL_TIME_) in DC_RESULTS_.items():
+      DC_HEADER_ = {'rows': len(VM_TABLE_['name']), 'wall_time': DC_WALL_TIME_,
+                    'columns': dict()}
+      for THIS_COLUMN_, THIS_VALUES_ in VM_TABLE_.items():
+        COLUMN_KIND_ = SNAPSHOT_KINDS_.get(THIS_COLUMN_, 'text')
+        if COLUMN_KIND_ == 'int':
+          DC_HEADER_['columns'][THIS_COLUMN_] = {'kind': 'int',
+            'offset': add_block_func(SNAPSHOT_BODY_, array.array('i', THIS_VALUES_).tobytes())}
+          continue
+        if COLUMN_KIND_ == 'enum':
+          ENUM_VALUES_ = sorted(set(THIS_VALUES_))
+          # More distinct values than fit in a byte is stored as text
+          if len(ENUM_VALUES_) <= 256:
+            ENUM_CODES_ = {THIS_VALUE_: THIS_CODE_ for THIS_CODE_, THIS_VALUE_ in enumerate(ENUM_VALUES_)}
+            DC_HEADER_['columns'][THIS_COLUMN_] = {'kind': 'enum', 'values': ENUM_VALUES_,
+              'offset': add_block_func(SNAPSHOT_BODY_, bytes([ENUM_CODES_[THIS_VALUE_] for THIS_VALUE_ in THIS_VALUES_]))}
+            continue
+        TEXT_VALUES_ = [str(THIS_VALUE_).encode() for THIS_VALUE_ in THIS_VALUES_]
+        TEXT_OFFSETS_ = array.array('I', [0])
+        for THIS_TEXT_ in TEXT_VALUES_:
+          TEXT_OFFSETS_.append(TEXT_OFFSETS_[-1] + len(THIS_TEXT_))
+        DC_HEADER_['columns'][THIS_COLUMN_] = {'kind': 'text',
+          'offset': add_block_func(SNAPSHOT_BODY_, TEXT_OFFSETS_.tobytes()),
+          'text_offset': add_block_func(SNAPSHOT_BODY_, b''.join(TEXT_VALUES_))}
+      SNAPSHOT_HEADER_['dcs'][THIS_DC_] = DC_HEADER_
+
+    HEADER_BYTES_ = json.dumps(SNAPSHOT_HEADER_).encode()
+    HEADER_BYTES_ += b' ' * (-(len(SNAPSHOT_MAGIC_) + 8 + len(HEADER_BYTES_)) % 8)
+    TEMP_FILE_ = SNAPSHOT_FILE_ + '.' + str(os.getpid())
+    with open(TEMP_FILE_, mode='wb') as FILE_OBJECT_:
+      FILE_OBJECT_.write(SNAPSHOT_MAGIC_ + struct.pack('<II', SNAPSHOT_VERSION_, len(HEADER_BYTES_)))
+      FILE_OBJECT_.write(HEADER_BYTES_)
+      FILE_OBJECT_.write(SNAPSHOT_BODY_)
+    os.replace(TEMP_FILE_, SNAPSHOT_FILE_)
+
+#######################################################################
+# Function: read_snapshot_func                                        #
+# Local Variables: SNAPSHOT_MAP_ = Memory map of the snapshot file    #
+#                  SNAPSHOT_VIEW_ = memoryview of SNAPSHOT_MAP_       #
+#                  SNAPSHOT_HEADER_ = Description of the snapshot     #
+#                  BODY_START_ = Where the column data starts         #
+#                  DC_RESULTS_ = The VM tables read                   #
+#                  VM_TABLE_ = VM table of one Data Center            #
+#                  COLUMN_START_ = Where a column's array starts      #
+#                  TEXT_OFFSETS_ = Where each text value starts       #
+# Global Variables: SNAPSHOT_MAGIC_, SNAPSHOT_VERSION_                #
+#######################################################################
+def read_snapshot_func(SNAPSHOT_FILE_):
+    """
+    Load the VM tables saved in a snapshot file; the file is memory-
+    mapped, and the integer columns are used in place, without being
+    copied (text and enumeration columns are decoded)
+      Arguments: SNAPSHOT_FILE_ - Path of the snapshot file
+      Returns: A tuple of the time the snapshot was created, and a
+                Dictionary of tuples of a VM table and the seconds its
+                collection took, by Data Center
+      Raises: OSError if the file can not be read, ValueError if it is
+                not a snapshot this version of the tool understands
+    """
+    with open(SNAPSHOT_FILE_, mode='rb') as FILE_OBJECT_:
+      SNAPSHOT_MAP_ = mmap.mmap(FILE_OBJECT_.fileno(), 0, access=mmap.ACCESS_READ)
+    SNAPSHOT_VIEW_ = memoryview(SNAPSHOT_MAP_)
+    if bytes(SNAPSHOT_VIEW_[0:len(SNAPSHOT_MAGIC_)]) != SNAPSHOT_MAGIC_:
+      raise ValueError('not a vmreport.py snapshot')
+    (FILE_VERSION_, HEADER_LENGTH_) = struct.unpack_from('<II', SNAPSHOT_VIEW_, len(SNAPSHOT_MAGIC_))
+    if FILE_VERSION_ != SNAPSHOT_VERSION_:
+      raise ValueError('snapshot format version '+str(FILE_VERSION_)+
+                       ' is not supported (expected '+str(SNAPSHOT_VERSION_)+')')
+    BODY_START_ = len(SNAPSHOT_MAGIC_) + 8 + HEADER_LENGTH_
+    SNAPSHOT_HEADER_ = json.loads(bytes(SNAPSHOT_VIEW_[len(SNAPSHOT_MAGIC_) + 8:BODY_START_]))
+
+    DC_RESULTS_ = dict()
+    for THIS_DC_, DC_HEADER_ in SNAPSHOT_HEADER_['dcs'].items():
+      VM_TABLE_ = dict()
+      for THIS_COLUMN_, COLUMN_HEADER_ in DC_HEADER_['columns'].items():
+        COLUMN_START_ = BODY_START_ + COLUMN_HEADER_['offset']
+        if COLUMN_HEADER_['kind'] == 'int':
+          VM_TABLE_[THIS_COLUMN_] = SNAPSHOT_VIEW_[COLUMN_START_:COLUMN_START_ +
+                                      4 * DC_HEADER_['rows']].cast('i')
+          # A snapshot from a machine of the other byte order has to
+          #   be converted
+          if SNAPSHOT_HEADER_['byteorder'] != sys.byteorder:
+            VM_TABLE_[THIS_COLUMN_] = array.array('i', VM_TABLE_[THIS_COLUMN_])
+            VM_TABLE_[THIS_COLUMN_].byteswap()
+        elif COLUMN_HEADER_['kind'] == 'enum':
+          VM_TABLE_[THIS_COLUMN_] = [COLUMN_HEADER_['values'][THIS_CODE_] for THIS_CODE_ in
+                                     SNAPSHOT_VIEW_[COLUMN_START_:COLUMN_START_ + DC_HEADER_['rows']]]
+        else:
+          TEXT_OFFSETS_ = array.array('I')
+          TEXT_OFFSETS_.frombytes(SNAPSHOT_VIEW_[COLUMN_START_:COLUMN_START_ +
+                                                 4 * (DC_HEADER_['rows'] + 1)])
+          if SNAPSHOT_HEADER_['byteorder'] != sys.byteorder:
+            TEXT_OFFSETS_.byteswap()
+          COLUMN_START_ = BODY_START_ + COLUMN_HEADER_['text_offset']
+          VM_TABLE_[THIS_COLUMN_] = [str(SNAPSHOT_VIEW_[COLUMN_START_ + TEXT_OFFSETS_[THIS_ROW_]:
+                                                        COLUMN_START_ + TEXT_OFFSETS_[THIS_ROW_ + 1]], 'utf-8')
+                                     for THIS_ROW_ in range(DC_HEADER_['rows'])]
+      DC_RESULTS_[THIS_DC_] = (VM_TABLE_, DC_HEADER_['wall_time'])
+    return(SNAPSHOT_HEADER_['created'], DC_RESULTS_)
+
+#######################################################################
+# Function: diff_snapshots_func                                       #
+# Local Variables: OLD_ROWS_ = Rows of the older table, by moref      #
+#                  NEW_ROWS_ = Rows of the newer table, by moref      #
+#                  COLUMN_LIST_ = Columns compared                    #
+#                  CHANGE_COUNTS_ = Number of each kind of change     #
+# Global Variables: None                                              #
+#######################################################################
+def diff_snapshots_func(OLD_TABLE_, NEW_TABLE_):
+    """
+    Display the VMs that appeared, disappeared or changed between two
+    VM tables of the same Data Center; VMs are matched by moref (the
+    name is not unique, since an FT pair shares it)
+      Arguments: OLD_TABLE_ - VM table from the older snapshot
+                 NEW_TABLE_ - VM table from the newer snapshot
+      Returns: A tuple of the number of VMs that appeared, disappeared
+                and changed
+    """
+    COLUMN_LIST_ = [THIS_COLUMN_ for THIS_COLUMN_ in NEW_TABLE_
+                    if (THIS_COLUMN_ in OLD_TABLE_) and (THIS_COLUMN_ != 'moref')]
+    OLD_ROWS_ = {THIS_MOREF_: THIS_ROW_ for THIS_ROW_, THIS_MOREF_ in
+                 enumerate(OLD_TABLE_['moref'])}
+    NEW_ROWS_ = {THIS_MOREF_: THIS_ROW_ for THIS_ROW_, THIS_MOREF_ in
+                 enumerate(NEW_TABLE_['moref'])}
+    CHANGE_COUNTS_ = [0, 0, 0]
+    for THIS_MOREF_, THIS_ROW_ in NEW_ROWS_.items():
+      if THIS_MOREF_ not in OLD_ROWS_:
+        print('\t\t'+ANSI_.BOLD_TEXT+ANSI_.GREEN_BLACK+'+ '+ANSI_.ALL_OFF+
+              NEW_TABLE_['name'][THIS_ROW_])
+        CHANGE_COUNTS_[0] += 1
+        continue
+      CHANGE_LIST_ = [THIS_COLUMN_+': '+str(OLD_TABLE_[THIS_COLUMN_][OLD_ROWS_[THIS_MOREF_]])+
+                      ' -> '+str(NEW_TABLE_[THIS_COLUMN_][THIS_ROW_])
+                      for THIS_COLUMN_ in COLUMN_LIST_
+                      if OLD_TABLE_[THIS_COLUMN_][OLD_ROWS_[THIS_MOREF_]] != NEW_TABLE_[THIS_COLUMN_][THIS_ROW_]]
+      if CHANGE_LIST_:
+        print('\t\t'+ANSI_.BOLD_TEXT+ANSI_.YELLOW_BLACK+'~ '+ANSI_.ALL_OFF+
+              NEW_TABLE_['name'][THIS_ROW_]+'\t'+', '.join(CHANGE_LIST_))
+        CHANGE_COUNTS_[2] += 1
+    for THIS_MOREF_, THIS_ROW_ in OLD_ROWS_.items():
+      if THIS_MOREF_ not in NEW_ROWS_:
+        print('\t\t'+ANSI_.BOLD_TEXT+ANSI_.RED_BLACK+'- '+ANSI_.ALL_OFF+
+              OLD_TABLE_['name'][THIS_ROW_])
+        CHANGE_COUNTS_[1] += 1
+    return tuple(CHANGE_COUNTS_)
+
 #################
 # Program Start #
 #################
@@ -299,10 +1513,21 @@ DESC_TEXT_ = ('\n'+ANSI_.BOLD_TEXT+OUR_TOOL_+' - '+ANSI_.GREEN_BLACK+
               ANSI_.BLUE_BLACK+' v'+TOOL_VERSION_+ANSI_.ALL_OFF)
 HELP_TEXT_ = (DESC_TEXT_+'\n\n\t'+ ANSI_.BOLD_TEXT+'Usage:'+ANSI_.ALL_OFF+
               ' %(prog)s [ [ '+ANSI_.BOLD_TEXT+'-c'+ANSI_.BLUE_BLACK+
-              ' <HOSTNAME>'+ANSI_.ALL_OFF+' | '+ANSI_.BOLD_TEXT+'-e'+
+              ' <HOSTNAME>'+ANSI_.ALL_OFF+' | '+ANSI_.BOLD_TEXT+'-f'+
+              ANSI_.BLUE_BLACK+' <FILE>'+ANSI_.ALL_OFF+' | '+ANSI_.BOLD_TEXT+'-e'+
+              ANSI_.ALL_OFF+' | '+ANSI_.BOLD_TEXT+'-w'+ANSI_.ALL_OFF+
+              ' ] [ '+ANSI_.BOLD_TEXT+'--max-age'+ANSI_.BLUE_BLACK+
+              ' <SECONDS>'+ANSI_.ALL_OFF+' ] | '+ANSI_.BOLD_TEXT+
+              '--diff'+ANSI_.BLUE_BLACK+' <OLD> <NEW>'+ANSI_.ALL_OFF+' | [ '+
+              ANSI_.BOLD_TEXT+'--save'+ANSI_.BLUE_BLACK+' <FILE>'+ANSI_.ALL_OFF+
+              ' | '+ANSI_.BOLD_TEXT+'--from'+ANSI_.BLUE_BLACK+' <FILE>'+
+              ANSI_.ALL_OFF+' ] [ '+ANSI_.BOLD_TEXT+'-e'+ANSI_.ALL_OFF+
+              ' | '+ANSI_.BOLD_TEXT+'-w'+ANSI_.ALL_OFF+' ] | '+ANSI_.BOLD_TEXT+
+              '--daemon'+ANSI_.ALL_OFF+' [ '+ANSI_.BOLD_TEXT+'-e'+
               ANSI_.ALL_OFF+' | '+ANSI_.BOLD_TEXT+'-w'+ANSI_.ALL_OFF+
               ' ] | '+ANSI_.BOLD_TEXT+'-h'+ANSI_.ALL_OFF+' ]')
 EPILOG_TEXT_ = ('\tThe '+ANSI_.BOLD_TEXT+'-c'+ANSI_.ALL_OFF+', '+
+                ANSI_.BOLD_TEXT+'-f'+ANSI_.ALL_OFF+', '+
                 ANSI_.BOLD_TEXT+'-e'+ANSI_.ALL_OFF+' and '+
                 ANSI_.BOLD_TEXT+'-w'+ANSI_.ALL_OFF+
                 ' command-line flags conflict with each other\n \n')
@@ -329,6 +1554,60 @@ COMMAND_LINE_.add_argument('-c', action='store', default='',
 COMMAND_LINE_.add_argument('-d', action='store_true',
                   help="Enable debugging messages to "+ANSI_.BOLD_TEXT+
                   "stdout"+ANSI_.ALL_OFF)
+COMMAND_LINE_.add_argument('-f', action='store', default='',
+                  metavar=ANSI_.BOLD_TEXT+'<FILE>'+ANSI_.ALL_OFF+
+                  '\t\tLook up a list of hosts, one per line, read from '+
+                  ANSI_.BOLD_TEXT+'<FILE>'+ANSI_.ALL_OFF+' (use '+
+                  ANSI_.BOLD_TEXT+'-'+ANSI_.ALL_OFF+' for '+ANSI_.BOLD_TEXT+
+                  'stdin'+ANSI_.ALL_OFF+')',
+                  help='\tWrites to '+ANSI_.BOLD_TEXT+'stdout'+ANSI_.ALL_OFF+
+                  ' one line per host name, holding the name, a TAB, and '+
+                  ANSI_.BOLD_TEXT+'1'+ANSI_.ALL_OFF+'\n\tif the host exists, '+
+                  ANSI_.BOLD_TEXT+'0'+ANSI_.ALL_OFF+' otherwise (conflicts with '+
+                  ANSI_.BOLD_TEXT+'-c'+ANSI_.ALL_OFF+', '+ANSI_.BOLD_TEXT+'-e'+
+                  ANSI_.ALL_OFF+' and '+ANSI_.BOLD_TEXT+'-w'+ANSI_.ALL_OFF+')')
+COMMAND_LINE_.add_argument('--max-age', action='store', type=int,
+                  default=NAME_CACHE_TTL_,
+                  metavar=ANSI_.BOLD_TEXT+'<SECONDS>'+ANSI_.ALL_OFF+
+                  '\tMaximum age of the local VM name cache used to answer '+
+                  ANSI_.BOLD_TEXT+'-c'+ANSI_.ALL_OFF+' and '+ANSI_.BOLD_TEXT+
+                  '-f'+ANSI_.ALL_OFF,
+                  help='\tDefault is '+ANSI_.BOLD_TEXT+str(NAME_CACHE_TTL_)+
+                  ANSI_.ALL_OFF+'; '+ANSI_.BOLD_TEXT+'0'+ANSI_.ALL_OFF+
+                  ' always contacts the vSphere')
+COMMAND_LINE_.add_argument('--daemon', action='store_true',
+                  help='Run as a daemon, keeping the VM inventory current and answering\n\t'+
+                  'the listing, '+ANSI_.BOLD_TEXT+'-c'+ANSI_.ALL_OFF+' and '+
+                  ANSI_.BOLD_TEXT+'-f'+ANSI_.ALL_OFF+' for other invocations on '+
+                  ANSI_.BOLD_TEXT+DAEMON_SOCKET_+ANSI_.ALL_OFF+'\n\t(conflicts with '+
+                  ANSI_.BOLD_TEXT+'-c'+ANSI_.ALL_OFF+' and '+ANSI_.BOLD_TEXT+
+                  '-f'+ANSI_.ALL_OFF+')')
+COMMAND_LINE_.add_argument('--diff', action='store', nargs=2, default=None,
+                  metavar=(ANSI_.BOLD_TEXT+'<OLD>'+ANSI_.ALL_OFF,
+                  ANSI_.BOLD_TEXT+'<NEW>'+ANSI_.ALL_OFF+'\tShow the VMs that appeared, '+
+                  'disappeared or changed between two snapshot files'),
+                  help='\tHonors '+ANSI_.BOLD_TEXT+'-e'+ANSI_.ALL_OFF+' and '+
+                  ANSI_.BOLD_TEXT+'-w'+ANSI_.ALL_OFF)
+COMMAND_LINE_.add_argument('--fields', action='store', default='',
+                  metavar=ANSI_.BOLD_TEXT+'<LIST>'+ANSI_.ALL_OFF+
+                  '\t\tAdd columns to the listing, separated by commas: '+
+                  ANSI_.BOLD_TEXT+', '.join(FIELD_COLUMNS_)+ANSI_.ALL_OFF,
+                  help='\tOnly the properties of the requested columns are retrieved')
+COMMAND_LINE_.add_argument('--from', action='store', default='', dest='from_file',
+                  metavar=ANSI_.BOLD_TEXT+'<FILE>'+ANSI_.ALL_OFF+
+                  '\t\tDisplay the listing from a snapshot file instead of the vSpheres',
+                  help='\tHonors '+ANSI_.BOLD_TEXT+'-e'+ANSI_.ALL_OFF+' and '+
+                  ANSI_.BOLD_TEXT+'-w'+ANSI_.ALL_OFF)
+COMMAND_LINE_.add_argument('--profile-startup', action='store_true',
+                  help='Report (on stderr) how long each phase of startup took')
+COMMAND_LINE_.add_argument('--save', action='store', default='',
+                  metavar=ANSI_.BOLD_TEXT+'<FILE>'+ANSI_.ALL_OFF+
+                  '\t\tSave what the listing collected in a snapshot file',
+                  help='\tConflicts with '+ANSI_.BOLD_TEXT+'--from'+ANSI_.ALL_OFF+
+                  ' and '+ANSI_.BOLD_TEXT+'--diff'+ANSI_.ALL_OFF)
+COMMAND_LINE_.add_argument('--summary', action='store_true',
+                  help='Display the capacity (VMs, vCPU, vRAM and overcommit) of each\n'+
+                  '\tcluster and ESXi host, instead of the VMs')
 COMMAND_LINE_.add_argument('-e', action='store_true',
                   help='Limit output to '+ANSI_.BOLD_TEXT+ANSI_.YELLOW_BLACK+
                   'DC1-based'+ANSI_.ALL_OFF+' VMs (conflicts with '+
@@ -341,11 +1620,25 @@ COMMAND_LINE_.add_argument('-w', action='store_true',
                   ANSI_.BOLD_TEXT+'-e'+ANSI_.ALL_OFF+')')
 # Parse the command-line based on the added arguments
 ARGS_ = COMMAND_LINE_.parse_args()
+STARTUP_PHASES_.append(('module imports', IMPORTS_SECONDS_))
+STARTUP_CLOCK_ += IMPORTS_SECONDS_
+note_startup_func('definitions and argument parsing')
+if ARGS_.profile_startup:
+  atexit.register(print_startup_func)
 
 if ARGS_.d:
   print('ARGS_.c is ' + ARGS_.c)
   print('ARGS_.d is ' + str(ARGS_.d))
+  print('ARGS_.daemon is ' + str(ARGS_.daemon))
+  print('ARGS_.diff is ' + str(ARGS_.diff))
   print('ARGS_.e is ' + str(ARGS_.e))
+  print('ARGS_.f is ' + ARGS_.f)
+  print('ARGS_.fields is ' + ARGS_.fields)
+  print('ARGS_.from_file is ' + ARGS_.from_file)
+  print('ARGS_.max_age is ' + str(ARGS_.max_age))
+  print('ARGS_.profile_startup is ' + str(ARGS_.profile_startup))
+  print('ARGS_.save is ' + ARGS_.save)
+  print('ARGS_.summary is ' + str(ARGS_.summary))
   print('ARGS_.w is ' + str(ARGS_.w))
 
 # Validate command-line options
@@ -364,6 +1657,85 @@ if (ARGS_.e or ARGS_.w) and ARGS_.c != '':
         ' and '+ANSI_.BLUE_BLACK+'-w'+ANSI_.ALL_OFF+'\n')
   sys.exit(255)
 
+# -f conflicts with -c, -e and -w
+if (ARGS_.e or ARGS_.w or ARGS_.c != '') and ARGS_.f != '':
+  print(DESC_TEXT_+'\n\n\t'+ANSI_.BOLD_TEXT+ANSI_.MAGENTA_BLACK+
+        'FATAL ERROR: '+ANSI_.BLUE_BLACK+'-f'+ANSI_.RED_BLACK+
+        ' conflicts with '+ANSI_.BLUE_BLACK+'-c'+ANSI_.RED_BLACK+', '+
+        ANSI_.BLUE_BLACK+'-e'+ANSI_.RED_BLACK+' and '+ANSI_.BLUE_BLACK+
+        '-w'+ANSI_.ALL_OFF+'\n')
+  sys.exit(255)
+
+# --daemon conflicts with -c and -f
+if ARGS_.daemon and (ARGS_.c != '' or ARGS_.f != ''):
+  print(DESC_TEXT_+'\n\n\t'+ANSI_.BOLD_TEXT+ANSI_.MAGENTA_BLACK+
+        'FATAL ERROR: '+ANSI_.BLUE_BLACK+'--daemon'+ANSI_.RED_BLACK+
+        ' conflicts with '+ANSI_.BLUE_BLACK+'-c'+ANSI_.RED_BLACK+' and '+
+        ANSI_.BLUE_BLACK+'-f'+ANSI_.ALL_OFF+'\n')
+  sys.exit(255)
+
+# The snapshot options are only for the listing, and only one of them
+#   can be used at a time
+if (ARGS_.save != '' or ARGS_.from_file != '' or ARGS_.diff is not None) and \
+   (ARGS_.c != '' or ARGS_.f != '' or ARGS_.daemon):
+  print(DESC_TEXT_+'\n\n\t'+ANSI_.BOLD_TEXT+ANSI_.MAGENTA_BLACK+
+        'FATAL ERROR: '+ANSI_.BLUE_BLACK+'--save'+ANSI_.RED_BLACK+', '+
+        ANSI_.BLUE_BLACK+'--from'+ANSI_.RED_BLACK+' and '+ANSI_.BLUE_BLACK+
+        '--diff'+ANSI_.RED_BLACK+' conflict with '+ANSI_.BLUE_BLACK+'-c'+
+        ANSI_.RED_BLACK+', '+ANSI_.BLUE_BLACK+'-f'+ANSI_.RED_BLACK+' and '+
+        ANSI_.BLUE_BLACK+'--daemon'+ANSI_.ALL_OFF+'\n')
+  sys.exit(255)
+if [ARGS_.save != '', ARGS_.from_file != '', ARGS_.diff is not None].count(True) > 1:
+  print(DESC_TEXT_+'\n\n\t'+ANSI_.BOLD_TEXT+ANSI_.MAGENTA_BLACK+
+        'FATAL ERROR: '+ANSI_.BLUE_BLACK+'--save'+ANSI_.RED_BLACK+', '+
+        ANSI_.BLUE_BLACK+'--from'+ANSI_.RED_BLACK+' and '+ANSI_.BLUE_BLACK+
+        '--diff'+ANSI_.RED_BLACK+' conflict with each other'+ANSI_.ALL_OFF+'\n')
+  sys.exit(255)
+
+# --fields only applies to the listing, and only names fields I know
+FIELD_LIST_ = [THIS_FIELD_.strip() for THIS_FIELD_ in ARGS_.fields.split(',')
+               if THIS_FIELD_.strip() != '']
+if FIELD_LIST_ and (ARGS_.c != '' or ARGS_.f != '' or ARGS_.daemon or ARGS_.diff is not None):
+  print(DESC_TEXT_+'\n\n\t'+ANSI_.BOLD_TEXT+ANSI_.MAGENTA_BLACK+
+        'FATAL ERROR: '+ANSI_.BLUE_BLACK+'--fields'+ANSI_.RED_BLACK+
+        ' conflicts with '+ANSI_.BLUE_BLACK+'-c'+ANSI_.RED_BLACK+', '+
+        ANSI_.BLUE_BLACK+'-f'+ANSI_.RED_BLACK+', '+ANSI_.BLUE_BLACK+'--daemon'+
+        ANSI_.RED_BLACK+' and '+ANSI_.BLUE_BLACK+'--diff'+ANSI_.ALL_OFF+'\n')
+  sys.exit(255)
+for THIS_FIELD_ in FIELD_LIST_:
+  if THIS_FIELD_ not in FIELD_COLUMNS_:
+    print(DESC_TEXT_+'\n\n\t'+ANSI_.BOLD_TEXT+ANSI_.MAGENTA_BLACK+
+          'FATAL ERROR: '+ANSI_.RED_BLACK+'Unknown field '+ANSI_.BLUE_BLACK+
+          THIS_FIELD_+ANSI_.RED_BLACK+' (known fields are '+
+          ', '.join(FIELD_COLUMNS_)+')'+ANSI_.ALL_OFF+'\n')
+    sys.exit(255)
+# --summary needs the hosts from the vSpheres themselves
+if ARGS_.summary and (ARGS_.c != '' or ARGS_.f != '' or ARGS_.daemon or
+                      ARGS_.diff is not None or ARGS_.from_file != ''):
+  print(DESC_TEXT_+'\n\n\t'+ANSI_.BOLD_TEXT+ANSI_.MAGENTA_BLACK+
+        'FATAL ERROR: '+ANSI_.BLUE_BLACK+'--summary'+ANSI_.RED_BLACK+
+        ' conflicts with '+ANSI_.BLUE_BLACK+'-c'+ANSI_.RED_BLACK+', '+
+        ANSI_.BLUE_BLACK+'-f'+ANSI_.RED_BLACK+', '+ANSI_.BLUE_BLACK+'--daemon'+
+        ANSI_.RED_BLACK+', '+ANSI_.BLUE_BLACK+'--diff'+ANSI_.RED_BLACK+' and '+
+        ANSI_.BLUE_BLACK+'--from'+ANSI_.ALL_OFF+'\n')
+  sys.exit(255)
+
+# The columns the listing retrieves
+LISTING_COLUMNS_ = dict(VM_COLUMNS_)
+for THIS_FIELD_ in FIELD_LIST_:
+  LISTING_COLUMNS_[THIS_FIELD_] = FIELD_COLUMNS_[THIS_FIELD_]
+if ARGS_.summary:
+  LISTING_COLUMNS_['host'] = FIELD_COLUMNS_['host']
+
+# The name cache age limit can not be negative
+if ARGS_.max_age < 0:
+  print(DESC_TEXT_+'\n\n\t'+ANSI_.BOLD_TEXT+ANSI_.MAGENTA_BLACK+
+        'FATAL ERROR: '+ANSI_.BLUE_BLACK+'--max-age'+ANSI_.RED_BLACK+
+        ' can not be negative'+ANSI_.ALL_OFF+'\n')
+  sys.exit(255)
+
+note_startup_func('argument validation')
+
 # Was -c specified?
 if ARGS_.c != '':
   # Yes, I need to validate the hostname
@@ -382,40 +1754,37 @@ if ARGS_.c != '':
     print('ARGS_.c[4:6] is ' + ARGS_.c[4:6])
     print('ARGS_.c[6:8] is ' + ARGS_.c[6:8])
 
-  # Must be 13 characters, no more or less
-  if len(ARGS_.c) != 13:
-    print(DESC_TEXT_+'\n\n\t'+ANSI_.BOLD_TEXT+ANSI_.MAGENTA_BLACK+
-          'FATAL ERROR A: '+ANSI_.ALL_OFF+ANSI_.BOLD_TEXT+ARGS_.c+
-          ANSI_.RED_BLACK+' is not a valid hostname (length)'+
-          ANSI_.ALL_OFF + '\n')
-    sys.exit(254)
-  elif (ARGS_.c[0:2] != 'dc'):
-    # First two must be 'dc'
-    print(DESC_TEXT_+'\n\n\t'+ANSI_.BOLD_TEXT+ANSI_.MAGENTA_BLACK+
-          'FATAL ERROR B: '+ANSI_.ALL_OFF+ANSI_.BOLD_TEXT+ARGS_.c+
-          ANSI_.RED_BLACK+' is not a valid hostname ('+ARGS_.c[0:2]+
-          ')'+ANSI_.ALL_OFF+'\n')
-    sys.exit(253)
-  elif (ARGS_.c[4:6] != 'xx'):
-    # The 5th and 6th characters must be 'xx'
+  HOSTNAME_ERROR_ = hostname_error_func(ARGS_.c)
+  if HOSTNAME_ERROR_ is not None:
     print(DESC_TEXT_+'\n\n\t'+ANSI_.BOLD_TEXT+ANSI_.MAGENTA_BLACK+
-          'FATAL ERROR C: '+ANSI_.ALL_OFF+ANSI_.BOLD_TEXT+ARGS_.c+
-          ANSI_.RED_BLACK+' is not a valid hostname ('+ARGS_.c[4:6]+
-          ')'+ANSI_.ALL_OFF+'\n')
-    sys.exit(252)
-  elif (ARGS_.c[6:8] != '00'):
-    # The 7th and 8th characters must be '00'
-    print(DESC_TEXT_+'\n\n\t'+ANSI_.BOLD_TEXT+ANSI_.MAGENTA_BLACK+
-          'FATAL ERROR D: '+ANSI_.ALL_OFF+ANSI_.BOLD_TEXT+ARGS_.c+
-          ANSI_.RED_BLACK+' is not a valid hostname ('+ARGS_.c[6:8]+')'+
+          'FATAL ERROR '+HOSTNAME_ERROR_[0]+': '+ANSI_.ALL_OFF+
+          ANSI_.BOLD_TEXT+ARGS_.c+ANSI_.RED_BLACK+
+          ' is not a valid hostname ('+HOSTNAME_ERROR_[1]+')'+
           ANSI_.ALL_OFF+'\n')
-    sys.exit(251)
+    sys.exit(HOSTNAME_ERROR_[2])
+  # Determine Data Center based on 3rd character
+  QUERY_NAMES_ = [ARGS_.c]
+  VSPHERE_LIST_ = [hostname_dc_func(ARGS_.c)]
+
+elif ARGS_.f != '':
+  # Read the list of host names; blank lines are ignored
+  if ARGS_.f == '-':
+    QUERY_NAMES_ = [THIS_LINE_.strip() for THIS_LINE_ in sys.stdin]
   else:
-    # Determine Data Center based on 3rd character
-    if (ARGS_.c[2:1] == '1'):
-      VSPHERE_LIST_ = [VSPHERES_['DC1']]
-    else:
-      VSPHERE_LIST_ = [VSPHERES_['DC2']]
+    try:
+      with open(ARGS_.f, mode='r') as FILE_OBJECT_:
+        QUERY_NAMES_ = [THIS_LINE_.strip() for THIS_LINE_ in FILE_OBJECT_]
+    except OSError as FILE_ERROR_:
+      print(DESC_TEXT_+'\n\n\t'+ANSI_.BOLD_TEXT+ANSI_.MAGENTA_BLACK+
+            'FATAL ERROR: '+ANSI_.RED_BLACK+'Unable to read '+
+            ANSI_.BLUE_BLACK+ARGS_.f+ANSI_.RED_BLACK+' ('+str(FILE_ERROR_)+
+            ')'+ANSI_.ALL_OFF+'\n')
+      sys.exit(255)
+  QUERY_NAMES_ = [THIS_NAME_ for THIS_NAME_ in QUERY_NAMES_ if THIS_NAME_ != '']
+  # Only contact the vSpheres that valid names belong to; an invalid
+  #   name is simply reported as not existing
+  VSPHERE_LIST_ = sorted(set([hostname_dc_func(THIS_NAME_) for THIS_NAME_ in QUERY_NAMES_
+                              if hostname_error_func(THIS_NAME_) is None]))
 
 else:
   #####################################################################
@@ -430,53 +1799,193 @@ else:
     # Yes - I already know that BOTH -e and -c were
     #       not specified, so I only have to test for one
     if ARGS_.e:
-      VSPHERE_LIST_ = [VSPHERES_['DC1']]
+      VSPHERE_LIST_ = ['DC1']
     else:
-      VSPHERE_LIST_ = [VSPHERES_['DC2']]
+      VSPHERE_LIST_ = ['DC2']
   else:
     # No, so I'm getting the full listing (both DCs)
-    VSPHERE_LIST_ = [VSPHERES_['DC1'], VSPHERES_['DC2']]
+    VSPHERE_LIST_ = ['DC1', 'DC2']
 
-# VSPHERE_LIST_ is now populated with the list of vSphere
-#       servers I'll be contacting
+# VSPHERE_LIST_ is now populated with the list of Data Centers whose
+#       vSphere servers I'll be contacting
 
-# If not invoked with -c, ID this tool
-if (ARGS_.c == ''):
+# If not invoked with -c or -f, ID this tool
+if (ARGS_.c == '') and (ARGS_.f == ''):
   print(DESC_TEXT_)
 # Debugging ouput
 if ARGS_.d:
   print('VSPHERE_LIST_ is ' + str(VSPHERE_LIST_))
 
-# Cycle through list of vSphere servers
-for VSPHERE_TARGET_ in VSPHERE_LIST_:
+# As a daemon, this is all I do
+if ARGS_.daemon:
+  run_daemon_func(VSPHERE_LIST_)
+  sys.exit(0)
+
+# -c and -f are answered from the name cache where possible, and the
+#   vSpheres are only contacted for the names it can not answer
+if (ARGS_.c != '') or (ARGS_.f != ''):
+  NAME_CACHE_ = open_name_cache_func()
+  VM_EXISTS_ = dict()
+  # A running daemon answers first
+  DAEMON_REPLY_ = daemon_request_func({'op': 'exists', 'names': QUERY_NAMES_})
+  if DAEMON_REPLY_ is not None:
+    VM_EXISTS_.update(DAEMON_REPLY_['exists'])
+  PENDING_NAMES_ = {THIS_DC_: [] for THIS_DC_ in VSPHERE_LIST_}
+  for THIS_NAME_ in QUERY_NAMES_:
+    if THIS_NAME_ in VM_EXISTS_:
+      continue
+    if hostname_error_func(THIS_NAME_) is not None:
+      VM_EXISTS_[THIS_NAME_] = False
+      continue
+    VM_EXISTS_[THIS_NAME_] = cached_name_func(NAME_CACHE_,
+                               hostname_dc_func(THIS_NAME_), THIS_NAME_)
+    if VM_EXISTS_[THIS_NAME_] is None:
+      PENDING_NAMES_[hostname_dc_func(THIS_NAME_)].append(THIS_NAME_)
+  PENDING_NAMES_ = {THIS_DC_: THIS_LIST_ for THIS_DC_, THIS_LIST_
+                    in PENDING_NAMES_.items() if THIS_LIST_}
   if ARGS_.d:
-    print('VSPHERE_TARGET_ is ' + VSPHERE_TARGET_)
-    # Connect to the vSphere
-    vsphere_connect_func()
-    # What I do with the connection depends on how tool was invoked
-    if ARGS_.c != '':
-      # Look for a specific host
-      (WAS_FOUND_, ALWAYS_ZERO_) = print_vm_info_func(ARGS_.c)
+    print('Names the cache can not answer: ' + str(PENDING_NAMES_))
+
+  # One session per vSphere that still has names to look up, all at
+  #   the same time
+  if PENDING_NAMES_:
+    import_vsphere_func()
+    with concurrent.futures.ThreadPoolExecutor(max_workers=len(PENDING_NAMES_)) as DC_POOL_:
+      DC_FUTURES_ = {THIS_DC_: DC_POOL_.submit(lookup_dc_func, THIS_DC_, THIS_LIST_)
+                     for THIS_DC_, THIS_LIST_ in PENDING_NAMES_.items()}
+      for THIS_DC_, THIS_LIST_ in PENDING_NAMES_.items():
+        (VM_MOREFS_, IS_COMPLETE_) = DC_FUTURES_[THIS_DC_].result()
+        store_names_func(NAME_CACHE_, THIS_DC_, VM_MOREFS_, IS_COMPLETE_)
+        for THIS_NAME_ in THIS_LIST_:
+          VM_EXISTS_[THIS_NAME_] = THIS_NAME_ in VM_MOREFS_
+
+  if ARGS_.c != '':
+    if ARGS_.d:
+      print('WAS_FOUND_ is ' + str(int(VM_EXISTS_[ARGS_.c])))
+    # Exit with an RC or "1" if I found the system,
+    #   or "0" otherwise
+    sys.exit(int(VM_EXISTS_[ARGS_.c]))
+  if QUERY_NAMES_:
+    sys.stdout.write('\n'.join([THIS_NAME_+'\t'+str(int(VM_EXISTS_[THIS_NAME_]))
+                                 for THIS_NAME_ in QUERY_NAMES_])+'\n')
+  sys.exit(0)
+
+# --diff and --from work only from snapshot files
+SNAPSHOT_TIME_ = None
+if (ARGS_.diff is not None) or (ARGS_.from_file != ''):
+  try:
+    if ARGS_.diff is not None:
+      (OLD_TIME_, OLD_RESULTS_) = read_snapshot_func(ARGS_.diff[0])
+      (SNAPSHOT_TIME_, DC_RESULTS_) = read_snapshot_func(ARGS_.diff[1])
+    else:
+      (SNAPSHOT_TIME_, DC_RESULTS_) = read_snapshot_func(ARGS_.from_file)
+  except (OSError, ValueError, KeyError, struct.error) as SNAPSHOT_ERROR_:
+    print(DESC_TEXT_+'\n\n\t'+ANSI_.BOLD_TEXT+ANSI_.MAGENTA_BLACK+
+          'FATAL ERROR: '+ANSI_.RED_BLACK+'Unable to read the snapshot ('+
+          str(SNAPSHOT_ERROR_)+')'+ANSI_.ALL_OFF+'\n')
+    sys.exit(255)
+  # Only the Data Centers that were asked for, and are in the snapshot
+  for THIS_DC_ in VSPHERE_LIST_:
+    if THIS_DC_ not in DC_RESULTS_:
+      print('\n\t\t'+ANSI_.BOLD_TEXT+ANSI_.YELLOW_BLACK+'Data Center '+THIS_DC_+
+            ' is not in the snapshot'+ANSI_.ALL_OFF)
+  VSPHERE_LIST_ = [THIS_DC_ for THIS_DC_ in VSPHERE_LIST_ if THIS_DC_ in DC_RESULTS_]
+
+if ARGS_.diff is not None:
+  print('\n\t\t'+ANSI_.BOLD_TEXT+'Changes from '+ANSI_.BLUE_BLACK+
+        time.strftime('%m-%d-%Y %H:%M', time.localtime(OLD_TIME_))+ANSI_.ALL_OFF+
+        ANSI_.BOLD_TEXT+' to '+ANSI_.BLUE_BLACK+
+        time.strftime('%m-%d-%Y %H:%M', time.localtime(SNAPSHOT_TIME_))+ANSI_.ALL_OFF)
+  for THIS_DC_ in VSPHERE_LIST_:
+    print('\n\t\t'+ANSI_.BOLD_TEXT+'Data Center: '+ANSI_.BLUE_BLACK+THIS_DC_+
+          ANSI_.ALL_OFF+'\n')
+    # A Data Center missing from the older snapshot appeared in full
+    (APPEARED_COUNT_, DISAPPEARED_COUNT_, CHANGED_COUNT_) = diff_snapshots_func(
+      OLD_RESULTS_.get(THIS_DC_, ({'name': [], 'moref': []}, 0))[0], DC_RESULTS_[THIS_DC_][0])
+    print('\n\t\t'+ANSI_.BOLD_TEXT+str(APPEARED_COUNT_)+' appeared, '+
+          str(DISAPPEARED_COUNT_)+' disappeared, '+str(CHANGED_COUNT_)+
+          ' changed'+ANSI_.ALL_OFF+'\n')
+  sys.exit(0)
+
+# Collect the VM tables from every vSphere before displaying anything;
+#   each vSphere is handled by its own worker, so the wait is that of
+#   the slowest one rather than the sum of all of them
+#   (a running daemon is asked first, unless --fields or --summary ask
+#   for more than it keeps; it answers without contacting the vSpheres
+#   at all)
+if SNAPSHOT_TIME_ is None:
+  DC_RESULTS_ = dict()
+# Host tables, by Data Center (--summary)
+DC_HOSTS_ = dict()
+COLLECT_LIST_ = []
+for THIS_DC_ in VSPHERE_LIST_:
+  if THIS_DC_ in DC_RESULTS_:
+    continue
+  START_TIME_ = time.time()
+  DAEMON_REPLY_ = None
+  if not (FIELD_LIST_ or ARGS_.summary):
+    DAEMON_REPLY_ = daemon_request_func({'op': 'table', 'dc': THIS_DC_})
+  if DAEMON_REPLY_ is not None:
+    DC_RESULTS_[THIS_DC_] = (DAEMON_REPLY_['table'], time.time() - START_TIME_)
+  else:
+    COLLECT_LIST_.append(THIS_DC_)
+if COLLECT_LIST_:
+  import_vsphere_func()
+  with concurrent.futures.ThreadPoolExecutor(max_workers=len(COLLECT_LIST_)) as DC_POOL_:
+    for THIS_DC_ in COLLECT_LIST_:
+      if ARGS_.summary:
+        DC_HOSTS_[THIS_DC_] = dict()
+    DC_FUTURES_ = {THIS_DC_: DC_POOL_.submit(collect_dc_func, THIS_DC_, LISTING_COLUMNS_,
+                                             DC_HOSTS_.get(THIS_DC_))
+                   for THIS_DC_ in COLLECT_LIST_}
+    for THIS_DC_ in COLLECT_LIST_:
+      DC_RESULTS_[THIS_DC_] = DC_FUTURES_[THIS_DC_].result()
       if ARGS_.d:
-        print('WAS_FOUND_ is ' + str(WAS_FOUND_))
-        # Exit with an RC or "1" if I found the system,
-        #   or "0" otherwise
-        sys.exit(WAS_FOUND_)
-      else:
-        # Print header
-        print('\n\t\t'+ANSI_.BOLD_TEXT+ANSI_.GREEN_BLACK+
-              '___VM_Name___\t__State__\t__Tools__\t\t__RAM(GB)__\t\t__CPU__\t\t__FT?__'
-              +ANSI_.ALL_OFF)
-
-        # Print the VM data
-        (THIS_DC_COUNT_, THIS_DC_SKIP_) = print_vm_info_func(ARGS_.c)
-        # Display count of VMs listed, and those skipped
-        print('\n\t\t'+ANSI_.BOLD_TEXT+str(THIS_DC_COUNT_)+
-              ' VMs in this DC'+ANSI_.ALL_OFF+' ('+str(THIS_DC_SKIP_)+
-              ' skipped)\n')
-      # End of if ARGS_.d
-    # End of if ARGS_.c != ''
-# End of for VSPHERE_TARGET_ in VSPHERE_LIST_
+        print(THIS_DC_ + ' collected in ' + '%.2f' % DC_RESULTS_[THIS_DC_][1] +
+              ' seconds')
+
+# Save what was collected, if asked to
+if ARGS_.save != '':
+  try:
+    write_snapshot_func(ARGS_.save, DC_RESULTS_)
+  except OSError as SNAPSHOT_ERROR_:
+    print(DESC_TEXT_+'\n\n\t'+ANSI_.BOLD_TEXT+ANSI_.MAGENTA_BLACK+
+          'FATAL ERROR: '+ANSI_.RED_BLACK+'Unable to write '+ANSI_.BLUE_BLACK+
+          ARGS_.save+ANSI_.RED_BLACK+' ('+str(SNAPSHOT_ERROR_)+')'+ANSI_.ALL_OFF+'\n')
+    sys.exit(255)
+
+# Cycle through the Data Centers in VSPHERE_LIST_ order, no matter
+#   which vSphere answered first
+for THIS_DC_ in VSPHERE_LIST_:
+  if ARGS_.d:
+    print('THIS_DC_ is ' + THIS_DC_)
+  (VM_TABLE_, DC_WALL_TIME_) = DC_RESULTS_[THIS_DC_]
+  # Print the header for this Data Center
+  print('\n\t\t'+ANSI_.BOLD_TEXT+'Data Center: '+ANSI_.BLUE_BLACK+THIS_DC_+
+        ANSI_.ALL_OFF)
+  # With --summary, the capacity replaces the list of VMs
+  if ARGS_.summary:
+    print_capacity_func(VM_TABLE_, DC_HOSTS_[THIS_DC_])
+    print('\n\t\t('+str(len(VM_TABLE_['name']))+' VMs; collected in '+
+          '%.2f' % DC_WALL_TIME_+' seconds)\n')
+    continue
+  print('\n\t\t'+ANSI_.BOLD_TEXT+ANSI_.GREEN_BLACK+
+        '___VM_Name___\t__State__\t__Tools__\t\t__RAM(GB)__\t\t__CPU__\t\t__FT?__'+
+        ''.join('\t\t__'+THIS_FIELD_+'__' for THIS_FIELD_ in FIELD_LIST_)+ANSI_.ALL_OFF)
+
+  # Print the VM data
+  (THIS_DC_COUNT_, THIS_DC_SKIP_) = print_vm_info_func(VM_TABLE_, FIELD_LIST_)
+  # Display count of VMs listed, and those skipped, and how long
+  #   the vSphere took (or when the snapshot was taken)
+  if SNAPSHOT_TIME_ is None:
+    DC_SOURCE_TEXT_ = 'collected in '+'%.2f' % DC_WALL_TIME_+' seconds'
+  else:
+    DC_SOURCE_TEXT_ = 'from the snapshot of '+time.strftime('%m-%d-%Y %H:%M',
+                                                             time.localtime(SNAPSHOT_TIME_))
+  print('\n\t\t'+ANSI_.BOLD_TEXT+str(THIS_DC_COUNT_)+
+        ' VMs in this DC'+ANSI_.ALL_OFF+' ('+str(THIS_DC_SKIP_)+
+        ' skipped; '+DC_SOURCE_TEXT_+')\n')
+# End of for THIS_DC_ in VSPHERE_LIST_
 
 if ARGS_.d:
   print('\nEXITING\n')